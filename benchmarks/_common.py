@@ -0,0 +1,94 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks run offline: embeddings come from a deterministic hashing
+embedder instead of the OpenAI API, and all storage lives in a temporary
+directory so the real knowledge base is never touched.
+
+Run a benchmark from the repository root, e.g.:
+    PYTHONPATH=src python -m benchmarks.bench_parent_storage
+"""
+
+import hashlib
+import math
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import List
+
+from knowledge_chat.config.settings import Settings
+from knowledge_chat.domain.interfaces.embedding_service import EmbeddingService
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SAMPLES_DIR = REPO_ROOT / "data" / "samples"
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class HashingEmbeddingService(EmbeddingService):
+    """Deterministic bag-of-words embedder used in place of the OpenAI API."""
+
+    def __init__(self, dimensions: int = 256) -> None:
+        """Initialize the embedder.
+
+        Args:
+            dimensions (int): Size of the produced vectors.
+        """
+        self.dimensions = dimensions
+        self.calls = 0
+        self.texts = 0
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Hash every word of each text into a fixed-size, L2-normalized vector."""
+        self.calls += 1
+        self.texts += len(texts)
+        vectors = []
+        for text in texts:
+            vector = [0.0] * self.dimensions
+            for word in _WORD_PATTERN.findall(text.lower()):
+                digest = hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest()
+                value = int.from_bytes(digest, "little")
+                vector[value % self.dimensions] += 1.0 if value & 1 << 63 else -1.0
+            norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+            vectors.append([v / norm for v in vector])
+        return vectors
+
+
+def make_settings(workdir: str, **overrides) -> Settings:
+    """Build Settings that keep every store inside ``workdir``."""
+    values = {
+        "openai_base_url": "http://localhost",
+        "openai_api_key": "benchmark",
+        "openai_model": "benchmark",
+        "openai_embedding_base_url": "http://localhost",
+        "openai_embedding_key": "benchmark",
+        "chroma_db_path": os.path.join(workdir, "chroma_db"),
+        "parent_store_path": os.path.join(workdir, "parent_store.sqlite3"),
+        "numpy_store_path": os.path.join(workdir, "numpy_store"),
+    }
+    values.update(overrides)
+    return Settings(**values)
+
+
+def sample_files(workdir: str, replicas: int = 1) -> List[str]:
+    """Copy the sample corpus into ``workdir`` ``replicas`` times.
+
+    Each copy gets a unique file name so every replica is a distinct source.
+    """
+    target = Path(workdir) / "corpus"
+    target.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for replica in range(replicas):
+        for path in sorted(SAMPLES_DIR.rglob("*")):
+            if path.is_file():
+                copy = target / f"r{replica}_{path.name}"
+                shutil.copyfile(path, copy)
+                paths.append(str(copy))
+    return paths
+
+
+def dir_size(path: str) -> int:
+    """Return the total size in bytes of every file under ``path``."""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(p.stat().st_size for p in Path(path).rglob("*") if p.is_file())
@@ -0,0 +1,119 @@
+"""Benchmark the semantic answer cache on repeated helpdesk questions.
+
+Imports the sample corpus, then asks single-turn questions drawn from a
+Zipf-like distribution over a few topics and their rephrasings, through
+ChatUseCase with an LLM of fixed latency, with and without
+SemanticAnswerCache. Halfway through, one file is imported again to show
+that answers are invalidated when the knowledge base changes.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_answer_cache --questions 200 --llm-latency 0.2
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+
+from benchmarks._common import (HashingEmbeddingService, make_settings,
+                                sample_files)
+from knowledge_chat.application.chat_use_case import ChatUseCase
+from knowledge_chat.application.import_files_use_case import ImportFilesUseCase
+from knowledge_chat.domain.entities.message import Message, MessageType
+from knowledge_chat.domain.interfaces.llm_service import LLMService
+from knowledge_chat.infrastructure.answer_cache.semantic_answer_cache import \
+    SemanticAnswerCache
+from knowledge_chat.infrastructure.chunking.recursive_character_chunker import \
+    RecursiveCharacterChunker
+from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
+    MultiFormatLoader
+from knowledge_chat.infrastructure.vector_store.chroma_vector_store import \
+    ChromaVectorStore
+
+QUESTIONS = [
+    ["how do I reset my password", "How do I reset my password?", "how do i reset my password please"],
+    ["VPN không kết nối được", "vpn không kết nối được!", "VPN KHÔNG KẾT NỐI ĐƯỢC"],
+    ["printer is not printing", "Printer is not printing.", "my printer is not printing"],
+    ["no internet connection", "No internet connection?", "no internet connection at all"],
+    ["computer won't start", "Computer won't start!", "my computer won't start"],
+]
+
+
+class SlowLLMService(LLMService):
+    """LLM stand-in that answers after a fixed delay."""
+
+    def __init__(self, latency: float) -> None:
+        self._latency = latency
+        self.calls = 0
+
+    def generate(self, prompt: str) -> str:
+        """Select the first document when filtering, else return a canned answer."""
+        time.sleep(self._latency)
+        self.calls += 1
+        return "[0]" if "JSON" in prompt else "Canned answer."
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=200)
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--max-distance", type=float, default=0.05)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        settings = make_settings(workdir)
+        embedding_service = HashingEmbeddingService()
+        vector_store = ChromaVectorStore(settings)
+        import_use_case = ImportFilesUseCase(
+            document_loader=MultiFormatLoader(),
+            chunker=RecursiveCharacterChunker(),
+            embedding_service=embedding_service,
+            vector_store=vector_store,
+        )
+        paths = sample_files(workdir)
+        import_use_case.invoke(paths)
+        changed = next(path for path in paths if path.endswith(".txt"))
+
+        rng = random.Random(0)
+        questions = []
+        for _ in range(args.questions):
+            topic = min(int(rng.paretovariate(1.2)) - 1, len(QUESTIONS) - 1)
+            questions.append(rng.choice(QUESTIONS[topic]))
+
+        print(f"questions: {len(questions)}, LLM latency: {args.llm_latency * 1000:.0f} ms")
+        print(f"{'mode':<8}{'seconds':>9}{'LLM calls':>11}{'hit rate':>10}{'mean ms':>9}{'p50 ms':>9}{'invalidated':>13}")
+        for mode in ("direct", "cached"):
+            llm_service = SlowLLMService(args.llm_latency)
+            cache = SemanticAnswerCache(max_distance=args.max_distance) if mode == "cached" else None
+            chat_use_case = ChatUseCase(
+                embedding_service=embedding_service,
+                vector_store=vector_store,
+                llm_service=llm_service,
+                answer_cache=cache,
+            )
+            latencies = []
+            start = time.perf_counter()
+            for i, question in enumerate(questions):
+                if i == len(questions) // 2:
+                    # A changed file makes every cached answer stale.
+                    with open(changed, "a", encoding="utf-8") as f:
+                        f.write(f"\nUpdated {mode}.\n")
+                    import_use_case.invoke([changed], incremental=True, prune_missing=False)
+                asked = time.perf_counter()
+                chat_use_case.invoke([Message(type=MessageType.USER, content=question)])
+                latencies.append(time.perf_counter() - asked)
+            elapsed = time.perf_counter() - start
+            stats = cache.stats() if cache is not None else None
+            print(
+                f"{mode:<8}{elapsed:>9.2f}{llm_service.calls:>11}"
+                f"{stats.hit_rate if stats else 0.0:>10.1%}"
+                f"{statistics.mean(latencies) * 1000:>9.1f}"
+                f"{statistics.median(latencies) * 1000:>9.1f}"
+                f"{stats.invalidations if stats else 0:>13}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark FastRecursiveChunker against the LangChain-based chunker.
+
+Loads the ``data/samples`` corpus, replicates its documents N times and
+measures chunking throughput of RecursiveCharacterChunker and
+FastRecursiveChunker with character sizing, both splitters with token
+sizing, and FastRecursiveChunker.chunk_many on process pools. Character
+mode output of both chunkers is checked to be identical.
+
+Without ``--tokenizer`` a small WordPiece tokenizer is trained on the
+corpus so the benchmark runs offline; pass a ``tokenizer.json`` path or a
+Hugging Face model name to measure with the embedding model's tokenizer.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_chunkers --replicas 20 --workers 2 4
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable, List
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from tokenizers import Tokenizer, models, normalizers, pre_tokenizers, trainers
+
+from benchmarks._common import sample_files
+from knowledge_chat.infrastructure.chunking.fast_recursive_chunker import (
+    FastRecursiveChunker, load_tokenizer)
+from knowledge_chat.infrastructure.chunking.recursive_character_chunker import \
+    RecursiveCharacterChunker
+from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
+    MultiFormatLoader
+
+
+def load_texts(workdir: str) -> List[str]:
+    """Return the page texts of every sample document."""
+    loader = MultiFormatLoader()
+    texts = []
+    for result in loader.load_many(sample_files(workdir)):
+        texts.extend(doc.page_content for doc in result.documents)
+    return texts
+
+
+def train_tokenizer(texts: List[str], path: str) -> str:
+    """Train a small WordPiece tokenizer on ``texts`` and save it to ``path``."""
+    tokenizer = Tokenizer(models.WordPiece(unk_token="[UNK]"))
+    tokenizer.normalizer = normalizers.NFKC()
+    tokenizer.pre_tokenizer = pre_tokenizers.BertPreTokenizer()
+    tokenizer.train_from_iterator(
+        texts, trainers.WordPieceTrainer(vocab_size=8000, special_tokens=["[UNK]"])
+    )
+    tokenizer.save(path)
+    return path
+
+
+def run(chunk: Callable[[List[str]], List[List[str]]], texts: List[str]) -> tuple[float, int]:
+    """Chunk ``texts`` and return (seconds, chunks)."""
+    start = time.perf_counter()
+    chunks = chunk(texts)
+    return time.perf_counter() - start, sum(len(c) for c in chunks)
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replicas", type=int, default=10)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--chunk-overlap", type=int, default=200)
+    parser.add_argument("--token-chunk-size", type=int, default=256)
+    parser.add_argument("--token-chunk-overlap", type=int, default=32)
+    parser.add_argument("--tokenizer", default="")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus = load_texts(workdir)
+        tokenizer_path = args.tokenizer or train_tokenizer(
+            corpus, os.path.join(workdir, "tokenizer.json")
+        )
+        texts = corpus * args.replicas
+        megabytes = sum(len(text.encode("utf-8")) for text in texts) / 1e6
+        print(f"documents: {len(texts)}, size: {megabytes:.1f} MB")
+
+        langchain = RecursiveCharacterChunker(args.chunk_size, args.chunk_overlap)
+        fast = FastRecursiveChunker(args.chunk_size, args.chunk_overlap)
+        identical = all(langchain.chunk_text(text) == fast.chunk_text(text) for text in corpus)
+        print(f"character mode output identical: {identical}")
+
+        tokenizer = load_tokenizer(tokenizer_path)
+        langchain_tokens = RecursiveCharacterTextSplitter(
+            chunk_size=args.token_chunk_size,
+            chunk_overlap=args.token_chunk_overlap,
+            separators=["\n\n", "\n", ".", " ", ""],
+            length_function=lambda text: len(
+                tokenizer.encode(text, add_special_tokens=False).ids
+            ),
+        )
+        fast_tokens = FastRecursiveChunker(
+            args.token_chunk_size, args.token_chunk_overlap, tokenizer=tokenizer_path
+        )
+
+        cases = [
+            ("langchain chars", lambda t: [langchain.chunk_text(x) for x in t]),
+            ("fast chars", lambda t: [fast.chunk_text(x) for x in t]),
+            ("langchain tokens", lambda t: [langchain_tokens.split_text(x) for x in t]),
+            ("fast tokens", lambda t: [fast_tokens.chunk_text(x) for x in t]),
+        ]
+        pools = []
+        for workers in args.workers:
+            parallel = FastRecursiveChunker(
+                args.token_chunk_size,
+                args.token_chunk_overlap,
+                tokenizer=tokenizer_path,
+                max_workers=workers,
+            )
+            # Start the pool outside the timed section.
+            parallel.chunk_many(texts[:workers])
+            cases.append((f"fast tokens x{workers}", parallel.chunk_many))
+            pools.append(parallel)
+
+        print(f"{'chunker':<20}{'seconds':>9}{'MB/s':>8}{'docs/s':>9}{'chunks':>9}{'speedup':>9}")
+        baselines = {}
+        for name, chunk in cases:
+            elapsed, chunks = run(chunk, texts)
+            mode = "tokens" if "tokens" in name else "chars"
+            baseline = baselines.setdefault(mode, elapsed)
+            print(
+                f"{name:<20}{elapsed:>9.2f}{megabytes / elapsed:>8.1f}"
+                f"{len(texts) / elapsed:>9.0f}{chunks:>9}{baseline / elapsed:>9.2f}"
+            )
+        for parallel in pools:
+            parallel.close()
+
+
+if __name__ == "__main__":
+    main()
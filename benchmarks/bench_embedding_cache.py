@@ -0,0 +1,96 @@
+"""Benchmark the persistent embedding cache.
+
+Imports the sample corpus through CachedEmbeddingService and counts how
+many texts actually reach the underlying embedding service in common
+scenarios: a cold import, an unchanged full re-import, a re-import after
+editing one file, and a burst of repeated chat questions.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_embedding_cache --replicas 3
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks._common import (HashingEmbeddingService, make_settings,
+                                sample_files)
+from knowledge_chat.application.import_files_use_case import ImportFilesUseCase
+from knowledge_chat.infrastructure.chunking.recursive_character_chunker import \
+    RecursiveCharacterChunker
+from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
+    MultiFormatLoader
+from knowledge_chat.infrastructure.embedding_service.cached_embedding_service import \
+    CachedEmbeddingService
+from knowledge_chat.infrastructure.vector_store.chroma_vector_store import \
+    ChromaVectorStore
+
+QUESTIONS = [
+    "How do I fix a Windows blue screen error?",
+    "VPN không kết nối được",
+    "Outlook keeps asking for my password",
+]
+
+
+def main() -> None:
+    """Run the benchmark and print one row per scenario."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replicas", type=int, default=3)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        paths = sample_files(workdir, args.replicas)
+        settings = make_settings(workdir)
+        backend = HashingEmbeddingService()
+        cache = CachedEmbeddingService(
+            embedding_service=backend,
+            model="hashing-256",
+            cache_path=os.path.join(workdir, "embedding_cache.sqlite3"),
+        )
+        use_case = ImportFilesUseCase(
+            document_loader=MultiFormatLoader(),
+            chunker=RecursiveCharacterChunker(),
+            embedding_service=cache,
+            vector_store=ChromaVectorStore(settings=settings),
+        )
+
+        def edit_one_file() -> None:
+            text_path = next(path for path in paths if path.endswith(".txt"))
+            with open(text_path, "a", encoding="utf-8") as f:
+                f.write("\n\nAppended troubleshooting note.\n")
+
+        def ask_questions() -> None:
+            for _ in range(args.repeats):
+                for question in QUESTIONS:
+                    cache.embed_texts([question])
+
+        scenarios = [
+            ("cold import", lambda: use_case.invoke(paths)),
+            ("re-import, unchanged", lambda: use_case.invoke(paths)),
+            ("re-import, one file edited", lambda: (edit_one_file(), use_case.invoke(paths))),
+            (f"{len(QUESTIONS)} questions x{args.repeats}", ask_questions),
+        ]
+
+        print(f"files: {len(paths)}")
+        print(f"{'scenario':<28}{'seconds':>9}{'texts':>8}{'embedded':>10}{'hit rate':>10}")
+        for name, scenario in scenarios:
+            before_texts, before = backend.texts, cache.stats()
+            start = time.perf_counter()
+            scenario()
+            elapsed = time.perf_counter() - start
+            after = cache.stats()
+            hits = after.hits - before.hits
+            misses = after.misses - before.misses
+            print(
+                f"{name:<28}{elapsed:>9.2f}{hits + misses:>8}"
+                f"{backend.texts - before_texts:>10}{hits / max(1, hits + misses):>10.1%}"
+            )
+
+        stats = cache.stats()
+        print(f"cache entries: {stats.entries}, size: {stats.size_bytes / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark concurrent, rate-limited embedding requests.
+
+Replaces the OpenAI client of OpenAIEmbeddingService with a simulated
+endpoint that has a fixed per-request latency and answers 429 to a
+fraction of the requests, then embeds the chunks of the sample corpus at
+several concurrency levels. Throughput grows with concurrency until the
+configured tokens-per-minute limit becomes the bottleneck.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_embedding_concurrency --concurrency 1 2 4 8
+"""
+
+import argparse
+import random
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import openai
+
+from benchmarks._common import (HashingEmbeddingService, make_settings,
+                                sample_files)
+from knowledge_chat.infrastructure.chunking.recursive_character_chunker import \
+    RecursiveCharacterChunker
+from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
+    MultiFormatLoader
+from knowledge_chat.infrastructure.embedding_service.openai_embedding_service import \
+    OpenAIEmbeddingService
+
+
+class SimulatedEmbeddings:
+    """Stand-in for ``client.embeddings`` with latency and random 429s."""
+
+    def __init__(self, latency: float, error_rate: float) -> None:
+        self._latency = latency
+        self._error_rate = error_rate
+        self._embedder = HashingEmbeddingService(dimensions=64)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.rate_limited = 0
+
+    def create(self, model: str, input: list) -> SimpleNamespace:  # pylint: disable=redefined-builtin
+        """Return embeddings after ``latency`` seconds, or raise a 429."""
+        time.sleep(self._latency)
+        with self._lock:
+            self.requests += 1
+            if random.random() < self._error_rate:
+                self.rate_limited += 1
+                request = httpx.Request("POST", "http://localhost/embeddings")
+                response = httpx.Response(429, request=request, headers={"retry-after": "0.05"})
+                raise openai.RateLimitError("rate limited", response=response, body=None)
+        vectors = self._embedder.embed_texts(input)
+        return SimpleNamespace(
+            data=[SimpleNamespace(index=i, embedding=v) for i, v in enumerate(vectors)]
+        )
+
+
+def main() -> None:
+    """Run the benchmark and print one row per concurrency level."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replicas", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--tokens-per-minute", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        loader = MultiFormatLoader()
+        chunker = RecursiveCharacterChunker()
+        chunks = [
+            chunk
+            for path in sample_files(workdir, args.replicas)
+            for doc in loader.load(path)
+            for chunk in chunker.chunk_text(doc.page_content)
+        ]
+        print(f"chunks: {len(chunks)}, tokens/min limit: {args.tokens_per_minute}")
+        print(f"{'concurrency':>12}{'seconds':>10}{'chunks/s':>10}{'requests':>10}{'429s':>7}")
+
+        for concurrency in args.concurrency:
+            settings = make_settings(
+                workdir,
+                openai_embedding_concurrency=concurrency,
+                openai_embedding_batch_tokens=2048,
+                openai_embedding_tokens_per_minute=args.tokens_per_minute,
+            )
+            service = OpenAIEmbeddingService(settings=settings)
+            endpoint = SimulatedEmbeddings(args.latency, args.error_rate)
+            service.client = SimpleNamespace(embeddings=endpoint)
+
+            start = time.perf_counter()
+            vectors = service.embed_texts(chunks)
+            elapsed = time.perf_counter() - start
+            service.close()
+
+            assert len(vectors) == len(chunks)
+            print(
+                f"{concurrency:>12}{elapsed:>10.2f}{len(chunks) / elapsed:>10.0f}"
+                f"{endpoint.requests:>10}{endpoint.rate_limited:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Benchmark retrieval quality and cost at several embedding dimensions.
+
+For every dimension the sample corpus (copied ``--replicas`` times) is
+imported into a fresh vector store, then a labeled set of helpdesk
+questions is asked. A question counts as answered when one of its top-k
+chunks contains the phrase it is labeled with. The benchmark reports the
+index size on disk, the query latency and the recall@k.
+
+Offline, the hashing embedder produces vectors of each size. With
+``--openai`` the configured embedding model is called with
+``openai_embedding_dimensions`` set to each size, so the credentials in
+the environment or ``.env`` are used and the import is billed.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_embedding_dimensions --dims 1536 512 256 --replicas 20
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks._common import (HashingEmbeddingService, dir_size,
+                                make_settings, sample_files)
+from knowledge_chat.application.import_files_use_case import ImportFilesUseCase
+from knowledge_chat.config.settings import Settings
+from knowledge_chat.domain.interfaces.embedding_service import EmbeddingService
+from knowledge_chat.infrastructure.chunking.recursive_character_chunker import \
+    RecursiveCharacterChunker
+from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
+    MultiFormatLoader
+from knowledge_chat.infrastructure.embedding_service.openai_embedding_service import \
+    OpenAIEmbeddingService
+from knowledge_chat.infrastructure.vector_store.chroma_vector_store import \
+    ChromaVectorStore
+from knowledge_chat.infrastructure.vector_store.numpy_vector_store import \
+    NumPyVectorStore
+
+# Questions and a phrase that only the chunks answering them contain.
+LABELED_QUESTIONS = [
+    ("How should I follow the 3-2-1 backup rule?", "3-2-1"),
+    ("Outlook keeps crashing when I open it", "Outlook won't open"),
+    ("My emails are stuck in the Outbox", "stuck in Outbox"),
+    ("Searching in Gmail does not find anything", "Gmail search not working"),
+    ("My computer won't power on", "won't power on"),
+    ("The laptop gets very hot and shuts down", "overheating"),
+    ("My phone battery drains too quickly", "Battery draining quickly"),
+    ("Google Play Store is not working", "Google Play Store not working"),
+    ("Windows says No Internet Access", "Limited Connectivity"),
+    ("Why is my internet so slow?", "slow internet"),
+    ("How do I remove malware from my PC?", "remove malware"),
+    ("Máy tính bị quá nhiệt phải làm sao?", "quá nhiệt"),
+    ("Pin điện thoại tụt nhanh", "Pin tụt nhanh"),
+    ("Email bị kẹt trong Outbox", "kẹt trong Outbox"),
+    ("Điện thoại không kết nối WiFi", "Không kết nối WiFi"),
+]
+
+
+def store_settings(workdir: str, dimensions: int, args: argparse.Namespace) -> Settings:
+    """Build settings keeping the stores in ``workdir``."""
+    if not args.openai:
+        return make_settings(workdir)
+    return Settings(
+        chroma_db_path=os.path.join(workdir, "chroma_db"),
+        numpy_store_path=os.path.join(workdir, "numpy_store"),
+        parent_store_path=os.path.join(workdir, "parent_store.sqlite3"),
+        openai_embedding_dimensions=dimensions,
+    )
+
+
+def bench_dimension(dimensions: int, args: argparse.Namespace) -> str:
+    """Import the corpus at one dimension and return a table row."""
+    with tempfile.TemporaryDirectory() as workdir:
+        settings = store_settings(workdir, dimensions, args)
+        embedding_service: EmbeddingService = (
+            OpenAIEmbeddingService(settings) if args.openai else HashingEmbeddingService(dimensions)
+        )
+        if args.backend == "numpy":
+            vector_store = NumPyVectorStore(settings)
+            store_path = settings.numpy_store_path
+        else:
+            vector_store = ChromaVectorStore(settings)
+            store_path = settings.chroma_db_path
+
+        started = time.perf_counter()
+        ImportFilesUseCase(
+            document_loader=MultiFormatLoader(),
+            chunker=RecursiveCharacterChunker(),
+            embedding_service=embedding_service,
+            vector_store=vector_store,
+        ).invoke(sample_files(workdir, args.replicas))
+        import_seconds = time.perf_counter() - started
+        chunks = sum(len(batch["ids"]) for batch in vector_store.iter_documents())
+
+        questions = [question for question, _ in LABELED_QUESTIONS]
+        embeddings = embedding_service.embed_texts(questions)
+        latencies = []
+        found = 0
+        for _ in range(args.rounds):
+            for embedding, (_, phrase) in zip(embeddings, LABELED_QUESTIONS):
+                asked = time.perf_counter()
+                result = vector_store.query_similar(embedding, top_k=args.top_k)
+                latencies.append(time.perf_counter() - asked)
+                found += any(phrase.lower() in document.lower() for document in result["documents"][0])
+        cuts = statistics.quantiles(latencies, n=100)
+        return (
+            f"{vector_store.embedding_dimension():>6}{chunks:>8}{import_seconds:>10.2f}"
+            f"{dir_size(store_path) / 2**20:>9.1f}{cuts[49] * 1000:>9.2f}{cuts[94] * 1000:>9.2f}"
+            f"{found / len(latencies):>10.3f}"
+        )
+
+
+def main() -> None:
+    """Rebuild the index at every dimension and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dims", type=int, nargs="+", default=[1536, 1024, 512, 256, 128])
+    parser.add_argument("--backend", choices=["chroma", "numpy"], default="chroma")
+    parser.add_argument("--replicas", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--openai", action="store_true")
+    args = parser.parse_args()
+
+    print(
+        f"{'dim':>6}{'chunks':>8}{'import s':>10}{'MB':>9}{'p50 ms':>9}{'p95 ms':>9}"
+        f"{'recall@' + str(args.top_k):>10}"
+    )
+    for dimensions in args.dims:
+        print(bench_dimension(dimensions, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Benchmark the BM25 lexical index and hybrid retrieval.
+
+First, a synthetic corpus is indexed in import-sized batches. Its chunks
+are drawn from the word frequencies of the sample corpus (English and
+Vietnamese), and every tenth chunk carries a random Windows error code.
+The benchmark reports indexing throughput, index size and the latency of
+queries made of common words alone and with an error code appended.
+
+Second, the sample corpus is imported and every error code that occurs
+in it is asked as a question. For each code it reports the best rank of
+a chunk containing the code, with vector search alone and with vector
+search fused with the lexical index.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_lexical_index --docs 1000000
+"""
+
+import argparse
+import os
+import random
+import re
+import statistics
+import tempfile
+import time
+from collections import Counter
+
+from benchmarks._common import (SAMPLES_DIR, HashingEmbeddingService, dir_size,
+                                make_settings, sample_files)
+from knowledge_chat.application.chat_use_case import ChatUseCase
+from knowledge_chat.application.import_files_use_case import ImportFilesUseCase
+from knowledge_chat.domain.interfaces.llm_service import LLMService
+from knowledge_chat.infrastructure.chunking.recursive_character_chunker import \
+    RecursiveCharacterChunker
+from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
+    MultiFormatLoader
+from knowledge_chat.infrastructure.lexical_index.sqlite_bm25_index import \
+    SQLiteBM25Index
+from knowledge_chat.infrastructure.lexical_index.vietnamese_tokenizer import \
+    tokenize
+from knowledge_chat.infrastructure.vector_store.chroma_vector_store import \
+    ChromaVectorStore
+
+_ERROR_CODE_PATTERN = re.compile(r"0x[0-9A-Fa-f]{8}")
+
+
+class UnusedLLMService(LLMService):
+    """LLM stand-in; retrieval alone is measured."""
+
+    def generate(self, prompt: str) -> str:
+        """Never called by the benchmark."""
+        raise NotImplementedError
+
+
+def sample_vocabulary() -> Counter:
+    """Count the words of every text file of the sample corpus."""
+    words: Counter = Counter()
+    for root, _, files in os.walk(SAMPLES_DIR):
+        for name in files:
+            if name.endswith((".txt", ".md", ".json")):
+                with open(os.path.join(root, name), encoding="utf-8") as f:
+                    words.update(tokenize(f.read()))
+    return words
+
+
+def bench_scale(args: argparse.Namespace, workdir: str) -> None:
+    """Index a synthetic corpus and time queries against it."""
+    vocabulary = sample_vocabulary()
+    words, weights = list(vocabulary), list(vocabulary.values())
+    rng = random.Random(0)
+    codes = [f"0x{rng.getrandbits(32):08X}" for _ in range(max(1, args.docs // 100))]
+
+    settings = make_settings(workdir, lexical_index_path=os.path.join(workdir, "lexical.sqlite3"))
+    index = SQLiteBM25Index(settings)
+    started = time.perf_counter()
+    for start in range(0, args.docs, args.batch_size):
+        count = min(args.batch_size, args.docs - start)
+        texts = []
+        for i in range(start, start + count):
+            text = " ".join(rng.choices(words, weights, k=args.words))
+            if i % 10 == 0:
+                text += f" error {codes[i // 10 % len(codes)]}"
+            texts.append(text)
+        index.add_documents([f"doc-{i}" for i in range(start, start + count)], texts)
+    build_seconds = time.perf_counter() - started
+
+    common = [word for word, _ in vocabulary.most_common(200)]
+    queries = {"common words": [], "words + code": []}
+    for _ in range(args.queries):
+        query = " ".join(rng.choices(common, k=rng.randint(2, 5)))
+        queries["common words"].append(query)
+        queries["words + code"].append(f"{query} {rng.choice(codes)}")
+
+    print(f"{'docs':>9}{'index/s':>9}{'MB':>8}{'segments':>10}")
+    print(
+        f"{args.docs:>9}{args.docs / build_seconds:>9.0f}"
+        f"{dir_size(workdir) / 2**20:>8.1f}{len(index._segment_sizes):>10}"
+    )
+    print(f"\n{'queries':<14}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for kind, texts in queries.items():
+        for query in texts[:10]:
+            index.search(query, top_k=args.top_k)
+        latencies = []
+        for query in texts:
+            asked = time.perf_counter()
+            index.search(query, top_k=args.top_k)
+            latencies.append(time.perf_counter() - asked)
+        cuts = statistics.quantiles(latencies, n=100)
+        print(f"{kind:<14}{cuts[49] * 1000:>9.2f}{cuts[94] * 1000:>9.2f}{cuts[98] * 1000:>9.2f}")
+
+
+def bench_error_codes(workdir: str) -> None:
+    """Compare the rank of error-code chunks with and without fusion."""
+    settings = make_settings(workdir, lexical_index_path=os.path.join(workdir, "lexical.sqlite3"))
+    embedding_service = HashingEmbeddingService()
+    vector_store = ChromaVectorStore(settings)
+    index = SQLiteBM25Index(settings)
+    ImportFilesUseCase(
+        document_loader=MultiFormatLoader(),
+        chunker=RecursiveCharacterChunker(),
+        embedding_service=embedding_service,
+        vector_store=vector_store,
+        lexical_index=index,
+    ).invoke(sample_files(workdir))
+
+    codes = sorted(
+        {
+            code
+            for batch in vector_store.iter_documents()
+            for document in batch["documents"]
+            for code in _ERROR_CODE_PATTERN.findall(document)
+        }
+    )
+    modes = {
+        "vector": ChatUseCase(embedding_service, vector_store, UnusedLLMService()),
+        "hybrid": ChatUseCase(
+            embedding_service, vector_store, UnusedLLMService(), lexical_index=index
+        ),
+    }
+    print(f"\n{'question':<32}" + "".join(f"{mode + ' rank':>13}" for mode in modes))
+    for code in codes:
+        question = f"How do I fix error {code}?"
+        embedding = embedding_service.embed_texts([question])[0]
+        ranks = []
+        for chat_use_case in modes.values():
+            # pylint: disable=protected-access
+            results = chat_use_case._retrieve(question, embedding, top_k=10)
+            hits = [i + 1 for i, document in enumerate(results["documents"][0]) if code in document]
+            ranks.append(str(hits[0]) if hits else "-")
+        print(f"{question:<32}" + "".join(f"{rank:>13}" for rank in ranks))
+
+
+def main() -> None:
+    """Run both benchmarks and print their tables."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--words", type=int, default=120)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--top-k", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        bench_scale(args, workdir)
+    with tempfile.TemporaryDirectory() as workdir:
+        bench_error_codes(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark parallel document loading with MultiFormatLoader.load_many.
+
+Replicates the ``data/samples`` corpus N times and measures how long it
+takes to load every file sequentially and on process pools of several
+sizes.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_load_many --replicas 20 --workers 1 2 4 8
+"""
+
+import argparse
+import tempfile
+import time
+
+from benchmarks._common import sample_files
+from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
+    MultiFormatLoader
+
+
+def run(paths, workers: int) -> tuple[float, int, int]:
+    """Load ``paths`` and return (seconds, documents, failures)."""
+    loader = MultiFormatLoader(max_workers=workers)
+    if workers > 1:
+        # Start the pool outside the timed section.
+        list(loader.load_many(paths[:workers]))
+    start = time.perf_counter()
+    documents = failures = 0
+    for result in loader.load_many(paths):
+        # Errors surface either as ``error`` or from the lazy ``documents``.
+        if result.error is not None:
+            failures += 1
+            continue
+        try:
+            for _ in result.documents:
+                documents += 1
+        # pylint: disable=broad-exception-caught
+        except Exception:
+            failures += 1
+    elapsed = time.perf_counter() - start
+    loader.close()
+    return elapsed, documents, failures
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replicas", type=int, default=10)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        paths = sample_files(workdir, args.replicas)
+        print(f"files: {len(paths)}")
+        print(f"{'workers':>8}{'seconds':>10}{'files/s':>10}{'speedup':>10}{'docs':>8}{'errors':>8}")
+        baseline = None
+        for workers in args.workers:
+            elapsed, documents, failures = run(paths, workers)
+            baseline = baseline or elapsed
+            print(
+                f"{workers:>8}{elapsed:>10.2f}{len(paths) / elapsed:>10.1f}"
+                f"{baseline / elapsed:>10.2f}{documents:>8}{failures:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark storage size and rerank prompt size for chunk/parent storage.
+
+Compares the legacy layout, where every chunk record stores the whole page
+text, with the chunk/parent layout, where records store only their chunk
+and the page is stored once in the parent document store. Also runs the
+migration on a copy of the legacy collection.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_parent_storage --replicas 5
+"""
+
+import argparse
+import tempfile
+import uuid
+
+from benchmarks._common import (HashingEmbeddingService, dir_size,
+                                make_settings, sample_files)
+from knowledge_chat.application.import_files_use_case import ImportFilesUseCase
+from knowledge_chat.application.migrate_parent_storage_use_case import \
+    MigrateParentStorageUseCase
+from knowledge_chat.config.prompts import RERANK_FILTER_PROMPT_TEMPLATE
+from knowledge_chat.infrastructure.chunking.recursive_character_chunker import \
+    RecursiveCharacterChunker
+from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
+    MultiFormatLoader
+from knowledge_chat.infrastructure.document_store.sqlite_parent_document_store import \
+    SQLiteParentDocumentStore
+from knowledge_chat.infrastructure.vector_store.chroma_vector_store import \
+    ChromaVectorStore
+
+QUERIES = [
+    "How do I fix a Windows blue screen error?",
+    "VPN không kết nối được",
+    "Outlook keeps asking for my password",
+    "How to restore files from backup?",
+    "Laptop overheating and fan noise",
+]
+
+
+def import_legacy(paths, loader, chunker, embedder, store) -> None:
+    """Reproduce the old import, which stored the page text on every chunk."""
+    for path in paths:
+        for doc in loader.load(path):
+            chunks = chunker.chunk_text(doc.page_content)
+            if not chunks:
+                continue
+            store.add_documents(
+                ids=[str(uuid.uuid4()) for _ in chunks],
+                embeddings=embedder.embed_texts(chunks),
+                documents=[doc.page_content] * len(chunks),
+                metadatas=[
+                    {"source": doc.metadata["source"], "chunk_index": i}
+                    for i in range(len(chunks))
+                ],
+            )
+
+
+def rerank_prompt_chars(store, embedder, top_k: int) -> int:
+    """Return the total size of the rerank prompts sent for ``QUERIES``."""
+    total = 0
+    for query in QUERIES:
+        docs = store.query_similar(embedder.embed_texts([query])[0], top_k=top_k)["documents"][0]
+        formatted = "\n\n".join(f"[{i}] {chunk}" for i, chunk in enumerate(docs))
+        total += len(RERANK_FILTER_PROMPT_TEMPLATE.format(query=query, documents=formatted))
+    return total
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replicas", type=int, default=3)
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        paths = sample_files(workdir, args.replicas)
+        loader = MultiFormatLoader()
+        chunker = RecursiveCharacterChunker()
+        embedder = HashingEmbeddingService()
+
+        legacy_settings = make_settings(f"{workdir}/legacy")
+        legacy_store = ChromaVectorStore(legacy_settings)
+        import_legacy(paths, loader, chunker, embedder, legacy_store)
+
+        parent_settings = make_settings(f"{workdir}/parent")
+        parent_store = SQLiteParentDocumentStore(parent_settings)
+        new_store = ChromaVectorStore(parent_settings)
+        ImportFilesUseCase(loader, chunker, embedder, new_store, parent_store).invoke(paths)
+
+        legacy_bytes = dir_size(legacy_settings.chroma_db_path)
+        new_bytes = dir_size(parent_settings.chroma_db_path) + dir_size(
+            parent_settings.parent_store_path
+        )
+        legacy_prompt = rerank_prompt_chars(legacy_store, embedder, args.top_k)
+        new_prompt = rerank_prompt_chars(new_store, embedder, args.top_k)
+
+        migrated_store = SQLiteParentDocumentStore(
+            make_settings(f"{workdir}/legacy", parent_store_path=f"{workdir}/migrated.sqlite3")
+        )
+        migrated = MigrateParentStorageUseCase(chunker, legacy_store, migrated_store).invoke()
+        migrated_prompt = rerank_prompt_chars(legacy_store, embedder, args.top_k)
+
+    print(f"files: {len(paths)}  queries: {len(QUERIES)}  top_k: {args.top_k}")
+    print(f"{'layout':<16}{'storage (KiB)':>16}{'rerank chars':>16}{'~rerank tokens':>16}")
+    for name, size, chars in (
+        ("legacy", legacy_bytes, legacy_prompt),
+        ("chunk/parent", new_bytes, new_prompt),
+    ):
+        print(f"{name:<16}{size / 1024:>16.1f}{chars:>16}{chars // 4:>16}")
+    print(f"migrated {migrated} legacy record(s); rerank chars after migration: {migrated_prompt}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark the pypdf and pymupdf PDF extraction backends.
+
+Each backend runs in a fresh process that streams every page of the PDFs
+in ``data/samples/pdf`` (repeated ``--repeat`` times) and reports pages
+per second and the growth of peak RSS while loading.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_pdf_backends --repeat 20
+"""
+
+import argparse
+import multiprocessing
+import resource
+import time
+
+from benchmarks._common import SAMPLES_DIR
+
+BACKENDS = ["pypdf", "pymupdf"]
+
+
+def measure(backend: str, repeat: int, pdf_workers: int, results) -> None:
+    """Stream every sample page with ``backend`` and report timings."""
+    # pylint: disable=import-outside-toplevel
+    from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
+        MultiFormatLoader
+
+    loader = MultiFormatLoader(
+        pdf_backend=backend,
+        pdf_max_workers=pdf_workers,
+        pdf_parallel_min_pages=1,
+    )
+    paths = sorted(str(p) for p in (SAMPLES_DIR / "pdf").glob("*.pdf")) * repeat
+
+    baseline_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    pages = chars = 0
+    for path in paths:
+        for doc in loader.lazy_load(path):
+            pages += 1
+            chars += len(doc.page_content)
+    elapsed = time.perf_counter() - start
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    loader.close()
+    results.put((backend, pages, chars, elapsed, peak_kib - baseline_kib))
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--pdf-workers", type=int, default=1)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    print(f"{'backend':<10}{'pages':>8}{'chars':>10}{'seconds':>10}{'pages/s':>10}{'peak RSS +MiB':>15}")
+    for backend in BACKENDS:
+        process = context.Process(
+            target=measure, args=(backend, args.repeat, args.pdf_workers, results)
+        )
+        process.start()
+        name, pages, chars, elapsed, rss_kib = results.get()
+        process.join()
+        print(
+            f"{name:<10}{pages:>8}{chars:>10}{elapsed:>10.2f}"
+            f"{pages / elapsed:>10.1f}{rss_kib / 1024:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
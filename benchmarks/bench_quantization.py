@@ -0,0 +1,160 @@
+"""Benchmark quantized first passes of the NumPy vector store.
+
+A store is written once without quantization and then reopened with int8
+and binary codes, which are built on open. For each quantization and
+re-scoring factor the benchmark reports the size of the data a query
+scans, its share of the float32 matrix, the query latency and the
+recall@k against exact search.
+
+Two stores are measured: the sample corpus, embedded by the hashing
+embedder and queried with the opening words of its own chunks, and a
+synthetic scale-up whose embeddings are scattered around one topic
+vector per 50 chunks. The hashing embedder's vectors are sparse, most
+components being zero, so their sign bits carry little information and
+binary codes rank them poorly; dense model embeddings behave like the
+synthetic ones.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_quantization --docs 100000 --dim 1536
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import List, Set
+
+import numpy as np
+
+from benchmarks._common import (HashingEmbeddingService, make_settings,
+                                sample_files)
+from knowledge_chat.application.import_files_use_case import ImportFilesUseCase
+from knowledge_chat.infrastructure.chunking.recursive_character_chunker import \
+    RecursiveCharacterChunker
+from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
+    MultiFormatLoader
+from knowledge_chat.infrastructure.vector_store.numpy_vector_store import \
+    NumPyVectorStore
+
+_FACTORS = (1, 4, 10)
+
+
+def file_size(workdir: str, names: tuple) -> int:
+    """Sum the size of the store files with the given names."""
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, files in os.walk(os.path.join(workdir, "numpy_store"))
+        for name in files
+        if name in names
+    )
+
+
+def compare(workdir: str, queries: List[List[float]], args: argparse.Namespace) -> None:
+    """Query a written store with every quantization and print a table."""
+    exact = NumPyVectorStore(make_settings(workdir))
+    truth: List[Set[str]] = [
+        set(ids) for ids in exact.query_similar_batch(queries, top_k=args.top_k)["ids"]
+    ]
+    matrix_mb = file_size(workdir, ("vectors.bin",)) / 2**20
+
+    print(
+        f"{'quantization':<14}{'factor':>7}{'scan MB':>9}{'of f32':>8}{'open s':>8}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'recall@' + str(args.top_k):>10}"
+    )
+    for quantization in ("none", "int8", "binary"):
+        for factor in _FACTORS if quantization != "none" else (1,):
+            started = time.perf_counter()
+            store = NumPyVectorStore(
+                make_settings(
+                    workdir,
+                    numpy_store_quantization=quantization,
+                    numpy_store_rescore_factor=factor,
+                )
+            )
+            open_seconds = time.perf_counter() - started
+            names = ("vectors.bin",) if quantization == "none" else (
+                f"{quantization}.codes", f"{quantization}.scales"
+            )
+            scan_mb = file_size(workdir, names) / 2**20
+
+            for query in queries[:5]:
+                store.query_similar(query, top_k=args.top_k)
+            latencies = []
+            found = 0
+            for query, expected in zip(queries, truth):
+                asked = time.perf_counter()
+                result = store.query_similar(query, top_k=args.top_k)
+                latencies.append(time.perf_counter() - asked)
+                found += len(expected & set(result["ids"][0]))
+            cuts = statistics.quantiles(latencies, n=100)
+            print(
+                f"{quantization:<14}{factor:>7}{scan_mb:>9.1f}{scan_mb / matrix_mb:>8.1%}"
+                f"{open_seconds:>8.2f}{cuts[49] * 1000:>9.2f}{cuts[94] * 1000:>9.2f}"
+                f"{found / sum(len(expected) for expected in truth):>10.3f}"
+            )
+
+
+def bench_samples(args: argparse.Namespace) -> None:
+    """Import the sample corpus and query it with the openings of its chunks."""
+    with tempfile.TemporaryDirectory() as workdir:
+        embedding_service = HashingEmbeddingService(dimensions=args.sample_dim)
+        vector_store = NumPyVectorStore(make_settings(workdir))
+        ImportFilesUseCase(
+            document_loader=MultiFormatLoader(),
+            chunker=RecursiveCharacterChunker(),
+            embedding_service=embedding_service,
+            vector_store=vector_store,
+        ).invoke(sample_files(workdir))
+        questions = [
+            " ".join(document.split()[:8])
+            for batch in vector_store.iter_documents()
+            for document in batch["documents"]
+        ]
+        print(f"sample corpus: {len(questions)} chunks, {args.sample_dim} dimensions")
+        compare(workdir, embedding_service.embed_texts(questions), args)
+
+
+def bench_synthetic(args: argparse.Namespace) -> None:
+    """Write clustered synthetic embeddings and query them with noisy copies."""
+    rng = np.random.default_rng(0)
+    topics = rng.standard_normal((max(1, args.docs // 50), args.dim), dtype=np.float32)
+    topics /= np.linalg.norm(topics, axis=1, keepdims=True)
+    noise = 1.0 / np.sqrt(args.dim)
+    queries = None
+    with tempfile.TemporaryDirectory() as workdir:
+        store = NumPyVectorStore(make_settings(workdir))
+        for start in range(0, args.docs, args.batch_size):
+            count = min(args.batch_size, args.docs - start)
+            vectors = topics[rng.integers(0, len(topics), count)]
+            vectors += rng.standard_normal(vectors.shape, dtype=np.float32) * noise
+            if queries is None:
+                queries = vectors[rng.integers(0, count, args.queries)]
+                queries = queries + rng.standard_normal(queries.shape, dtype=np.float32) * noise
+            store.add_documents(
+                ids=[f"doc-{i}" for i in range(start, start + count)],
+                embeddings=vectors.tolist(),
+                documents=[""] * count,
+                metadatas=[{}] * count,
+            )
+        print(f"\nsynthetic: {args.docs} vectors, {args.dim} dimensions")
+        compare(workdir, queries.tolist(), args)
+
+
+def main() -> None:
+    """Run both benchmarks and print their tables."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--sample-dim", type=int, default=256)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    bench_samples(args)
+    bench_synthetic(args)
+
+
+if __name__ == "__main__":
+    main()
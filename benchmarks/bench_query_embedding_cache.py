@@ -0,0 +1,116 @@
+"""Benchmark the in-memory query embedding cache.
+
+Simulates chat users asking helpdesk questions drawn from a Zipf-like
+distribution over a fixed set of topics, with random case and spacing
+variants, against an embedding endpoint with fixed per-call latency. It
+compares direct calls with MemoryCachedEmbeddingService and reports the
+hit rate, the number of API calls and query latencies.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_query_embedding_cache --users 32 --queries 50
+"""
+
+import argparse
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from benchmarks._common import HashingEmbeddingService
+from knowledge_chat.domain.interfaces.embedding_service import EmbeddingService
+from knowledge_chat.infrastructure.embedding_service.memory_cached_embedding_service import \
+    MemoryCachedEmbeddingService
+
+TOPICS = [
+    "reset password",
+    "VPN không kết nối được",
+    "printer not printing",
+    "outlook keeps asking for password",
+    "wifi chậm",
+    "laptop won't turn on",
+    "how to map a network drive",
+    "máy tính bị virus",
+    "teams camera not working",
+    "recover deleted file",
+]
+
+
+class SlowEmbeddingService(HashingEmbeddingService):
+    """Hashing embedder with API-like latency."""
+
+    def __init__(self, latency: float) -> None:
+        super().__init__()
+        self._latency = latency
+        self._counter_lock = threading.Lock()
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed after ``latency`` seconds."""
+        time.sleep(self._latency)
+        with self._counter_lock:
+            return super().embed_texts(texts)
+
+
+def question(rng: random.Random, distinct: int) -> str:
+    """Draw a question; low ranks are much more frequent than high ones."""
+    rank = min(int(rng.paretovariate(1.0)) - 1, distinct - 1)
+    text = TOPICS[rank % len(TOPICS)]
+    if rank >= len(TOPICS):
+        text = f"{text} (case {rank})"
+    if rng.random() < 0.3:
+        text = text.upper() if rng.random() < 0.5 else f"  {text}  "
+    return text
+
+
+def run(service: EmbeddingService, users: int, queries: int, distinct: int) -> tuple[float, List[float]]:
+    """Let ``users`` threads embed ``queries`` questions each; return timings."""
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def user(user_id: int) -> None:
+        rng = random.Random(user_id)
+        for _ in range(queries):
+            start = time.perf_counter()
+            service.embed_texts([question(rng, distinct)])
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        list(pool.map(user, range(users)))
+    return time.perf_counter() - start, latencies
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=32)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--distinct", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.03)
+    parser.add_argument("--max-entries", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"users: {args.users}, queries per user: {args.queries}")
+    print(f"{'mode':<8}{'seconds':>9}{'api calls':>11}{'hit rate':>10}{'mean ms':>9}{'p50 ms':>9}{'p99 ms':>9}")
+    for mode in ("direct", "cached"):
+        backend = SlowEmbeddingService(args.latency)
+        service: EmbeddingService = backend
+        if mode == "cached":
+            service = MemoryCachedEmbeddingService(
+                backend, model="benchmark", max_entries=args.max_entries
+            )
+        elapsed, latencies = run(service, args.users, args.queries, args.distinct)
+        latencies.sort()
+        hit_rate = service.stats().hit_rate if mode == "cached" else 0.0
+        print(
+            f"{mode:<8}{elapsed:>9.2f}{backend.calls:>11}{hit_rate:>10.1%}"
+            f"{statistics.mean(latencies) * 1000:>9.1f}"
+            f"{statistics.median(latencies) * 1000:>9.1f}"
+            f"{latencies[int(len(latencies) * 0.99)] * 1000:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
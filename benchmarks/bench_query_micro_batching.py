@@ -0,0 +1,100 @@
+"""Benchmark micro-batching of concurrent query embeddings.
+
+Simulates many chat users embedding one query each against an embedding
+endpoint with fixed per-call latency and a small per-call concurrency
+limit, and compares direct calls with MicroBatchingEmbeddingService.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_query_micro_batching --users 64 --queries 20
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from benchmarks._common import HashingEmbeddingService
+from knowledge_chat.domain.interfaces.embedding_service import EmbeddingService
+from knowledge_chat.infrastructure.embedding_service.micro_batching_embedding_service import \
+    MicroBatchingEmbeddingService
+
+
+class SlowEmbeddingService(HashingEmbeddingService):
+    """Hashing embedder with API-like latency and connection limit."""
+
+    def __init__(self, latency: float, connections: int) -> None:
+        super().__init__()
+        self._latency = latency
+        self._connections = threading.Semaphore(connections)
+        self._counter_lock = threading.Lock()
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed after ``latency`` seconds, holding one connection."""
+        with self._connections:
+            time.sleep(self._latency)
+            with self._counter_lock:
+                return super().embed_texts(texts)
+
+
+def run(service: EmbeddingService, users: int, queries: int) -> tuple[float, List[float]]:
+    """Let ``users`` threads embed ``queries`` questions each; return timings."""
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def user(user_id: int) -> None:
+        for i in range(queries):
+            start = time.perf_counter()
+            service.embed_texts([f"user {user_id} question {i}: VPN không kết nối được"])
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        list(pool.map(user, range(users)))
+    return time.perf_counter() - start, latencies
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=64)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.03)
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    print(f"users: {args.users}, queries per user: {args.queries}")
+    print(f"{'mode':<14}{'seconds':>9}{'queries/s':>11}{'api calls':>11}{'mean ms':>9}{'p50 ms':>9}{'p99 ms':>9}")
+
+    batcher = None
+    for mode in ("direct", "micro-batched"):
+        backend = SlowEmbeddingService(args.latency, args.connections)
+        service: EmbeddingService = backend
+        if mode == "micro-batched":
+            batcher = MicroBatchingEmbeddingService(
+                backend, window_ms=args.window_ms, max_batch_size=args.max_batch_size
+            )
+            service = batcher
+        elapsed, latencies = run(service, args.users, args.queries)
+        latencies.sort()
+        print(
+            f"{mode:<14}{elapsed:>9.2f}{len(latencies) / elapsed:>11.0f}{backend.calls:>11}"
+            f"{statistics.mean(latencies) * 1000:>9.1f}"
+            f"{statistics.median(latencies) * 1000:>9.1f}"
+            f"{latencies[int(len(latencies) * 0.99)] * 1000:>9.1f}"
+        )
+
+    stats = batcher.stats()
+    print(
+        f"window: {stats.window_ms} ms, batches: {stats.batches}, "
+        f"avg batch: {stats.avg_batch_size:.1f}, largest: {stats.largest_batch}, "
+        f"avg wait: {stats.avg_wait_ms:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Benchmark how often the relevance gate skips the LLM rerank call.
+
+Imports the sample corpus, then asks helpdesk and off-topic questions
+through ChatUseCase with an LLM of fixed latency, once without a gate and
+once per ``--gates`` setting. For each setting the benchmark reports the
+rerank calls made, the skip rate from ``ChatUseCase.relevance_gate_stats``,
+the questions answered from the knowledge base and the latency per turn.
+
+The hashing embedder spreads its distances higher than model embeddings
+do, so the default settings include thresholds scaled to it next to the
+application defaults (0.35:0.65:0.1), which reject most of its hits.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_relevance_gate --gates 0.35:0.65:0.1 0.6:0.85:0.05
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+
+from benchmarks._common import (HashingEmbeddingService, make_settings,
+                                sample_files)
+from knowledge_chat.application.chat_use_case import ChatUseCase
+from knowledge_chat.application.import_files_use_case import ImportFilesUseCase
+from knowledge_chat.application.relevance_gate import RelevanceGate
+from knowledge_chat.domain.entities.message import Message, MessageType
+from knowledge_chat.domain.interfaces.llm_service import LLMService
+from knowledge_chat.domain.interfaces.vector_store import VectorStore
+from knowledge_chat.infrastructure.chunking.recursive_character_chunker import \
+    RecursiveCharacterChunker
+from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
+    MultiFormatLoader
+from knowledge_chat.infrastructure.vector_store.chroma_vector_store import \
+    ChromaVectorStore
+
+HELPDESK_QUESTIONS = [
+    "How should I follow the 3-2-1 backup rule?",
+    "Outlook keeps crashing when I open it",
+    "My emails are stuck in the Outbox",
+    "My computer won't power on",
+    "The laptop gets very hot and shuts down",
+    "My phone battery drains too quickly",
+    "Windows says No Internet Access",
+    "How do I remove malware from my PC?",
+    "Máy tính bị quá nhiệt phải làm sao?",
+    "Điện thoại không kết nối WiFi",
+]
+OFF_TOPIC_QUESTIONS = [
+    "Recommend a good pasta recipe",
+    "Who won the football world cup?",
+    "What is the capital of France?",
+]
+
+
+class SlowLLMService(LLMService):
+    """LLM stand-in that answers after a fixed delay and counts rerank calls."""
+
+    def __init__(self, latency: float) -> None:
+        self._latency = latency
+        self.rerank_calls = 0
+
+    def generate(self, prompt: str) -> str:
+        """Select the first document when filtering, else return a canned answer."""
+        time.sleep(self._latency)
+        if "JSON" in prompt:
+            self.rerank_calls += 1
+            return "[0]"
+        return "Canned answer."
+
+
+def run(
+    vector_store: VectorStore,
+    embedding_service: HashingEmbeddingService,
+    gate: RelevanceGate | None,
+    args: argparse.Namespace,
+) -> str:
+    """Ask every question ``--rounds`` times and return a table row."""
+    llm_service = SlowLLMService(args.llm_latency)
+    chat_use_case = ChatUseCase(
+        embedding_service=embedding_service,
+        vector_store=vector_store,
+        llm_service=llm_service,
+        relevance_gate=gate,
+    )
+    latencies = []
+    answered = {"helpdesk": 0, "off-topic": 0}
+    for _ in range(args.rounds):
+        for kind, questions in (("helpdesk", HELPDESK_QUESTIONS), ("off-topic", OFF_TOPIC_QUESTIONS)):
+            for question in questions:
+                started = time.perf_counter()
+                answer = chat_use_case.invoke(
+                    [Message(type=MessageType.USER, content=question)], top_k=args.top_k
+                )
+                latencies.append(time.perf_counter() - started)
+                answered[kind] += "References:" in answer.content
+
+    stats = chat_use_case.relevance_gate_stats()
+    skip_rate = stats.skip_rate if stats is not None else 0.0
+    return (
+        f"{llm_service.rerank_calls:>8}{skip_rate:>7.0%}"
+        f"{answered['helpdesk']:>7}/{len(HELPDESK_QUESTIONS) * args.rounds:<4}"
+        f"{answered['off-topic']:>6}/{len(OFF_TOPIC_QUESTIONS) * args.rounds:<4}"
+        f"{statistics.median(latencies) * 1000:>9.1f}"
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--gates",
+        nargs="+",
+        default=["0.35:0.65:0.1", "0.6:0.85:0.05", "0.7:0.85:0.05"],
+        help="accept_distance:reject_distance:min_gap settings to compare",
+    )
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        embedding_service = HashingEmbeddingService()
+        vector_store = ChromaVectorStore(make_settings(workdir))
+        ImportFilesUseCase(
+            document_loader=MultiFormatLoader(),
+            chunker=RecursiveCharacterChunker(),
+            embedding_service=embedding_service,
+            vector_store=vector_store,
+        ).invoke(sample_files(workdir))
+
+        print(f"{'gate':<16}{'reranks':>8}{'skip':>7}{'helpdesk':>12}{'off-topic':>11}{'p50 ms':>9}")
+        print(f"{'off':<16}" + run(vector_store, embedding_service, None, args))
+        for setting in args.gates:
+            accept, reject, gap = (float(value) for value in setting.split(":"))
+            gate = RelevanceGate(accept_distance=accept, reject_distance=reject, min_gap=gap)
+            print(f"{setting:<16}" + run(vector_store, embedding_service, gate, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Benchmark local rerankers against the LLM rerank call.
+
+Imports the sample corpus, then answers helpdesk questions through
+ChatUseCase with each reranker. The LLM rerank call is simulated: it waits
+a fixed base latency plus a per-token cost for the prompt, which holds
+every retrieved chunk at full length, and selects the first chunk.
+Answer generation is instant, so the timings cover retrieval and
+reranking only. The cross-encoder is included when ``--model-path``
+points to a directory holding ``model.onnx`` and ``tokenizer.json``.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_rerankers --top-k 8 --model-path ./models/ms-marco-MiniLM-L-6-v2
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+
+from benchmarks._common import (HashingEmbeddingService, make_settings,
+                                sample_files)
+from knowledge_chat.application.chat_use_case import ChatUseCase
+from knowledge_chat.application.import_files_use_case import ImportFilesUseCase
+from knowledge_chat.domain.entities.message import Message, MessageType
+from knowledge_chat.domain.interfaces.llm_service import LLMService
+from knowledge_chat.infrastructure.chunking.recursive_character_chunker import \
+    RecursiveCharacterChunker
+from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
+    MultiFormatLoader
+from knowledge_chat.infrastructure.reranker.cross_encoder_reranker import \
+    CrossEncoderReranker
+from knowledge_chat.infrastructure.reranker.lexical_reranker import \
+    LexicalReranker
+from knowledge_chat.infrastructure.vector_store.chroma_vector_store import \
+    ChromaVectorStore
+
+QUESTIONS = [
+    "How do I reset my password?",
+    "VPN không kết nối được",
+    "The printer is not printing",
+    "No internet connection",
+    "My computer won't start",
+    "Màn hình xanh khi khởi động Windows",
+    "Outlook is not receiving email",
+    "The laptop is very slow",
+]
+
+
+class SimulatedLLMService(LLMService):
+    """LLM stand-in whose rerank latency grows with the prompt size."""
+
+    def __init__(self, base_latency: float, token_latency: float) -> None:
+        self._base_latency = base_latency
+        self._token_latency = token_latency
+        self.rerank_calls = 0
+        self.rerank_tokens = 0
+
+    def generate(self, prompt: str) -> str:
+        """Select the first document when filtering, else answer at once."""
+        if "JSON array" not in prompt:
+            return "Canned answer."
+        # Roughly four characters per token.
+        tokens = len(prompt) // 4
+        self.rerank_calls += 1
+        self.rerank_tokens += tokens
+        time.sleep(self._base_latency + tokens * self._token_latency)
+        return "[0]"
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--top-k", type=int, default=8)
+    parser.add_argument("--llm-base-latency", type=float, default=0.3)
+    parser.add_argument("--llm-token-latency", type=float, default=0.0002)
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--model-path", default="")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        settings = make_settings(workdir)
+        embedding_service = HashingEmbeddingService()
+        vector_store = ChromaVectorStore(settings)
+        ImportFilesUseCase(
+            document_loader=MultiFormatLoader(),
+            chunker=RecursiveCharacterChunker(),
+            embedding_service=embedding_service,
+            vector_store=vector_store,
+        ).invoke(sample_files(workdir))
+
+        rerankers = {"llm": None, "lexical": LexicalReranker(score_threshold=args.threshold)}
+        if args.model_path:
+            rerankers["cross"] = CrossEncoderReranker(
+                model_path=args.model_path, score_threshold=args.threshold
+            )
+
+        questions = QUESTIONS * args.rounds
+        print(f"questions: {len(questions)}, top_k: {args.top_k}")
+        print(f"{'reranker':<10}{'mean ms':>9}{'p50 ms':>9}{'p95 ms':>9}{'LLM calls':>11}{'tokens/call':>13}{'refs/turn':>11}")
+        for name, reranker in rerankers.items():
+            llm_service = SimulatedLLMService(args.llm_base_latency, args.llm_token_latency)
+            chat_use_case = ChatUseCase(
+                embedding_service=embedding_service,
+                vector_store=vector_store,
+                llm_service=llm_service,
+                reranker=reranker,
+            )
+            latencies = []
+            references = 0
+            for question in questions:
+                asked = time.perf_counter()
+                answer = chat_use_case.invoke(
+                    [Message(type=MessageType.USER, content=question)], top_k=args.top_k
+                )
+                latencies.append(time.perf_counter() - asked)
+                references += answer.content.count("\n[")
+            if reranker is not None:
+                reranker.close()
+            tokens = llm_service.rerank_tokens / llm_service.rerank_calls if llm_service.rerank_calls else 0
+            print(
+                f"{name:<10}{statistics.mean(latencies) * 1000:>9.1f}"
+                f"{statistics.median(latencies) * 1000:>9.1f}"
+                f"{statistics.quantiles(latencies, n=20)[-1] * 1000:>9.1f}"
+                f"{llm_service.rerank_calls:>11}{tokens:>13.0f}"
+                f"{references / len(questions):>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compare structure-aware chunking of Markdown and JSON with plain splitting.
+
+Chunks the Markdown and JSON samples with RecursiveCharacterChunker and
+with StructureAwareChunker around it, and reports the number of chunks,
+the characters that would be embedded, how full chunks are on average and
+how many chunks end in a Markdown heading whose content was cut off into
+the next chunk.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_structure_chunking --chunk-sizes 500 1000 2000
+"""
+
+import argparse
+import re
+from typing import List
+
+from langchain_core.documents import Document
+
+from benchmarks._common import SAMPLES_DIR
+from knowledge_chat.domain.interfaces.document_chunker import DocumentChunker
+from knowledge_chat.infrastructure.chunking.recursive_character_chunker import \
+    RecursiveCharacterChunker
+from knowledge_chat.infrastructure.chunking.structure_aware_chunker import \
+    StructureAwareChunker
+from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
+    MultiFormatLoader
+
+_HEADING = re.compile(r"^#{1,6}\s")
+
+
+def orphaned_headings(chunks: List[Document]) -> int:
+    """Count chunks whose last non-blank line is a Markdown heading."""
+    count = 0
+    for chunk in chunks:
+        lines = [line for line in chunk.page_content.split("\n") if line.strip()]
+        count += bool(lines) and bool(_HEADING.match(lines[-1]))
+    return count
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[500, 1000, 2000])
+    parser.add_argument("--json-record-path", default="")
+    args = parser.parse_args()
+
+    loader = MultiFormatLoader(json_record_path=args.json_record_path)
+    documents = [
+        doc
+        for pattern in ("*.md", "*.json")
+        for path in sorted(SAMPLES_DIR.rglob(pattern))
+        for doc in loader.load(str(path))
+    ]
+    print(f"documents: {len(documents)}")
+    print(f"{'size':>6}  {'chunker':<11}{'chunks':>8}{'chars':>9}{'fill':>7}{'orphans':>9}")
+    for chunk_size in args.chunk_sizes:
+        plain = RecursiveCharacterChunker(chunk_size, chunk_size // 5)
+        chunkers: List[tuple[str, DocumentChunker]] = [
+            ("plain", plain),
+            ("structure", StructureAwareChunker(plain, chunk_size)),
+        ]
+        for name, chunker in chunkers:
+            chunks = [chunk for doc in documents for chunk in chunker.chunk_document(doc)]
+            chars = sum(len(chunk.page_content) for chunk in chunks)
+            print(
+                f"{chunk_size:>6}  {name:<11}{len(chunks):>8}{chars:>9}"
+                f"{chars / len(chunks) / chunk_size:>7.0%}{orphaned_headings(chunks):>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
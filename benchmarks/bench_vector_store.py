@@ -0,0 +1,189 @@
+"""Benchmark the NumPy vector store against Chroma.
+
+Synthetic embeddings, scattered around one topic vector per 50 chunks, are
+written to a ChromaVectorStore and to NumPyVectorStore with float32 and
+float16 rows, in import-sized batches. Queries are stored vectors with
+noise added. For every backend the benchmark reports write throughput,
+size on disk, the latency of single ``query_similar`` calls, the
+throughput of ``query_similar_batch`` and the recall@k against exact
+search.
+
+Finally, several worker processes open the float32 NumPy store and query
+it. The resident and proportional size of their mappings of the matrix
+show that it is shared, not copied (Linux only).
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_vector_store --docs 20000 --dim 1536
+"""
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+from typing import Dict, List, Set
+
+import numpy as np
+
+from benchmarks._common import dir_size, make_settings
+from knowledge_chat.domain.interfaces.vector_store import VectorStore
+from knowledge_chat.infrastructure.vector_store.chroma_vector_store import \
+    ChromaVectorStore
+from knowledge_chat.infrastructure.vector_store.numpy_vector_store import \
+    NumPyVectorStore
+
+
+def build(store: VectorStore, vectors: np.ndarray, batch_size: int) -> float:
+    """Write every vector in batches and return the elapsed seconds."""
+    started = time.perf_counter()
+    for start in range(0, len(vectors), batch_size):
+        batch = vectors[start:start + batch_size]
+        ids = [f"doc-{i}" for i in range(start, start + len(batch))]
+        store.add_documents(
+            ids=ids,
+            embeddings=batch.tolist(),
+            documents=[f"chunk {record_id}" for record_id in ids],
+            metadatas=[{"source": f"file-{i % 100}.txt"} for i in range(start, start + len(batch))],
+        )
+    return time.perf_counter() - started
+
+
+def exact_neighbours(vectors: np.ndarray, queries: np.ndarray, top_k: int) -> List[Set[str]]:
+    """Return the IDs of the true nearest neighbours of every query."""
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = queries @ normalized.T
+    best = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+    return [{f"doc-{i}" for i in row} for row in best]
+
+
+def measure(
+    store: VectorStore, queries: np.ndarray, truth: List[Set[str]], args: argparse.Namespace
+) -> Dict[str, float]:
+    """Time single and batched queries and compute the recall."""
+    for query in queries[:5]:
+        store.query_similar(query.tolist(), top_k=args.top_k)
+    latencies = []
+    found = 0
+    for query, expected in zip(queries, truth):
+        asked = time.perf_counter()
+        result = store.query_similar(query.tolist(), top_k=args.top_k)
+        latencies.append(time.perf_counter() - asked)
+        found += len(expected & set(result["ids"][0]))
+    cuts = statistics.quantiles(latencies, n=100)
+
+    started = time.perf_counter()
+    for start in range(0, len(queries), args.query_batch):
+        store.query_similar_batch(queries[start:start + args.query_batch].tolist(), top_k=args.top_k)
+    batch_seconds = time.perf_counter() - started
+    return {
+        "p50": cuts[49] * 1000,
+        "p95": cuts[94] * 1000,
+        "batch_qps": len(queries) / batch_seconds,
+        "recall": found / (len(queries) * args.top_k),
+    }
+
+
+def matrix_memory_kb() -> Dict[str, int]:
+    """Sum RSS and PSS of this process's mappings of the matrix, in KiB.
+
+    PSS divides every page by the number of processes mapping it, so a
+    matrix shared by N processes shows a PSS of RSS / N in each.
+    """
+    usage = {"Rss": 0, "Pss": 0}
+    in_matrix = False
+    with open("/proc/self/smaps", encoding="utf-8") as f:
+        for line in f:
+            fields = line.split()
+            if not line[0].isupper():
+                in_matrix = line.rstrip().endswith("vectors.bin")
+            elif in_matrix and fields[0].rstrip(":") in usage:
+                usage[fields[0].rstrip(":")] += int(fields[1])
+    return usage
+
+
+def query_worker(workdir: str, queries: np.ndarray, top_k: int, ready, done) -> Dict[str, int]:
+    """Query the NumPy store from a separate process and report its memory."""
+    store = NumPyVectorStore(make_settings(workdir))
+    for query in queries:
+        store.query_similar(query.tolist(), top_k=top_k)
+    # Measure while every worker still maps the matrix.
+    ready.wait()
+    usage = matrix_memory_kb()
+    done.wait()
+    return usage
+
+
+def bench_workers(workdir: str, queries: np.ndarray, args: argparse.Namespace) -> None:
+    """Query one store from several processes and print their memory use."""
+    if not os.path.exists("/proc/self/smaps"):
+        print("\nworker memory: /proc/self/smaps is not available")
+        return
+    manager = multiprocessing.Manager()
+    ready, done = manager.Barrier(args.workers + 1), manager.Barrier(args.workers + 1)
+    with multiprocessing.get_context("spawn").Pool(args.workers) as pool:
+        pending = [
+            pool.apply_async(query_worker, (workdir, queries, args.top_k, ready, done))
+            for _ in range(args.workers)
+        ]
+        ready.wait()
+        done.wait()
+        usages = [result.get() for result in pending]
+
+    matrix_mb = dir_size(os.path.join(workdir, "numpy_store")) / 2**20
+    print(f"\nstore: {matrix_mb:.1f} MB on disk, {args.workers} worker processes")
+    print(f"{'worker':>7}{'matrix RSS MB':>15}{'matrix PSS MB':>15}")
+    for worker, usage in enumerate(usages):
+        print(f"{worker:>7}{usage['Rss'] / 1024:>15.1f}{usage['Pss'] / 1024:>15.1f}")
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=20_000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--query-batch", type=int, default=32)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    # Chunks of one document are close to each other, like real embeddings.
+    topics = rng.standard_normal((max(1, args.docs // 50), args.dim), dtype=np.float32)
+    topics /= np.linalg.norm(topics, axis=1, keepdims=True)
+    noise = 1.0 / np.sqrt(args.dim)
+    vectors = topics[rng.integers(0, len(topics), args.docs)]
+    vectors += rng.standard_normal(vectors.shape, dtype=np.float32) * noise
+    queries = vectors[rng.integers(0, args.docs, args.queries)]
+    queries += rng.standard_normal(queries.shape, dtype=np.float32) * noise
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    truth = exact_neighbours(vectors, queries, args.top_k)
+
+    backends = {"chroma": "", "numpy float32": "float32", "numpy float16": "float16"}
+    print(
+        f"{'backend':<15}{'write/s':>9}{'MB':>9}{'p50 ms':>9}{'p95 ms':>9}"
+        f"{'batch q/s':>11}{'recall@' + str(args.top_k):>10}"
+    )
+    for name, dtype in backends.items():
+        with tempfile.TemporaryDirectory() as workdir:
+            settings = make_settings(workdir, numpy_store_dtype=dtype or "float32")
+            store = ChromaVectorStore(settings) if name == "chroma" else NumPyVectorStore(settings)
+            seconds = build(store, vectors, args.batch_size)
+            stats = measure(store, queries, truth, args)
+            size = dir_size(settings.chroma_db_path if name == "chroma" else settings.numpy_store_path)
+            print(
+                f"{name:<15}{args.docs / seconds:>9.0f}{size / 2**20:>9.1f}"
+                f"{stats['p50']:>9.2f}{stats['p95']:>9.2f}"
+                f"{stats['batch_qps']:>11.0f}{stats['recall']:>10.3f}"
+            )
+
+    if args.workers:
+        with tempfile.TemporaryDirectory() as workdir:
+            build(NumPyVectorStore(make_settings(workdir)), vectors, args.batch_size)
+            bench_workers(workdir, queries[:20], args)
+
+
+if __name__ == "__main__":
+    main()
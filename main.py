@@ -6,11 +6,21 @@ and launches the Gradio-based user interface.
 
 from knowledge_chat.application.chat_use_case import ChatUseCase
 from knowledge_chat.application.import_files_use_case import ImportFilesUseCase
+from knowledge_chat.application.import_job_manager import ImportJobManager
+from knowledge_chat.application.relevance_gate import RelevanceGate
+from knowledge_chat.config.settings import Settings
+from knowledge_chat.dependencies.get_answer_cache import get_answer_cache
 from knowledge_chat.dependencies.get_chunker import get_chunker
 from knowledge_chat.dependencies.get_document_loader import get_document_loader
 from knowledge_chat.dependencies.get_embedding_service import \
     get_embedding_service
+from knowledge_chat.dependencies.get_lexical_index import get_lexical_index
 from knowledge_chat.dependencies.get_llm_service import get_llm_service
+from knowledge_chat.dependencies.get_parent_document_store import \
+    get_parent_document_store
+from knowledge_chat.dependencies.get_query_embedding_service import \
+    get_query_embedding_service
+from knowledge_chat.dependencies.get_reranker import get_reranker
 from knowledge_chat.dependencies.get_vector_store import get_vector_store
 from knowledge_chat.presentation.ui_gradio import KnowledgeChatUI
 
@@ -20,11 +30,17 @@ def main() -> None:
     # -----------------------------------------------------
     # Dependency Injection
     # -----------------------------------------------------
+    settings = Settings()
     document_loader = get_document_loader()
     chunker = get_chunker()
     embedding_service = get_embedding_service()
+    query_embedding_service = get_query_embedding_service(embedding_service)
     vector_store = get_vector_store()
     llm_service = get_llm_service()
+    parent_store = get_parent_document_store()
+    lexical_index = get_lexical_index()
+    answer_cache = get_answer_cache()
+    reranker = get_reranker()
 
     # -----------------------------------------------------
     # Application Use Cases
@@ -34,18 +50,47 @@ def main() -> None:
         chunker=chunker,
         embedding_service=embedding_service,
         vector_store=vector_store,
+        parent_store=parent_store,
+        lexical_index=lexical_index,
+        embedding_batch_size=settings.import_embedding_batch_size,
+        queue_size=settings.import_queue_size,
+        dedup_threshold=(
+            settings.import_dedup_threshold if settings.import_dedup_enabled else None
+        ),
+    )
+
+    import_job_manager = ImportJobManager(
+        import_use_case=import_use_case,
+        vector_store=vector_store,
+        parent_store=parent_store,
+        lexical_index=lexical_index,
     )
 
     chat_use_case = ChatUseCase(
-        embedding_service=embedding_service,
+        embedding_service=query_embedding_service,
         vector_store=vector_store,
         llm_service=llm_service,
+        parent_store=parent_store,
+        expand_to_parent=settings.chat_expand_to_parent,
+        answer_cache=answer_cache,
+        relevance_gate=(
+            RelevanceGate(
+                accept_distance=settings.rerank_gate_accept_distance,
+                reject_distance=settings.rerank_gate_reject_distance,
+                min_gap=settings.rerank_gate_min_gap,
+            )
+            if settings.rerank_gate_enabled
+            else None
+        ),
+        reranker=reranker,
+        lexical_index=lexical_index,
+        rrf_k=settings.hybrid_rrf_k,
     )
 
     # -----------------------------------------------------
     # Presentation Layer (UI)
     # -----------------------------------------------------
-    ui = KnowledgeChatUI(import_use_case=import_use_case, chat_use_case=chat_use_case)
+    ui = KnowledgeChatUI(import_job_manager=import_job_manager, chat_use_case=chat_use_case)
     app = ui.create_interface()
 
     # -----------------------------------------------------
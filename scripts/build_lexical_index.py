@@ -0,0 +1,30 @@
+"""Build the lexical (BM25) index from the chunks of the Chroma collection.
+
+Usage:
+    LEXICAL_INDEX_ENABLED=true python scripts/build_lexical_index.py
+
+Run it once after enabling the lexical index on an existing knowledge
+base; later imports keep the index up to date.
+"""
+
+from knowledge_chat.application.build_lexical_index_use_case import \
+    BuildLexicalIndexUseCase
+from knowledge_chat.dependencies.get_lexical_index import get_lexical_index
+from knowledge_chat.dependencies.get_vector_store import get_vector_store
+
+
+def main() -> None:
+    """Rebuild the index and report how many records were indexed."""
+    lexical_index = get_lexical_index()
+    if lexical_index is None:
+        raise SystemExit("The lexical index is disabled; set LEXICAL_INDEX_ENABLED=true.")
+    use_case = BuildLexicalIndexUseCase(
+        vector_store=get_vector_store(),
+        lexical_index=lexical_index,
+    )
+    indexed = use_case.invoke()
+    print(f"Indexed {indexed} record(s) in the lexical index.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Migrate an existing Chroma collection to the chunk/parent storage layout.
+
+Usage:
+    python scripts/migrate_parent_storage.py
+
+The chunker settings (CHUNKER_*) must match the ones used when the
+collection was imported.
+"""
+
+from knowledge_chat.application.migrate_parent_storage_use_case import \
+    MigrateParentStorageUseCase
+from knowledge_chat.dependencies.get_chunker import get_chunker
+from knowledge_chat.dependencies.get_parent_document_store import \
+    get_parent_document_store
+from knowledge_chat.dependencies.get_vector_store import get_vector_store
+
+
+def main() -> None:
+    """Run the migration and report how many records were rewritten."""
+    use_case = MigrateParentStorageUseCase(
+        chunker=get_chunker(),
+        vector_store=get_vector_store(),
+        parent_store=get_parent_document_store(),
+    )
+    migrated = use_case.invoke()
+    print(f"Migrated {migrated} record(s) to chunk/parent storage.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""Allow running the command-line interface with ``python -m knowledge_chat``."""
+
+import sys
+
+from knowledge_chat.presentation.cli import main
+
+sys.exit(main())
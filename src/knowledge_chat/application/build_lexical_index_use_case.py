@@ -0,0 +1,59 @@
+"""Use case for building the lexical index from the vector store.
+
+Chunks imported while the lexical index was disabled are not in it. This
+use case reads every stored chunk and indexes its text under the chunk's
+ID. The index is built in a staging index that replaces the live one only
+when the build finished, so chat keeps using the old index meanwhile and
+an interrupted build leaves it untouched. No embeddings are computed.
+"""
+
+from knowledge_chat.domain.interfaces.lexical_index import LexicalIndex
+from knowledge_chat.domain.interfaces.vector_store import VectorStore
+
+
+class BuildLexicalIndexUseCase:
+    """Application use case that rebuilds the lexical index from stored chunks."""
+
+    def __init__(self, vector_store: VectorStore, lexical_index: LexicalIndex) -> None:
+        """Initialize the use case with its dependencies.
+
+        Args:
+            vector_store (VectorStore): The collection holding the chunks.
+            lexical_index (LexicalIndex): The index to rebuild.
+        """
+        self._vector_store = vector_store
+        self._lexical_index = lexical_index
+
+    # -----------------------------------------------------
+    # Public entry point
+    # -----------------------------------------------------
+
+    def invoke(self, batch_size: int = 500) -> int:
+        """Rebuild the lexical index from every stored chunk.
+
+        Args:
+            batch_size (int, optional): Number of records read and indexed
+                per round trip. Defaults to 500.
+
+        Returns:
+            int: Number of records that were indexed.
+        """
+        staging = self._lexical_index.create_staging()
+        indexed = 0
+        try:
+            for batch in self._vector_store.iter_documents(batch_size=batch_size):
+                records = [
+                    (record_id, text)
+                    for record_id, text in zip(batch["ids"], batch["documents"])
+                    if text
+                ]
+                staging.add_documents(
+                    ids=[record_id for record_id, _ in records],
+                    texts=[text for _, text in records],
+                )
+                indexed += len(records)
+        except BaseException:
+            self._lexical_index.discard_staging(staging)
+            raise
+        self._lexical_index.promote_staging(staging)
+        return indexed
@@ -6,26 +6,52 @@ Retrieval-Augmented Generation (RAG) workflow:
 1. Receives a conversational message history from the user.
 2. Embeds the most recent user query into a dense vector using the
    configured embedding service.
-3. Retrieves semantically similar documents from the vector database.
-4. Filters those documents using a cosine similarity threshold.
+3. Retrieves semantically similar documents from the vector database
+   and, when a lexical index is configured, fuses them with its BM25 hits
+   by reciprocal-rank fusion.
+4. Filters those documents: clear cases are decided from their vector
+   distances by a relevance gate, ambiguous ones by a reranker (a local
+   model or an LLM rerank call).
 5. Builds a contextual prompt combining the retrieved content and
    the chat history.
 6. Generates a response via a Large Language Model (LLM).
 7. Appends a numbered list of referenced source documents to the output.
 
+Single-turn questions can be answered from a semantic answer cache: when
+a question is close enough to an earlier one and the knowledge base has
+not changed since, the earlier answer is returned without calling the LLM.
+
+Chunk records only hold their own text. When parent expansion is enabled,
+the full parent text of every relevant chunk is fetched on demand from the
+parent document store and used as context instead.
+
 This approach enables context-aware, grounded, and explainable AI responses.
 """
 
 import json
+import re
 from typing import Any, List
 
+import numpy as np
+
+from knowledge_chat.application.rank_fusion import reciprocal_rank_fusion
+from knowledge_chat.application.relevance_gate import RelevanceGate
 from knowledge_chat.config.prompts import (CHAT_PROMPT_TEMPLATE,
                                            RERANK_FILTER_PROMPT_TEMPLATE)
 from knowledge_chat.domain.entities.message import Message, MessageType
+from knowledge_chat.domain.entities.relevance_gate_stats import \
+    RelevanceGateStats
+from knowledge_chat.domain.interfaces.answer_cache import AnswerCache
 from knowledge_chat.domain.interfaces.embedding_service import EmbeddingService
+from knowledge_chat.domain.interfaces.lexical_index import LexicalIndex
 from knowledge_chat.domain.interfaces.llm_service import LLMService
+from knowledge_chat.domain.interfaces.parent_document_store import \
+    ParentDocumentStore
+from knowledge_chat.domain.interfaces.reranker import Reranker
 from knowledge_chat.domain.interfaces.vector_store import VectorStore
 
+_INDEX_LIST_PATTERN = re.compile(r"\[[^\[\]]*\]")
+
 
 class ChatUseCase:
     """Use case for conversational chat powered by Retrieval-Augmented Generation (RAG).
@@ -45,6 +71,13 @@ class ChatUseCase:
         embedding_service: EmbeddingService,
         vector_store: VectorStore,
         llm_service: LLMService,
+        parent_store: ParentDocumentStore | None = None,
+        expand_to_parent: bool = False,
+        answer_cache: AnswerCache | None = None,
+        relevance_gate: RelevanceGate | None = None,
+        reranker: Reranker | None = None,
+        lexical_index: LexicalIndex | None = None,
+        rrf_k: int = 60,
     ) -> None:
         """Initialize the chat use case and its dependencies.
 
@@ -55,10 +88,35 @@ class ChatUseCase:
                 Component responsible for similarity-based retrieval of embedded documents.
             llm_service (LLMService):
                 Component responsible for generating language-model responses.
+            parent_store (ParentDocumentStore | None):
+                Optional store holding the full parent text of each chunk.
+            expand_to_parent (bool):
+                When True and a parent store is given, relevant chunks are
+                replaced by their parent texts in the generation context.
+            answer_cache (AnswerCache | None):
+                Optional cache answering repeated single-turn questions.
+            relevance_gate (RelevanceGate | None):
+                Optional policy that accepts or rejects retrieved documents
+                by distance, so the LLM rerank call only runs for
+                ambiguous results. Without it every turn is reranked.
+            reranker (Reranker | None):
+                Optional local reranker used instead of the LLM rerank call.
+            lexical_index (LexicalIndex | None):
+                Optional full-text index searched alongside the vector store,
+                so exact terms such as error codes are found too.
+            rrf_k (int):
+                Rank damping constant of the reciprocal-rank fusion.
         """
         self._embedding_service = embedding_service
         self._vector_store = vector_store
         self._llm_service = llm_service
+        self._parent_store = parent_store
+        self._expand_to_parent = expand_to_parent
+        self._answer_cache = answer_cache
+        self._relevance_gate = relevance_gate
+        self._reranker = reranker
+        self._lexical_index = lexical_index
+        self._rrf_k = rrf_k
 
     # ----------------------------------------------------------------------
     # Public entry point
@@ -100,14 +158,19 @@ class ChatUseCase:
         query_text = last_message.content
         query_embedding = self._embedding_service.embed_texts([query_text])[0]
 
+        # Only single-turn answers do not depend on earlier messages.
+        cache_version: str | None = None
+        if self._answer_cache is not None and len(messages) == 1:
+            cache_version = f"{self._vector_store.version()}:{top_k}"
+            cached_answer = self._answer_cache.lookup(query_embedding, cache_version)
+            if cached_answer is not None:
+                return cached_answer
+
         # Retrieve candidate documents
-        retrieved_docs = self._vector_store.query_similar(
-            embedding=query_embedding,
-            top_k=top_k,
-        )
+        retrieved_docs = self._retrieve(query_text, query_embedding, top_k)
 
         # Filter only relevant ones
-        filtered_docs = self._filter_relevant_docs(retrieved_docs, query_text)
+        filtered_docs = self._select_relevant_docs(retrieved_docs, query_text)
         if not filtered_docs["documents"] or not filtered_docs["documents"][0]:
             ai_text = (
                 "Xin lỗi, tôi không thể tìm thấy thông tin liên quan. (I'm sorry, I could not find relevant information in the knowledge base.)"
@@ -115,8 +178,10 @@ class ChatUseCase:
             return Message(type=MessageType.AI, content=ai_text)
 
         # Build contextual prompt
-        context_text = self._build_context_text(filtered_docs)
         references = self._extract_references(filtered_docs)
+        if self._expand_to_parent and self._parent_store is not None:
+            filtered_docs = self.fetch_parents(filtered_docs)
+        context_text = self._build_context_text(filtered_docs)
         prompt = self._build_prompt(context_text, messages)
 
         # Generate AI response
@@ -129,24 +194,167 @@ class ChatUseCase:
             )
             ai_response += f"\n\nReferences:\n{reference_lines}"
 
-        return Message(type=MessageType.AI, content=ai_response)
+        ai_message = Message(type=MessageType.AI, content=ai_response)
+        if cache_version is not None:
+            self._answer_cache.store(query_text, query_embedding, cache_version, ai_message)
+        return ai_message
+
+    def fetch_parents(self, retrieved_docs: dict[str, Any]) -> dict[str, Any]:
+        """Replace retrieved chunks by the full text of their parent documents.
+
+        Chunks that share a parent collapse into a single entry, and chunks
+        without a known ``parent_id`` are kept as they are.
+
+        Args:
+            retrieved_docs (dict[str, Any]): Results with documents and metadata.
+
+        Returns:
+            dict[str, Any]: Results in the same shape, holding parent texts.
+
+        Raises:
+            ValueError: If no parent document store is configured.
+        """
+        if self._parent_store is None:
+            raise ValueError("No parent document store is configured.")
+
+        docs = retrieved_docs.get("documents", [[]])
+        metas = retrieved_docs.get("metadatas", [[]])
+        if not docs or not docs[0]:
+            return {"documents": [[]], "metadatas": [[]]}
+
+        parent_ids = [meta.get("parent_id") for meta in metas[0]]
+        parents = self._parent_store.get_parents([pid for pid in parent_ids if pid])
+
+        expanded_docs: List[str] = []
+        expanded_metas: List[dict[str, Any]] = []
+        seen: set[str] = set()
+        for chunk, meta, pid in zip(docs[0], metas[0], parent_ids):
+            if pid in parents:
+                if pid in seen:
+                    continue
+                seen.add(pid)
+                chunk = parents[pid]
+            expanded_docs.append(chunk)
+            expanded_metas.append(meta)
+
+        return {"documents": [expanded_docs], "metadatas": [expanded_metas]}
+
+    def relevance_gate_stats(self) -> RelevanceGateStats | None:
+        """Return how often the relevance gate skipped the rerank call.
+
+        Returns:
+            RelevanceGateStats | None: A snapshot of the gate counters, or
+                None when no relevance gate is configured.
+        """
+        if self._relevance_gate is None:
+            return None
+        return self._relevance_gate.stats()
 
     # ----------------------------------------------------------------------
     # Private helper methods
     # ----------------------------------------------------------------------
 
-    def _filter_relevant_docs(self, retrieved_docs: dict[str, Any], query_text: str) -> dict[str, Any]:
-        """Filter and re-rank retrieved documents using an LLM for semantic relevance.
+    def _retrieve(
+        self,
+        query_text: str,
+        query_embedding: List[float],
+        top_k: int,
+    ) -> dict[str, Any]:
+        """Retrieve candidate documents from the vector store and lexical index.
+
+        Both retrievers return up to ``top_k`` hits, which are fused by
+        reciprocal rank and cut back to ``top_k``. Hits only found by the
+        lexical index are fetched from the vector store, and their cosine
+        distance to the query is computed from their stored embedding, so
+        every result carries a comparable distance.
 
-        Instead of relying purely on vector similarity distances, this step delegates
-        semantic filtering to the LLM. It asks the model to identify which of the
-        retrieved chunks are *truly relevant* to the user's intent, based on meaning
-        rather than numeric proximity.
+        Args:
+            query_text (str): The user's question or query text.
+            query_embedding (List[float]): Embedding of the query.
+            top_k (int): Maximum number of documents to return.
 
-        Steps:
-            1. Format all retrieved documents as an indexed list.
-            2. Ask the LLM to return a JSON array of indices that are relevant.
-            3. Parse and keep only those documents.
+        Returns:
+            dict[str, Any]: Results with ``ids``, ``documents``,
+                ``metadatas`` and ``distances``, best first.
+        """
+        vector_hits = self._vector_store.query_similar(
+            embedding=query_embedding,
+            top_k=top_k,
+        )
+        if self._lexical_index is None:
+            return vector_hits
+        lexical_hits = self._lexical_index.search(query_text, top_k=top_k)
+        if not lexical_hits:
+            return vector_hits
+
+        ids = vector_hits.get("ids") or [[]]
+        records = {
+            record_id: (document, metadata, distance)
+            for record_id, document, metadata, distance in zip(
+                ids[0],
+                vector_hits["documents"][0],
+                vector_hits["metadatas"][0],
+                vector_hits["distances"][0],
+            )
+        }
+        fused = reciprocal_rank_fusion(
+            [ids[0], [record_id for record_id, _ in lexical_hits]],
+            k=self._rrf_k,
+        )[:top_k]
+
+        missing = [record_id for record_id, _ in fused if record_id not in records]
+        if missing:
+            query_vector = np.asarray(query_embedding, dtype=np.float64)
+            query_norm = np.linalg.norm(query_vector) or 1.0
+            for record_id, record in self._vector_store.get_documents(missing).items():
+                vector = np.asarray(record["embedding"], dtype=np.float64)
+                similarity = float(query_vector @ vector / (query_norm * (np.linalg.norm(vector) or 1.0)))
+                records[record_id] = (record["document"], record["metadata"], 1.0 - similarity)
+
+        # IDs the lexical index still holds but the vector store lost are skipped.
+        kept = [record_id for record_id, _ in fused if record_id in records]
+        return {
+            "ids": [kept],
+            "documents": [[records[record_id][0] for record_id in kept]],
+            "metadatas": [[records[record_id][1] for record_id in kept]],
+            "distances": [[records[record_id][2] for record_id in kept]],
+        }
+
+    def _select_relevant_docs(self, retrieved_docs: dict[str, Any], query_text: str) -> dict[str, Any]:
+        """Keep the relevant retrieved documents, reranking only when needed.
+
+        Args:
+            retrieved_docs (dict[str, Any]): The raw retrieval results,
+                including ``distances``.
+            query_text (str): The user's question or query text.
+
+        Returns:
+            dict[str, Any]: Results in the same shape, holding the relevant
+                documents only.
+        """
+        distances = retrieved_docs.get("distances")
+        if self._relevance_gate is None or not distances or not distances[0]:
+            return self._filter_relevant_docs(retrieved_docs, query_text)
+
+        decision = self._relevance_gate.decide(distances[0])
+        if decision.action == "reject":
+            return {"documents": [[]], "metadatas": [[]]}
+        selected = {
+            key: [[values[0][i] for i in decision.indices]]
+            for key, values in retrieved_docs.items()
+            if key in ("ids", "documents", "metadatas", "distances") and values and values[0]
+        }
+        if decision.action == "accept":
+            return selected
+        return self._filter_relevant_docs(selected, query_text)
+
+    def _filter_relevant_docs(self, retrieved_docs: dict[str, Any], query_text: str) -> dict[str, Any]:
+        """Filter and re-rank retrieved documents for semantic relevance.
+
+        Instead of relying purely on vector similarity distances, this step asks
+        a reranker which of the retrieved chunks are *truly relevant* to the
+        user's intent. When a local reranker is configured it scores the chunks
+        directly; otherwise the decision is delegated to the LLM.
 
         Args:
             retrieved_docs (dict[str, Any]):
@@ -170,8 +378,38 @@ class ChatUseCase:
         if not docs or not docs[0]:
             return {"documents": [[]], "metadatas": [[]]}
 
+        if self._reranker is not None:
+            relevant_indices = self._reranker.rerank(query_text, docs[0])
+        else:
+            relevant_indices = self._llm_rerank(docs[0], query_text)
+
+        filtered_docs = [docs[0][i] for i in relevant_indices]
+        filtered_metas = [metas[0][i] for i in relevant_indices]
+
+        return {"documents": [filtered_docs], "metadatas": [filtered_metas]}
+
+    def _llm_rerank(self, documents: List[str], query_text: str) -> List[int]:
+        """Ask the LLM which retrieved documents are relevant.
+
+        Steps:
+            1. Format all retrieved documents as an indexed list.
+            2. Ask the LLM to return a JSON array of indices that are relevant.
+            3. Parse the first array in the answer, dropping invalid and
+               repeated indices.
+
+        If the answer holds no parsable array, all documents are kept: a
+        malformed reply says nothing about relevance, and answering from
+        unfiltered context is better than answering from none.
+
+        Args:
+            documents (List[str]): Texts of the retrieved documents.
+            query_text (str): The user's question or query text.
+
+        Returns:
+            List[int]: Positions of the relevant documents.
+        """
         # --- Step 1: Prepare prompt for LLM filtering ---
-        formatted_docs = "\n\n".join(f"[{i}] {chunk}" for i, chunk in enumerate(docs[0]))
+        formatted_docs = "\n\n".join(f"[{i}] {chunk}" for i, chunk in enumerate(documents))
         ranking_prompt = RERANK_FILTER_PROMPT_TEMPLATE.format(
             query=query_text,
             documents=formatted_docs,
@@ -180,19 +418,22 @@ class ChatUseCase:
         # --- Step 2: LLM-based semantic selection ---
         llm_output = self._llm_service.generate(ranking_prompt)
 
+        # --- Step 3: Parse the index list ---
+        match = _INDEX_LIST_PATTERN.search(llm_output)
         try:
-            relevant_indices = json.loads(llm_output)
-            if not isinstance(relevant_indices, list):
-                relevant_indices = []
-        #pylint: disable=broad-exception-caught
-        except Exception:
-            relevant_indices = []
-
-        # --- Step 3: Filter only the relevant chunks ---
-        filtered_docs = [docs[0][i] for i in relevant_indices if i < len(docs[0])]
-        filtered_metas = [metas[0][i] for i in relevant_indices if i < len(metas[0])]
-
-        return {"documents": [filtered_docs], "metadatas": [filtered_metas]}
+            parsed = json.loads(match.group(0)) if match else None
+        except json.JSONDecodeError:
+            parsed = None
+        if not isinstance(parsed, list):
+            return list(range(len(documents)))
+
+        relevant_indices: List[int] = []
+        for index in parsed:
+            if isinstance(index, bool) or not isinstance(index, int):
+                continue
+            if 0 <= index < len(documents) and index not in relevant_indices:
+                relevant_indices.append(index)
+        return relevant_indices
 
     def _build_context_text(self, retrieved_docs: dict[str, Any]) -> str:
         """Build a context section for the LLM prompt.
@@ -212,6 +453,9 @@ class ChatUseCase:
         context_lines: List[str] = []
         for i, doc in enumerate(documents[0]):
             file_name = metadatas[0][i].get("source", "Unknown file")
+            heading_path = metadatas[0][i].get("heading_path")
+            if heading_path and not self._expand_to_parent:
+                file_name = f"{file_name} | {heading_path}"
             context_lines.append(f"[{file_name}] {doc}")
 
         return "\n".join(context_lines)
@@ -2,17 +2,171 @@
 
 This module defines the ImportFilesUseCase class, which loads
 text files, splits them into chunks, generates embeddings, and stores
-the results in a vector database along with metadata and original text.
+the results in a vector database along with metadata. Each chunk record
+only stores its own text and a ``parent_id``; the full text of the page
+it came from is stored once in the parent document store. When a lexical
+index is configured, every chunk written to or deleted from the vector
+store is indexed or removed there as well.
+
+The import runs as a streaming pipeline. Loading, chunking, embedding
+and writing are separate stages on their own threads, connected by
+bounded queues, and chunks are embedded and written in fixed-size
+batches. Memory use therefore does not grow with the corpus, and the
+first chunks become searchable while later files are still loading.
+
+Chunk IDs are derived from the source, the document and chunk position
+and the chunk text, and records are upserted. Chunks that are already
+stored are neither re-embedded nor rewritten, so retrying an interrupted
+import or re-importing a slightly edited file only embeds what changed.
+
+Optionally, a dedup stage runs after chunking. A chunk whose text equals
+(exact hash) or nearly equals (MinHash/LSH, Jaccard similarity of word
+shingles above a threshold) a stored chunk, or an earlier chunk of the
+same import, is neither embedded nor stored; instead its source is added
+to the ``duplicate_sources`` metadata of that chunk. When a chunk that
+other sources depend on is deleted, those sources are re-imported so they
+get a copy of their own.
+
+Two import modes are supported:
+- Full: the collection is wiped and every file is re-imported.
+- Incremental: a SHA-256 content hash is tracked per source file, so only
+  new or changed files are loaded, chunked and embedded, and the chunks of
+  files that are no longer part of the import are deleted.
 """
 
-import uuid
-from typing import Any, List
+import copy
+import hashlib
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set, Tuple
 
+from langchain_core.documents import Document
+
+from knowledge_chat.application.near_duplicates import (MinHasher, jaccard,
+                                                        shingles)
+from knowledge_chat.application.pipeline import run_in_thread
+from knowledge_chat.application.record_ids import (chunk_id, parent_id,
+                                                   text_hash)
+from knowledge_chat.domain.entities.import_progress import ImportProgress
+from knowledge_chat.domain.entities.import_stats import ImportStats
 from knowledge_chat.domain.interfaces.document_chunker import DocumentChunker
 from knowledge_chat.domain.interfaces.document_loader import DocumentLoader
 from knowledge_chat.domain.interfaces.embedding_service import EmbeddingService
+from knowledge_chat.domain.interfaces.lexical_index import LexicalIndex
+from knowledge_chat.domain.interfaces.parent_document_store import \
+    ParentDocumentStore
 from knowledge_chat.domain.interfaces.vector_store import VectorStore
 
+_HASH_BLOCK_SIZE = 1024 * 1024
+# Passes that re-import sources whose deduplicated chunks were deleted.
+_MAX_REIMPORT_PASSES = 3
+
+
+@dataclass
+class _ChunkRecord:
+    """A chunk on its way through the pipeline.
+
+    ``parent`` is only set on the first chunk of each parent document, so
+    every parent text is written exactly once, right before its chunks.
+    The dedup stage sets ``duplicate_of`` (and the owning source of that
+    chunk) for duplicates, and the embed stage sets ``stored_metadata``
+    for chunks that are already stored and ``embedding`` for all others.
+    """
+
+    id: str
+    text: str
+    metadata: Dict[str, Any]
+    parent: Tuple[str, str, str] | None = None
+    stored_metadata: Dict[str, Any] | None = None
+    embedding: List[float] | None = None
+    duplicate_of: str | None = None
+    duplicate_owner: str | None = None
+    near_duplicate: bool = False
+
+
+@dataclass
+class _SourceProgress:
+    """Chunk and parent IDs written so far for a source being imported.
+
+    ``duplicate_ids`` are chunks of other sources that stand in for
+    duplicates of this source.
+    """
+
+    chunk_ids: Set[str] = field(default_factory=set)
+    parent_ids: Set[str] = field(default_factory=set)
+    duplicate_ids: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class _ChunkBatch:
+    """A batch of chunks plus the source files whose last chunk it holds."""
+
+    records: List[_ChunkRecord] = field(default_factory=list)
+    completed_sources: List[str] = field(default_factory=list)
+    # Hashes of completed sources that produced no chunk to flag.
+    empty_sources: Dict[str, str] = field(default_factory=dict)
+
+
+class _RecentChunks:
+    """Chunks kept by the dedup stage that may not be written yet.
+
+    The write stage trails the dedup stage by at most the queue capacities
+    in between plus the batches in hand, so chunks of older batches are
+    found in the store instead and need not be kept in memory.
+    """
+
+    def __init__(self, batches: int) -> None:
+        self._batches: "deque[List[Tuple[str, str, str, str, List[str]]]]" = deque(
+            maxlen=batches
+        )
+
+    def start_batch(self) -> None:
+        """Open a new batch, forgetting the oldest one."""
+        self._batches.append([])
+
+    def add(self, record: _ChunkRecord, band_keys: List[str]) -> None:
+        """Remember a chunk that duplicates may be matched against."""
+        self._batches[-1].append(
+            (record.id, record.metadata["source"], record.text, record.metadata["chunk_hash"], band_keys)
+        )
+
+    def __iter__(self) -> Iterator[Tuple[str, str, str, str, List[str]]]:
+        for batch in self._batches:
+            yield from batch
+
+
+class _ProgressTracker:
+    """Thread-safe ImportProgress counters shared by the pipeline stages.
+
+    Stages only update counters; events are emitted on the calling
+    thread, so the callback never runs concurrently with itself.
+    """
+
+    def __init__(self, callback: Callable[[ImportProgress], None] | None) -> None:
+        self._callback = callback
+        self._progress = ImportProgress()
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, **counters: float) -> None:
+        """Increase the named ImportProgress counters."""
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self._progress, name, getattr(self._progress, name) + value)
+
+    def emit(self, stage: str) -> None:
+        """Send a snapshot of the progress to the callback, if any."""
+        if self._callback is None:
+            return
+        with self._lock:
+            self._progress.stage = stage
+            self._progress.elapsed_seconds = time.perf_counter() - self._started
+            snapshot = self._progress.model_copy()
+        self._callback(snapshot)
+
 
 class ImportFilesUseCase:
     """Application use case for importing text files into the vector store."""
@@ -23,6 +177,12 @@ class ImportFilesUseCase:
         chunker: DocumentChunker,
         embedding_service: EmbeddingService,
         vector_store: VectorStore,
+        parent_store: ParentDocumentStore | None = None,
+        lexical_index: LexicalIndex | None = None,
+        embedding_batch_size: int = 64,
+        queue_size: int = 4,
+        source_root: str | None = None,
+        dedup_threshold: float | None = None,
     ) -> None:
         """Initialize the use case with its dependencies.
 
@@ -31,21 +191,95 @@ class ImportFilesUseCase:
             chunker (DocumentChunker): Service for splitting text into chunks.
             embedding_service (EmbeddingService): Embedding generation service.
             vector_store (VectorStore): Persistent vector database service.
+            parent_store (ParentDocumentStore | None): Optional store for the
+                full parent texts referenced by each chunk's ``parent_id``.
+            lexical_index (LexicalIndex | None): Optional full-text index
+                kept in sync with the chunks of the vector store.
+            embedding_batch_size (int): Number of chunks embedded and written
+                per batch.
+            queue_size (int): Capacity of the queues between pipeline stages.
+            source_root (str | None): When set, sources are identified by
+                their path relative to this directory instead of their file
+                name, so equally named files in different folders of a
+                large tree do not overwrite each other.
+            dedup_threshold (float | None): When set, chunks that duplicate
+                a stored chunk are not stored again. 1.0 only matches
+                identical chunks; lower values also match chunks whose word
+                shingles have at least this Jaccard similarity.
         """
         self._document_loader = document_loader
         self._chunker = chunker
         self._embedding_service = embedding_service
         self._vector_store = vector_store
+        self._parent_store = parent_store
+        self._lexical_index = lexical_index
+        self._embedding_batch_size = max(1, embedding_batch_size)
+        self._queue_size = queue_size
+        self._source_root = source_root
+        self._dedup = dedup_threshold is not None
+        self._min_hasher = (
+            MinHasher(threshold=dedup_threshold)
+            if dedup_threshold is not None and dedup_threshold < 1.0
+            else None
+        )
+
+    def with_stores(
+        self,
+        vector_store: VectorStore,
+        parent_store: ParentDocumentStore | None,
+        lexical_index: LexicalIndex | None = None,
+    ) -> "ImportFilesUseCase":
+        """Return a copy of this use case that writes to other stores.
+
+        Used to build a full import into staging stores while the live
+        stores keep serving chat.
+
+        Args:
+            vector_store (VectorStore): Vector store the copy writes to.
+            parent_store (ParentDocumentStore | None): Parent store the copy
+                writes to.
+            lexical_index (LexicalIndex | None): Lexical index the copy
+                writes to.
+
+        Returns:
+            ImportFilesUseCase: The rebound copy.
+        """
+        clone = copy.copy(self)
+        clone._vector_store = vector_store
+        clone._parent_store = parent_store
+        clone._lexical_index = lexical_index
+        return clone
 
     # -----------------------------------------------------
     # Public entry point
     # -----------------------------------------------------
 
-    def invoke(self, file_paths: List[str]) -> None:
+    def invoke(
+        self,
+        file_paths: List[str],
+        incremental: bool = False,
+        prune_missing: bool = True,
+        progress_callback: Callable[[ImportProgress], None] | None = None,
+    ) -> ImportStats:
         """Import one or more text files into the vector store.
 
         Args:
             file_paths (List[str]): List of paths to text files.
+            incremental (bool, optional): When True, only new or changed
+                files are re-imported and files missing from ``file_paths``
+                are removed from the store. When False, the store is wiped
+                and every file is imported. Defaults to False.
+            prune_missing (bool, optional): In incremental mode, whether
+                files missing from ``file_paths`` are removed. Pass False to
+                import a subset of the corpus, e.g. one batch of a bulk
+                ingest. Defaults to True.
+            progress_callback (Callable[[ImportProgress], None] | None,
+                optional): Called on the calling thread after planning,
+                after every written batch and once the import is done.
+                Defaults to None.
+
+        Returns:
+            ImportStats: Counters describing the work that was performed.
 
         Raises:
             ValueError: If no valid files are provided.
@@ -53,56 +287,621 @@ class ImportFilesUseCase:
         if not file_paths:
             raise ValueError("At least one file path must be provided.")
 
-        # Delete all documents from previous import
-        self._vector_store.delete_all()
+        stats = ImportStats()
+        tracker = _ProgressTracker(progress_callback)
+        tracker.emit("planning")
 
-        all_chunks: List[str] = []
-        all_metadatas: List[dict[str, Any]] = []
-        all_documents: List[str] = []
+        # The same file passed twice would produce the same chunk IDs twice.
+        known_paths = {self._source_key(path): path for path in file_paths}
+        invalidated: Set[str] = set()
+        removed: Set[str] = set()
+        if incremental:
+            pending = self._plan_incremental_import(
+                file_paths, stats, prune_missing, invalidated, removed
+            )
+            tracker.add(files_total=len(pending))
+        else:
+            # Delete all documents from previous import
+            self._vector_store.delete_all()
+            if self._parent_store is not None:
+                self._parent_store.delete_all()
+            if self._lexical_index is not None:
+                self._lexical_index.delete_all()
+            pending = (
+                (path, source, self._hash_file(path)) for source, path in known_paths.items()
+            )
+            stats.files_added = len(known_paths)
+            tracker.add(files_total=len(known_paths))
+        tracker.emit("importing")
 
-        for path in file_paths:
-            documents = self._document_loader.load(path)
-            for doc in documents:
-                chunks = self._chunker.chunk_text(doc.page_content)
-
-                for i, chunk in enumerate(chunks):
-                    all_chunks.append(chunk)
-                    all_metadatas.append(
-                        {
-                            "source": doc.metadata.get("source", path),
-                            "chunk_index": i,
-                        }
-                    )
-                    all_documents.append(doc.page_content)
+        for _ in range(_MAX_REIMPORT_PASSES):
+            self._run_pipeline(pending, stats, tracker, invalidated)
+            # A pruned source may have owned chunks of another pruned one.
+            invalidated -= removed
+            if not invalidated:
+                break
+            # Sources whose deduplicated chunks were deleted with another
+            # source are imported again to get a copy of their own.
+            pending = self._reimport_plan(invalidated, known_paths, stats)
+            invalidated = set()
+            tracker.add(files_total=len(pending))
+
+        tracker.emit("done")
+        return stats
 
-        # Generate embeddings for each chunk
-        embeddings = self._embedding_service.embed_texts(all_chunks)
+    def remove_files(self, file_paths: List[str]) -> ImportStats:
+        """Delete the chunks and parent texts of files, e.g. deleted ones.
 
-        # Persist to vector store
-        self._persist_to_vector_store(
-            documents=all_documents,
-            texts=all_chunks,
-            embeddings=embeddings,
-            metadatas=all_metadatas,
+        Args:
+            file_paths (List[str]): Paths of previously imported files. The
+                files do not need to exist any more.
+
+        Returns:
+            ImportStats: Counters with ``files_removed`` set.
+        """
+        stats = ImportStats()
+        invalidated: Set[str] = set()
+        sources = list(dict.fromkeys(self._source_key(path) for path in file_paths))
+        removed = set(sources)
+        for source in sources:
+            self._delete_source(source, invalidated)
+            stats.files_removed += 1
+        for _ in range(_MAX_REIMPORT_PASSES):
+            invalidated -= removed
+            if not invalidated:
+                break
+            pending = self._reimport_plan(invalidated, {}, stats)
+            invalidated = set()
+            self._run_pipeline(pending, stats, _ProgressTracker(None), invalidated)
+        return stats
+
+    # -----------------------------------------------------
+    # Pipeline stages
+    # -----------------------------------------------------
+
+    def _run_pipeline(
+        self,
+        pending: Iterable[Tuple[str, str, str]],
+        stats: ImportStats,
+        tracker: _ProgressTracker,
+        invalidated: Set[str],
+    ) -> None:
+        """Load, chunk, deduplicate, embed and write the pending files."""
+        documents = run_in_thread(
+            self._load_documents(pending, stats, tracker), self._queue_size, "import-load"
+        )
+        batches = run_in_thread(
+            self._chunk_batches(documents, tracker), self._queue_size, "import-chunk"
         )
+        if self._dedup:
+            batches = run_in_thread(
+                self._deduplicate_batches(batches), self._queue_size, "import-dedup"
+            )
+        embedded = run_in_thread(
+            self._embed_batches(batches, tracker), self._queue_size, "import-embed"
+        )
+
+        progress: Dict[str, _SourceProgress] = {}
+        for batch in embedded:
+            started = time.perf_counter()
+            self._write_batch(batch, stats, progress, invalidated)
+            tracker.add(
+                chunks_written=len(batch.records),
+                write_seconds=time.perf_counter() - started,
+            )
+            tracker.emit("importing")
+
+    def _load_documents(
+        self,
+        pending: Iterable[Tuple[str, str, str]],
+        stats: ImportStats,
+        tracker: _ProgressTracker,
+    ) -> Iterator[Tuple[str, str, Document | None]]:
+        """Load stage: yield ``(source, source_hash, document)`` per page.
+
+        Files are loaded with ``DocumentLoader.load_many`` and may finish
+        in any order, but all pages of a file are yielded together and a
+        ``None`` document marks the end of each file. Files that fail to
+        load are recorded in ``stats`` and skipped; pages streamed before
+        a failure stay unflagged and are cleaned up by the next import.
+        """
+        # Queued per path, so a path listed twice cannot lose its entry.
+        file_info: Dict[str, deque] = {}
+
+        def paths() -> Iterator[str]:
+            for path, source, source_hash in pending:
+                file_info.setdefault(path, deque()).append((source, source_hash))
+                yield path
+
+        results = self._document_loader.load_many(paths())
+        while True:
+            # Only time spent loading is measured, not time blocked on the queue.
+            started = time.perf_counter()
+            result = next(results, None)
+            if result is None:
+                return
+            queued = file_info[result.file_path]
+            source, source_hash = queued.popleft()
+            if not queued:
+                del file_info[result.file_path]
+            # Errors surface either here or from the lazy ``documents`` iterator.
+            if result.error is not None:
+                stats.files_failed += 1
+                stats.errors[result.file_path] = str(result.error)
+                tracker.add(files_failed=1, load_seconds=time.perf_counter() - started)
+                continue
+            try:
+                for doc in result.documents:
+                    tracker.add(load_seconds=time.perf_counter() - started)
+                    yield source, source_hash, doc
+                    started = time.perf_counter()
+            # pylint: disable=broad-exception-caught
+            except Exception as e:
+                stats.files_failed += 1
+                stats.errors[result.file_path] = str(e)
+                tracker.add(files_failed=1, load_seconds=time.perf_counter() - started)
+                continue
+            tracker.add(files_loaded=1, load_seconds=time.perf_counter() - started)
+            yield source, source_hash, None
+
+    def _chunk_batches(
+        self,
+        documents: Iterable[Tuple[str, str, Document | None]],
+        tracker: _ProgressTracker,
+    ) -> Iterator[_ChunkBatch]:
+        """Chunk stage: split documents and group the chunks into batches.
+
+        The last chunk of every file is held back until the end-of-file
+        marker arrives and is then flagged with ``source_complete`` and the
+        file's ``source_hash``. Batches are written in order, so a flagged
+        record guarantees the whole file is stored; partially written files
+        are never reported as imported. Files without any chunk are passed
+        on in ``empty_sources`` instead.
+        """
+        batch = _ChunkBatch()
+        held: _ChunkRecord | None = None
+        current_source: str | None = None
+        document_index = 0
+
+        for source, source_hash, doc in documents:
+            if doc is None:
+                if held is not None:
+                    held.metadata["source_hash"] = source_hash
+                    held.metadata["source_complete"] = True
+                    batch.records.append(held)
+                    held = None
+                else:
+                    batch.empty_sources[source] = source_hash
+                batch.completed_sources.append(source)
+                current_source = None
+                if len(batch.records) >= self._embedding_batch_size:
+                    yield batch
+                    batch = _ChunkBatch()
+                continue
+
+            if source != current_source:
+                current_source, document_index = source, 0
+            doc_parent_id = parent_id(source, doc.page_content)
+            started = time.perf_counter()
+            chunks = self._chunker.chunk_document(doc)
+            tracker.add(chunks_produced=len(chunks), chunk_seconds=time.perf_counter() - started)
+            for i, chunk_doc in enumerate(chunks):
+                chunk = chunk_doc.page_content
+                if held is not None:
+                    batch.records.append(held)
+                    if len(batch.records) >= self._embedding_batch_size:
+                        yield batch
+                        batch = _ChunkBatch()
+                held = _ChunkRecord(
+                    id=chunk_id(source, document_index, i, chunk),
+                    text=chunk,
+                    metadata={
+                        "source": source,
+                        "chunk_index": i,
+                        "parent_id": doc_parent_id,
+                        "chunk_hash": text_hash(chunk),
+                        **(
+                            {"heading_path": chunk_doc.metadata["heading_path"]}
+                            if chunk_doc.metadata.get("heading_path")
+                            else {}
+                        ),
+                    },
+                    parent=(doc_parent_id, source, doc.page_content) if i == 0 else None,
+                )
+            document_index += 1
+
+        if held is not None:
+            batch.records.append(held)
+        if batch.records or batch.completed_sources:
+            yield batch
+
+    def _deduplicate_batches(self, batches: Iterable[_ChunkBatch]) -> Iterator[_ChunkBatch]:
+        """Dedup stage: match new chunks against stored and recent chunks.
+
+        A chunk duplicates another when their ``chunk_hash`` is equal or,
+        with near-duplicate detection, when they share an LSH band and
+        their shingle similarity reaches the threshold. The last chunk of a
+        file carries the file's completion flag and is always kept.
+        """
+        recent = _RecentChunks(2 * self._queue_size + 3)
+        for batch in batches:
+            self._match_stored(batch.records)
+            band_keys: Dict[str, List[str]] = {}
+            if self._min_hasher is not None:
+                for record in batch.records:
+                    keys = self._min_hasher.band_keys(shingles(record.text))
+                    band_keys[record.id] = keys
+                    record.metadata.update({f"lsh_{i}": key for i, key in enumerate(keys)})
+
+            candidates = [
+                record
+                for record in batch.records
+                if record.stored_metadata is None and "source_complete" not in record.metadata
+            ]
+            lookup: Dict[str, List[Any]] = {
+                "chunk_hash": [record.metadata["chunk_hash"] for record in candidates]
+            }
+            if self._min_hasher is not None:
+                for band in range(self._min_hasher.bands):
+                    lookup[f"lsh_{band}"] = [
+                        band_keys[record.id][band]
+                        for record in candidates
+                        if band_keys[record.id]
+                    ]
+            matches = self._vector_store.find_by_metadata(lookup) if candidates else {}
+            known = [
+                (record_id, match["metadata"].get("source"), match["document"],
+                 match["metadata"].get("chunk_hash"),
+                 [match["metadata"].get(f"lsh_{band}") for band in range(self._min_hasher.bands)]
+                 if self._min_hasher is not None else [])
+                for record_id, match in matches.items()
+            ]
+
+            recent.start_batch()
+            for record in batch.records:
+                if record.stored_metadata is None and "source_complete" not in record.metadata:
+                    duplicate = self._find_duplicate(
+                        record, band_keys.get(record.id, []), known, recent
+                    )
+                    if duplicate is not None:
+                        record.duplicate_of, record.duplicate_owner, record.near_duplicate = duplicate
+                        continue
+                if record.stored_metadata is None:
+                    recent.add(record, band_keys.get(record.id, []))
+            yield batch
+
+    def _embed_batches(
+        self,
+        batches: Iterable[_ChunkBatch],
+        tracker: _ProgressTracker,
+    ) -> Iterator[_ChunkBatch]:
+        """Embed stage: embed the chunks of each batch that are not stored yet."""
+        for batch in batches:
+            started = time.perf_counter()
+            if not self._dedup:
+                # Otherwise the dedup stage has looked them up already.
+                self._match_stored(batch.records)
+            new_records = [
+                record
+                for record in batch.records
+                if record.stored_metadata is None and record.duplicate_of is None
+            ]
+            if new_records:
+                embeddings = self._embedding_service.embed_texts(
+                    [record.text for record in new_records]
+                )
+                for record, embedding in zip(new_records, embeddings):
+                    record.embedding = embedding
+            tracker.add(
+                chunks_embedded=len(new_records),
+                embed_seconds=time.perf_counter() - started,
+            )
+            yield batch
+
+    def _write_batch(
+        self,
+        batch: _ChunkBatch,
+        stats: ImportStats,
+        progress: Dict[str, _SourceProgress],
+        invalidated: Set[str],
+    ) -> None:
+        """Write stage: store new parents and chunks, refresh changed metadata.
+
+        ``progress`` collects the IDs of every source in progress. When a
+        source is complete, its stored chunks and parents that were not
+        seen are deleted *before* its flagged last chunk is written, so a
+        completed source never keeps records of an older version.
+
+        Duplicates are not written; their source is added to the
+        ``duplicate_sources`` of the chunk they duplicate instead. Sources
+        that lose a chunk they depended on are added to ``invalidated``.
+        """
+        for record in batch.records:
+            source = record.metadata["source"]
+            source_progress = progress.setdefault(source, _SourceProgress())
+            if record.duplicate_of is None:
+                source_progress.chunk_ids.add(record.id)
+            elif record.duplicate_owner == source:
+                source_progress.chunk_ids.add(record.duplicate_of)
+            else:
+                source_progress.duplicate_ids.add(record.duplicate_of)
+            source_progress.parent_ids.add(record.metadata["parent_id"])
+        for source in batch.completed_sources:
+            self._delete_stale_records(
+                source, progress.pop(source, _SourceProgress()), invalidated
+            )
+
+        duplicates = [record for record in batch.records if record.duplicate_of is not None]
+        new_records = [record for record in batch.records if record.embedding is not None]
+        changed_records = [
+            record
+            for record in batch.records
+            if record.stored_metadata is not None and record.stored_metadata != record.metadata
+        ]
+
+        # A reused chunk whose page changed elsewhere points to a new parent.
+        # Duplicates still need their page for their other chunks.
+        parents = [
+            record.parent
+            for record in new_records + changed_records + duplicates
+            if record.parent is not None
+        ]
+        if parents and self._parent_store is not None:
+            self._parent_store.add_parents(
+                parent_ids=[pid for pid, _, _ in parents],
+                sources=[source for _, source, _ in parents],
+                texts=[text for _, _, text in parents],
+            )
+
+        references: Dict[str, Set[str]] = {}
+        for record in duplicates:
+            if record.duplicate_owner != record.metadata["source"]:
+                references.setdefault(record.duplicate_of, set()).add(record.metadata["source"])
+        for record in new_records:
+            if record.id in references:
+                record.metadata["duplicate_sources"] = sorted(references.pop(record.id))
+
+        if new_records:
+            self._vector_store.upsert_documents(
+                ids=[record.id for record in new_records],
+                embeddings=[record.embedding for record in new_records],
+                documents=[record.text for record in new_records],
+                metadatas=[record.metadata for record in new_records],
+            )
+            if self._lexical_index is not None:
+                self._lexical_index.add_documents(
+                    ids=[record.id for record in new_records],
+                    texts=[record.text for record in new_records],
+                )
+        if changed_records:
+            # Same text, different flags: keep the stored embedding.
+            self._vector_store.update_documents(
+                ids=[record.id for record in changed_records],
+                documents=[record.text for record in changed_records],
+                metadatas=[record.metadata for record in changed_records],
+            )
+
+        if references:
+            self._add_duplicate_sources(references)
+        # Recorded so incremental imports count them as unchanged.
+        self._vector_store.record_empty_sources(batch.empty_sources)
+
+        stats.chunks_written += len(new_records)
+        stats.chunks_unchanged += len(batch.records) - len(new_records) - len(duplicates)
+        stats.chunks_deduplicated += len(duplicates)
+        stats.chunks_near_duplicates += sum(record.near_duplicate for record in duplicates)
 
     # -----------------------------------------------------
     # Private helper methods
     # -----------------------------------------------------
 
-    def _persist_to_vector_store(
+    def _plan_incremental_import(
         self,
-        documents: List[str],
-        texts: List[str],
-        embeddings: List[List[float]],
-        metadatas: List[dict[str, Any]],
+        file_paths: List[str],
+        stats: ImportStats,
+        prune_missing: bool,
+        invalidated: Set[str],
+        removed: Set[str],
+    ) -> List[Tuple[str, str, str]]:
+        """Compare file hashes with the store and drop removed files.
+
+        Chunks of files that are no longer part of the import are deleted
+        when ``prune_missing`` is set, and their sources added to
+        ``removed``.
+        Changed files keep their chunks: unchanged chunks are reused by ID
+        and stale ones are deleted once the file has been re-imported.
+        Leftovers of new files (e.g. from an interrupted import) are
+        reused the same way.
+
+        Returns:
+            List[Tuple[str, str, str]]: ``(path, source, source_hash)`` for
+                every new or changed file.
+        """
+        stored_hashes = self._vector_store.get_source_hashes()
+        current: Dict[str, Tuple[str, str]] = {}
+        for path in file_paths:
+            current[self._source_key(path)] = (path, self._hash_file(path))
+
+        pending: List[Tuple[str, str, str]] = []
+        for source, (path, source_hash) in current.items():
+            stored_hash = stored_hashes.get(source)
+            if stored_hash == source_hash:
+                stats.files_unchanged += 1
+                continue
+
+            if stored_hash is None:
+                stats.files_added += 1
+            else:
+                stats.files_updated += 1
+            pending.append((path, source, source_hash))
+
+        if prune_missing:
+            for source in stored_hashes.keys() - current.keys():
+                self._delete_source(source, invalidated)
+                removed.add(source)
+                stats.files_removed += 1
+
+        return pending
+
+    def _reimport_plan(
+        self,
+        sources: Set[str],
+        known_paths: Dict[str, str],
+        stats: ImportStats,
+    ) -> List[Tuple[str, str, str]]:
+        """Clear the hashes of invalidated sources and find their files.
+
+        Sources whose file is neither part of the current import nor found
+        below ``source_root`` are reported in ``sources_invalidated``;
+        their next incremental import re-imports them.
+        """
+        self._vector_store.invalidate_source_hashes(sorted(sources))
+        pending: List[Tuple[str, str, str]] = []
+        for source in sorted(sources):
+            path = known_paths.get(source)
+            if path is None and self._source_root is not None:
+                path = os.path.join(self._source_root, *source.split("/"))
+            if path is not None and os.path.isfile(path):
+                pending.append((path, source, self._hash_file(path)))
+            elif source not in stats.sources_invalidated:
+                stats.sources_invalidated.append(source)
+        return pending
+
+    def _delete_source(self, source: str, invalidated: Set[str]) -> None:
+        """Delete the chunks and parent texts of a source file."""
+        record_ids = self._vector_store.get_ids_by_source(source)
+        self._release_duplicates(record_ids, invalidated)
+        self._vector_store.delete_by_source(source)
+        if self._lexical_index is not None:
+            self._lexical_index.delete_documents(record_ids)
+        if self._parent_store is not None:
+            self._parent_store.delete_by_source(source)
+        self._remove_duplicate_source(source, keep=set())
+
+    def _delete_stale_records(
+        self,
+        source: str,
+        keep: _SourceProgress,
+        invalidated: Set[str],
     ) -> None:
-        """Persist the chunks, embeddings, metadata, and documents into the vector store."""
-        ids = [str(uuid.uuid4()) for _ in range(len(texts))]
-
-        self._vector_store.add_documents(
-            ids=ids,
-            embeddings=embeddings,
-            documents=documents,
-            metadatas=metadatas,
-        )
+        """Delete the chunks and parents of a source that were not re-imported."""
+        stale_ids = [
+            record_id
+            for record_id in self._vector_store.get_ids_by_source(source)
+            if record_id not in keep.chunk_ids
+        ]
+        if stale_ids:
+            self._release_duplicates(stale_ids, invalidated)
+            self._vector_store.delete_documents(stale_ids)
+            if self._lexical_index is not None:
+                self._lexical_index.delete_documents(stale_ids)
+
+        if self._parent_store is not None:
+            stale_parents = [
+                pid
+                for pid in self._parent_store.get_ids_by_source(source)
+                if pid not in keep.parent_ids
+            ]
+            if stale_parents:
+                self._parent_store.delete_parents(stale_parents)
+
+        self._remove_duplicate_source(source, keep=keep.duplicate_ids)
+
+    def _release_duplicates(self, record_ids: List[str], invalidated: Set[str]) -> None:
+        """Collect the sources that depend on chunks about to be deleted."""
+        for metadata in self._vector_store.get_metadatas(record_ids).values():
+            invalidated.update(metadata.get("duplicate_sources") or [])
+
+    def _add_duplicate_sources(self, references: Dict[str, Set[str]]) -> None:
+        """Add sources to the ``duplicate_sources`` of stored chunks."""
+        ids, metadatas = [], []
+        for record_id, metadata in self._vector_store.get_metadatas(list(references)).items():
+            current = set(metadata.get("duplicate_sources") or [])
+            if not references[record_id] <= current:
+                ids.append(record_id)
+                metadatas.append(
+                    {**metadata, "duplicate_sources": sorted(current | references[record_id])}
+                )
+        if ids:
+            self._vector_store.update_metadatas(ids, metadatas)
+
+    def _remove_duplicate_source(self, source: str, keep: Set[str]) -> None:
+        """Drop a source from the chunks it no longer has duplicates of."""
+        record_ids = [
+            record_id
+            for record_id in self._vector_store.get_ids_by_duplicate_source(source)
+            if record_id not in keep
+        ]
+        if not record_ids:
+            return
+        ids, metadatas = [], []
+        for record_id, metadata in self._vector_store.get_metadatas(record_ids).items():
+            remaining = [s for s in metadata.get("duplicate_sources") or [] if s != source]
+            updated = {key: value for key, value in metadata.items() if key != "duplicate_sources"}
+            if remaining:
+                updated["duplicate_sources"] = remaining
+            ids.append(record_id)
+            metadatas.append(updated)
+        self._vector_store.update_metadatas(ids, metadatas)
+
+    def _match_stored(self, records: List[_ChunkRecord]) -> None:
+        """Set ``stored_metadata`` on the records that are already stored.
+
+        The sources deduplicated against a stored chunk are carried over,
+        so re-importing its own source does not drop them.
+        """
+        stored = self._vector_store.get_metadatas([record.id for record in records])
+        for record in records:
+            if record.id in stored:
+                record.stored_metadata = stored[record.id]
+                if "duplicate_sources" in record.stored_metadata:
+                    record.metadata["duplicate_sources"] = record.stored_metadata["duplicate_sources"]
+
+    def _find_duplicate(
+        self,
+        record: _ChunkRecord,
+        band_keys: List[str],
+        known: List[Tuple[str, str, str, str, List[str]]],
+        recent: _RecentChunks,
+    ) -> Tuple[str, str, bool] | None:
+        """Find a chunk that the record duplicates.
+
+        Returns:
+            Tuple[str, str, bool] | None: ID and source of the matched
+                chunk and whether it is only a near duplicate.
+        """
+        chunk_hash = record.metadata["chunk_hash"]
+        near_candidates = []
+        for candidate in [*known, *recent]:
+            candidate_id, candidate_source, text, candidate_hash, candidate_keys = candidate
+            if candidate_hash == chunk_hash:
+                return candidate_id, candidate_source, False
+            if band_keys and any(a == b for a, b in zip(band_keys, candidate_keys)):
+                near_candidates.append((candidate_id, candidate_source, text))
+
+        if not near_candidates:
+            return None
+        record_shingles = shingles(record.text)
+        best: Tuple[float, str, str] | None = None
+        for candidate_id, candidate_source, text in near_candidates:
+            similarity = jaccard(record_shingles, shingles(text))
+            if similarity >= self._min_hasher.threshold and (best is None or similarity > best[0]):
+                best = (similarity, candidate_id, candidate_source)
+        return (best[1], best[2], True) if best is not None else None
+
+    def _source_key(self, file_path: str) -> str:
+        """Return the ``source`` metadata value used for a file path."""
+        if self._source_root is not None:
+            relative = os.path.relpath(os.path.abspath(file_path), self._source_root)
+            if not relative.startswith(".."):
+                return relative.replace(os.sep, "/")
+        return file_path.split("\\")[-1].split("/")[-1]
+
+    @staticmethod
+    def _hash_file(file_path: str) -> str:
+        """Compute the SHA-256 digest of a file's raw bytes."""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
@@ -0,0 +1,206 @@
+"""Background import jobs.
+
+This module defines the ImportJobManager class, which runs imports on a
+background worker so a large upload does not hold a web request (and one
+of its server workers) for the whole load, embed and write run. Callers
+submit files, get a job ID back immediately and poll the job for status
+and progress.
+
+Incremental jobs write to the live stores in place. Chunks are upserted
+under deterministic IDs and stale chunks are only deleted once a file
+has been re-imported, so chat keeps answering from the existing records
+throughout.
+
+Full jobs rebuild the knowledge base from scratch. They are imported into
+empty staging stores while chat keeps serving the live ones, and the
+staging stores replace the live stores only once the import succeeded.
+A failed full job discards its staging stores and leaves the live stores
+untouched.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+from knowledge_chat.application.import_files_use_case import ImportFilesUseCase
+from knowledge_chat.domain.entities.import_job import ImportJob
+from knowledge_chat.domain.entities.import_progress import ImportProgress
+from knowledge_chat.domain.entities.import_stats import ImportStats
+from knowledge_chat.domain.interfaces.lexical_index import LexicalIndex
+from knowledge_chat.domain.interfaces.parent_document_store import \
+    ParentDocumentStore
+from knowledge_chat.domain.interfaces.vector_store import VectorStore
+
+# Finished jobs kept for polling; older ones are forgotten.
+_MAX_FINISHED_JOBS = 100
+
+
+class ImportJobManager:
+    """Queue of import jobs that run one at a time in the background."""
+
+    def __init__(
+        self,
+        import_use_case: ImportFilesUseCase,
+        vector_store: VectorStore,
+        parent_store: ParentDocumentStore | None = None,
+        lexical_index: LexicalIndex | None = None,
+    ) -> None:
+        """Initialize the manager; its worker thread starts on first submit.
+
+        Args:
+            import_use_case (ImportFilesUseCase): Use case bound to the live
+                stores.
+            vector_store (VectorStore): The live vector store, replaced by
+                the staging store of a successful full job.
+            parent_store (ParentDocumentStore | None): The live parent store,
+                if the import writes parents.
+            lexical_index (LexicalIndex | None): The live lexical index, if
+                the import maintains one.
+        """
+        self._import_use_case = import_use_case
+        self._vector_store = vector_store
+        self._parent_store = parent_store
+        self._lexical_index = lexical_index
+        self._jobs: "OrderedDict[str, ImportJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Jobs run one at a time: they share the stores and the embedding quota.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="import-job")
+
+    def submit(self, file_paths: List[str], incremental: bool = True) -> str:
+        """Queue an import and return without waiting for it.
+
+        Args:
+            file_paths (List[str]): Paths of the files to import.
+            incremental (bool, optional): When True, only new or changed
+                files are imported into the live stores. When False, the
+                knowledge base is rebuilt in staging stores that replace the
+                live ones on success. Defaults to True.
+
+        Returns:
+            str: The ID of the queued job.
+
+        Raises:
+            ValueError: If no file paths are provided.
+        """
+        if not file_paths:
+            raise ValueError("At least one file path must be provided.")
+
+        job = ImportJob(
+            job_id=uuid.uuid4().hex,
+            files=len(file_paths),
+            incremental=incremental,
+            submitted_at=time.time(),
+        )
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._forget_finished_jobs()
+        self._executor.submit(self._run, job.job_id, list(file_paths), incremental)
+        return job.job_id
+
+    def get(self, job_id: str) -> ImportJob | None:
+        """Return a snapshot of a job.
+
+        Args:
+            job_id (str): The ID returned by ``submit``.
+
+        Returns:
+            ImportJob | None: The job, or None if it is unknown.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.model_copy(deep=True) if job is not None else None
+
+    def list_jobs(self) -> List[ImportJob]:
+        """Return snapshots of the known jobs, oldest first.
+
+        Returns:
+            List[ImportJob]: Queued, running and recently finished jobs.
+        """
+        with self._lock:
+            return [job.model_copy(deep=True) for job in self._jobs.values()]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and optionally wait for queued ones.
+
+        Args:
+            wait (bool, optional): Whether to block until queued jobs have
+                finished. Defaults to True.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    # -----------------------------------------------------
+    # Private helper methods
+    # -----------------------------------------------------
+
+    def _run(self, job_id: str, file_paths: List[str], incremental: bool) -> None:
+        """Run one job and record its outcome."""
+        self._update(job_id, status="running", started_at=time.time())
+
+        def report(event: ImportProgress) -> None:
+            self._update(job_id, progress=event.model_copy())
+
+        try:
+            if incremental:
+                stats = self._import_use_case.invoke(
+                    file_paths, incremental=True, progress_callback=report
+                )
+            else:
+                stats = self._rebuild(file_paths, report)
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            self._update(job_id, status="failed", error=str(e), finished_at=time.time())
+            return
+        self._update(job_id, status="succeeded", stats=stats, finished_at=time.time())
+
+    def _rebuild(
+        self,
+        file_paths: List[str],
+        report: Callable[[ImportProgress], None],
+    ) -> ImportStats:
+        """Import into staging stores and swap them in on success."""
+        staging_vectors = self._vector_store.create_staging()
+        staging_parents = (
+            self._parent_store.create_staging() if self._parent_store is not None else None
+        )
+        staging_lexical = (
+            self._lexical_index.create_staging() if self._lexical_index is not None else None
+        )
+        try:
+            stats = self._import_use_case.with_stores(
+                staging_vectors, staging_parents, staging_lexical
+            ).invoke(file_paths, incremental=False, progress_callback=report)
+        except BaseException:
+            self._vector_store.discard_staging(staging_vectors)
+            if staging_parents is not None:
+                self._parent_store.discard_staging(staging_parents)
+            if staging_lexical is not None:
+                self._lexical_index.discard_staging(staging_lexical)
+            raise
+
+        # Parents first: chat falls back to the chunk text for a missing
+        # parent, but new chunks must not point at parents that do not exist.
+        # Lexical hits missing from the vector store are skipped, so the
+        # lexical index can go before the vectors as well.
+        if staging_parents is not None:
+            self._parent_store.promote_staging(staging_parents)
+        if staging_lexical is not None:
+            self._lexical_index.promote_staging(staging_lexical)
+        self._vector_store.promote_staging(staging_vectors)
+        return stats
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        """Set fields of a job under the lock."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                for name, value in fields.items():
+                    setattr(job, name, value)
+
+    def _forget_finished_jobs(self) -> None:
+        """Drop the oldest finished jobs beyond the retention limit."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished]
+        for job_id in finished[:max(0, len(finished) - _MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
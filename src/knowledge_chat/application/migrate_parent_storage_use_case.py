@@ -0,0 +1,112 @@
+"""Use case for migrating legacy collections to the chunk/parent layout.
+
+Collections imported before the parent document store existed keep the
+full page text as the ``document`` of every chunk record, and the chunk
+text itself was never stored. This use case rebuilds each chunk's text by
+re-chunking its page with the configured chunker and picking the record's
+``chunk_index``, stores the page once in the parent document store, and
+rewrites the record in place. Embeddings are not touched, so no embedding
+calls are made.
+
+The chunker must be configured exactly as it was at import time, otherwise
+the recovered chunk texts will not match the stored embeddings.
+"""
+
+from typing import Any, Dict, List
+
+from knowledge_chat.application.record_ids import parent_id, text_hash
+from knowledge_chat.domain.interfaces.document_chunker import DocumentChunker
+from knowledge_chat.domain.interfaces.parent_document_store import \
+    ParentDocumentStore
+from knowledge_chat.domain.interfaces.vector_store import VectorStore
+
+_CHUNK_CACHE_SIZE = 1000
+
+
+class MigrateParentStorageUseCase:
+    """Application use case that converts legacy records to chunk/parent storage."""
+
+    def __init__(
+        self,
+        chunker: DocumentChunker,
+        vector_store: VectorStore,
+        parent_store: ParentDocumentStore,
+    ) -> None:
+        """Initialize the use case with its dependencies.
+
+        Args:
+            chunker (DocumentChunker): The chunker used for the original import.
+            vector_store (VectorStore): The collection to migrate.
+            parent_store (ParentDocumentStore): Destination for parent texts.
+        """
+        self._chunker = chunker
+        self._vector_store = vector_store
+        self._parent_store = parent_store
+
+    # -----------------------------------------------------
+    # Public entry point
+    # -----------------------------------------------------
+
+    def invoke(self, batch_size: int = 500) -> int:
+        """Migrate every legacy record of the collection.
+
+        Records that already carry a ``parent_id`` are skipped, so the
+        migration can be re-run safely after an interruption.
+
+        Args:
+            batch_size (int, optional): Number of records read and rewritten
+                per round trip. Defaults to 500.
+
+        Returns:
+            int: Number of records that were migrated.
+        """
+        migrated = 0
+        # Pages are shared by many chunks; chunk each page only once.
+        chunk_cache: Dict[str, List[str]] = {}
+
+        for batch in self._vector_store.iter_documents(batch_size=batch_size):
+            ids: List[str] = []
+            documents: List[str] = []
+            metadatas: List[Dict[str, Any]] = []
+            parents: Dict[str, tuple[str, str]] = {}
+
+            for record_id, page_text, meta in zip(
+                batch["ids"], batch["documents"], batch["metadatas"]
+            ):
+                meta = dict(meta or {})
+                if "parent_id" in meta or page_text is None:
+                    continue
+
+                page_hash = text_hash(page_text)
+                if page_hash not in chunk_cache:
+                    if len(chunk_cache) >= _CHUNK_CACHE_SIZE:
+                        chunk_cache.clear()
+                    chunk_cache[page_hash] = self._chunker.chunk_text(page_text)
+                chunks = chunk_cache[page_hash]
+
+                chunk_index = int(meta.get("chunk_index", 0))
+                if chunk_index >= len(chunks):
+                    continue
+
+                source = meta.get("source", "")
+                record_parent_id = parent_id(source, page_text)
+                parents[record_parent_id] = (source, page_text)
+
+                meta["parent_id"] = record_parent_id
+                meta["chunk_hash"] = text_hash(chunks[chunk_index])
+                ids.append(record_id)
+                documents.append(chunks[chunk_index])
+                metadatas.append(meta)
+
+            if not ids:
+                continue
+
+            self._parent_store.add_parents(
+                parent_ids=list(parents),
+                sources=[source for source, _ in parents.values()],
+                texts=[text for _, text in parents.values()],
+            )
+            self._vector_store.update_documents(ids=ids, documents=documents, metadatas=metadatas)
+            migrated += len(ids)
+
+        return migrated
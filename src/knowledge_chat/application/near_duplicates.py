@@ -0,0 +1,146 @@
+"""Helpers for detecting near-duplicate chunks with MinHash and LSH.
+
+Two chunks are near duplicates when the Jaccard similarity of their word
+shingles reaches a threshold. Comparing every pair is quadratic, so each
+chunk gets a MinHash signature that is split into bands; chunks sharing
+any band key are candidates, and only candidates are compared exactly.
+The number of bands and rows per band is chosen so that pairs at the
+threshold are found with high probability.
+
+Band keys are persisted with the chunks, so hashing is seeded and must
+stay stable across processes and releases.
+"""
+
+import hashlib
+import re
+from typing import List, Set, Tuple
+
+import numpy as np
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_SEED = 1
+_SHINGLE_SIZE = 3
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def shingles(text: str) -> Set[str]:
+    """Return the lower-cased word 3-grams of a text.
+
+    Texts shorter than three words yield their words joined as a single
+    shingle.
+
+    Args:
+        text (str): The text to shingle.
+
+    Returns:
+        Set[str]: The distinct shingles.
+    """
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) < _SHINGLE_SIZE:
+        return {" ".join(words)} if words else set()
+    return {
+        " ".join(words[i:i + _SHINGLE_SIZE])
+        for i in range(len(words) - _SHINGLE_SIZE + 1)
+    }
+
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    """Return the Jaccard similarity of two shingle sets.
+
+    Args:
+        first (Set[str]): Shingles of the first text.
+        second (Set[str]): Shingles of the second text.
+
+    Returns:
+        float: Similarity between 0 and 1; 0 if both sets are empty.
+    """
+    if not first and not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def choose_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """Pick the band count and rows per band for a similarity threshold.
+
+    Minimizes the sum of the false positive probability below the
+    threshold and the false negative probability above it.
+
+    Args:
+        threshold (float): Jaccard similarity from which pairs should match.
+        num_perm (int): Number of MinHash permutations.
+
+    Returns:
+        Tuple[int, int]: ``(bands, rows)`` with ``bands * rows <= num_perm``.
+    """
+    steps = 100
+
+    def candidate_probability(similarity: float, bands: int, rows: int) -> float:
+        return 1.0 - (1.0 - similarity ** rows) ** bands
+
+    best: Tuple[float, int, int] | None = None
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            false_positive = sum(
+                candidate_probability(threshold * (i + 0.5) / steps, bands, rows)
+                for i in range(steps)
+            ) * threshold / steps
+            false_negative = sum(
+                1.0 - candidate_probability(threshold + (1 - threshold) * (i + 0.5) / steps, bands, rows)
+                for i in range(steps)
+            ) * (1 - threshold) / steps
+            error = false_positive + false_negative
+            if best is None or error < best[0]:
+                best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class MinHasher:
+    """Computes MinHash band keys of texts for LSH candidate lookup."""
+
+    def __init__(self, threshold: float = 0.9, num_perm: int = 64) -> None:
+        """Initialize the hasher.
+
+        Args:
+            threshold (float): Jaccard similarity from which two texts are
+                treated as near duplicates.
+            num_perm (int): Number of MinHash permutations. More permutations
+                estimate similarity more precisely but add metadata fields.
+        """
+        self.threshold = threshold
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+        generator = np.random.RandomState(_SEED)
+        self._a = generator.randint(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+    def band_keys(self, text_shingles: Set[str]) -> List[str]:
+        """Return one key per band of the text's MinHash signature.
+
+        Args:
+            text_shingles (Set[str]): Shingles of the text, from ``shingles``.
+
+        Returns:
+            List[str]: ``bands`` hex keys, or an empty list for a text
+                without shingles.
+        """
+        if not text_shingles:
+            return []
+        hashes = np.fromiter(
+            (
+                int.from_bytes(
+                    hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "little"
+                )
+                for shingle in text_shingles
+            ),
+            dtype=np.uint64,
+            count=len(text_shingles),
+        )
+        # Universal hashing (a * x + b) mod p, one row per permutation.
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME & _MAX_HASH
+        signature = permuted.min(axis=1).astype(np.uint32)
+        return [
+            hashlib.blake2b(
+                signature[band * self.rows:(band + 1) * self.rows].tobytes(), digest_size=8
+            ).hexdigest()
+            for band in range(self.bands)
+        ]
@@ -0,0 +1,84 @@
+"""Helpers for building streaming, multi-stage pipelines.
+
+Each stage is a plain generator. ``run_in_thread`` moves a stage onto its
+own worker thread and connects it to the next stage through a bounded
+queue, so stages overlap while the number of in-flight items (and thus
+memory use) stays fixed regardless of input size.
+"""
+
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+_POLL_SECONDS = 0.1
+
+
+class _StageError:
+    """Wraps an exception raised inside a stage so it can cross the queue."""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def run_in_thread(stage: Iterable[T], maxsize: int = 4, name: str = "pipeline-stage") -> Iterator[T]:
+    """Iterate ``stage`` on a background thread and yield its items.
+
+    At most ``maxsize`` items are buffered between the producer and the
+    consumer; the producer blocks while the buffer is full. Exceptions
+    raised by the stage are re-raised in the consumer. Closing the returned
+    iterator early (or an error in the consumer) stops the producer.
+
+    Args:
+        stage (Iterable[T]): The iterable (usually a generator) to run.
+        maxsize (int, optional): Capacity of the queue between the stage
+            and the consumer. Defaults to 4.
+        name (str, optional): Name of the worker thread. Defaults to
+            "pipeline-stage".
+
+    Yields:
+        T: The items produced by ``stage``, in order.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+    stopped = threading.Event()
+
+    def put(item: object) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        iterator = iter(stage)
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+        # pylint: disable=broad-exception-caught
+        except BaseException as e:
+            put(_StageError(e))
+            return
+        finally:
+            # Propagate the shutdown to upstream stages held by a generator.
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        put(_DONE)
+
+    worker = threading.Thread(target=produce, name=name, daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _StageError):
+                raise item.error
+            yield item
+    finally:
+        stopped.set()
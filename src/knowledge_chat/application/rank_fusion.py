@@ -0,0 +1,33 @@
+"""Reciprocal-rank fusion of ranked retrieval results.
+
+Scores of different retrievers (cosine distances, BM25 scores) are not
+comparable, but their ranks are. Reciprocal-rank fusion gives every
+result ``1 / (k + rank)`` per ranking it appears in and sorts by the sum,
+so results found by several retrievers rise to the top while a strong
+hit of a single retriever still ranks well. ``k`` damps the influence of
+the first ranks; 60 is the value of the original paper.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[str]],
+    k: int = 60,
+) -> List[Tuple[str, float]]:
+    """Fuse several rankings of IDs into one.
+
+    Args:
+        rankings (Sequence[Sequence[str]]): IDs of every retriever, best
+            first.
+        k (int, optional): Rank damping constant. Defaults to 60.
+
+    Returns:
+        List[Tuple[str, float]]: ``(id, fused score)`` pairs, best first.
+            Ties keep the order in which IDs were first seen.
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, record_id in enumerate(ranking, start=1):
+            scores[record_id] = scores.get(record_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
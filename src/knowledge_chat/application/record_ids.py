@@ -0,0 +1,53 @@
+"""Helpers for deriving stable identifiers of stored records.
+
+Identifiers are content-derived, so importing the same text twice
+always produces the same ID.
+"""
+
+import hashlib
+
+
+def text_hash(text: str) -> str:
+    """Return the SHA-256 hex digest of a text.
+
+    Args:
+        text (str): The text to hash.
+
+    Returns:
+        str: The hex digest.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def parent_id(source: str, text: str) -> str:
+    """Return the identifier of a parent document (a page or whole file).
+
+    Args:
+        source (str): The source file name of the parent.
+        text (str): The full parent text.
+
+    Returns:
+        str: A 32-character hex identifier.
+    """
+    return hashlib.sha256(f"{source}\0{text}".encode("utf-8")).hexdigest()[:32]
+
+
+def chunk_id(source: str, document_index: int, chunk_index: int, text: str) -> str:
+    """Return the identifier of a chunk record.
+
+    The ID only changes when the chunk's position or content changes, so
+    re-importing a file rewrites nothing that is already stored and an
+    interrupted import can be resumed without creating duplicates.
+
+    Args:
+        source (str): The source file name of the chunk.
+        document_index (int): Position of the chunk's document (page,
+            record) within the source file.
+        chunk_index (int): Position of the chunk within its document.
+        text (str): The chunk text.
+
+    Returns:
+        str: A 32-character hex identifier.
+    """
+    key = f"{source}\0{document_index}\0{chunk_index}\0{text_hash(text)}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
@@ -0,0 +1,127 @@
+"""Distance-based gating of the LLM rerank step.
+
+Retrieval already returns the cosine distance of every hit, so most turns
+can be decided without asking the LLM which chunks are relevant:
+
+1. Hits farther than ``reject_distance`` are dropped. If none remain, the
+   turn has no relevant context.
+2. If every remaining hit is within ``accept_distance``, all of them are
+   accepted.
+3. If the best hit is within ``accept_distance`` and the closest hit
+   outside it is at least ``min_gap`` farther away than the best one, the
+   confident hits are accepted and the ambiguous ones dropped.
+4. Otherwise the turn is ambiguous and the remaining hits go to the LLM
+   reranker.
+
+Thresholds depend on the embedding model and should be tuned on real
+questions.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import List, Sequence
+
+from knowledge_chat.domain.entities.relevance_gate_stats import \
+    RelevanceGateStats
+
+
+@dataclass
+class GateDecision:
+    """Outcome of the relevance gate for one retrieval.
+
+    Attributes:
+        action (str): "accept" to use ``indices`` as they are, "reject"
+            when no hit is relevant, or "rerank" to let the LLM choose
+            among ``indices``.
+        indices (List[int]): Positions of the retrieved hits to keep or to
+            rerank, in retrieval order.
+    """
+
+    action: str
+    indices: List[int] = field(default_factory=list)
+
+
+class RelevanceGate:
+    """Decides from vector distances whether the LLM reranker is needed."""
+
+    def __init__(
+        self,
+        accept_distance: float = 0.35,
+        reject_distance: float = 0.65,
+        min_gap: float = 0.1,
+    ) -> None:
+        """Initialize the gate.
+
+        Args:
+            accept_distance (float): Hits at most this far from the query
+                are confidently relevant.
+            reject_distance (float): Hits farther than this from the query
+                are never relevant.
+            min_gap (float): Distance between the best hit and the closest
+                ambiguous hit from which the ambiguous hits are dropped
+                without reranking.
+        """
+        if accept_distance > reject_distance:
+            raise ValueError("accept_distance must not be larger than reject_distance.")
+        self._accept_distance = accept_distance
+        self._reject_distance = reject_distance
+        self._min_gap = min_gap
+        self._lock = threading.Lock()
+        self._stats = RelevanceGateStats()
+
+    def decide(self, distances: Sequence[float]) -> GateDecision:
+        """Decide which retrieved hits to use for one turn.
+
+        Args:
+            distances (Sequence[float]): Cosine distance of each retrieved
+                hit, in retrieval order.
+
+        Returns:
+            GateDecision: The action and the hits it applies to.
+        """
+        kept = [i for i, distance in enumerate(distances) if distance <= self._reject_distance]
+        dropped = len(distances) - len(kept)
+        if not kept:
+            return self._record(GateDecision(action="reject"), dropped)
+
+        confident = [i for i in kept if distances[i] <= self._accept_distance]
+        ambiguous = [i for i in kept if distances[i] > self._accept_distance]
+        if not ambiguous:
+            return self._record(GateDecision(action="accept", indices=kept), dropped)
+
+        if confident:
+            best = min(distances[i] for i in confident)
+            closest_ambiguous = min(distances[i] for i in ambiguous)
+            if closest_ambiguous - best >= self._min_gap:
+                return self._record(
+                    GateDecision(action="accept", indices=confident),
+                    dropped + len(ambiguous),
+                )
+
+        return self._record(GateDecision(action="rerank", indices=kept), dropped)
+
+    def stats(self) -> RelevanceGateStats:
+        """Return a snapshot of the gate counters.
+
+        Returns:
+            RelevanceGateStats: Decisions per action and the skip rate.
+        """
+        with self._lock:
+            return self._stats.model_copy()
+
+    # -----------------------------------------------------
+    # Private helper methods
+    # -----------------------------------------------------
+
+    def _record(self, decision: GateDecision, dropped: int) -> GateDecision:
+        """Count a decision and return it."""
+        with self._lock:
+            self._stats.turns += 1
+            self._stats.dropped_documents += dropped
+            if decision.action == "accept":
+                self._stats.accepted += 1
+            elif decision.action == "reject":
+                self._stats.rejected += 1
+            else:
+                self._stats.reranked += 1
+        return decision
@@ -20,16 +20,132 @@ class Settings(BaseSettings):
         openai_embedding_base_url (str): Base URL for OpenAI embedding API.
         openai_embedding_key (str): API key for OpenAI embedding service.
         openai_embedding_model (str): Embedding model name.
+        openai_embedding_dimensions (int): Size of the requested embeddings
+            for models that can shorten them (text-embedding-3-*); 0 keeps
+            the model's full size. A collection keeps the size it was built
+            with, so changing it requires a full import.
+        openai_embedding_batch_tokens (int): Estimated token budget of a
+            single embeddings request.
+        openai_embedding_concurrency (int): Embeddings requests sent in
+            parallel.
+        openai_embedding_requests_per_minute (int): Request rate limit; 0
+            disables it.
+        openai_embedding_tokens_per_minute (int): Token rate limit; 0
+            disables it.
+        openai_embedding_max_retries (int): Retries of a request after a
+            429, 5xx or connection error.
 
+        embedding_cache_enabled (bool): Cache embeddings on disk, keyed by
+            model and text hash, so identical texts are embedded only once.
+        embedding_cache_path (str): Path to the SQLite embedding cache file.
+        embedding_cache_max_mb (int): Size limit of the cached vectors in
+            MiB; least recently used entries are evicted beyond it.
+
+        vector_store_backend (str): Vector store implementation, "chroma"
+            or "numpy".
         chroma_db_path (str): Path to the local Chroma database directory.
-        chromadb_collection_name (str): Collection name for Chroma vector DB.
+        chromadb_collection_name (str): Collection name for Chroma vector DB;
+            the NumPy store uses it as well.
+        numpy_store_path (str): Directory of the memory-mapped NumPy store.
+        numpy_store_dtype (str): Storage type of new NumPy store matrices,
+            "float32" or "float16" (half the size, slower to query).
+        numpy_store_quantization (str): Compact codes the NumPy store scans
+            before re-scoring the best candidates exactly: "none", "int8"
+            (a quarter of the float32 size) or "binary" (one bit per
+            dimension).
+        numpy_store_rescore_factor (int): Candidates per requested result
+            that are re-scored against the full-precision rows.
+        parent_store_path (str): Path to the SQLite file holding parent texts.
+        lexical_index_enabled (bool): Keep a BM25 full-text index of every
+            chunk and fuse its hits with the vector hits in chat.
+        lexical_index_path (str): SQLite file holding the lexical index.
+        lexical_index_max_segments (int): Number of index segments above
+            which the smallest ones are merged.
 
         hf_token (str): Hugging Face API token.
         hf_tts_model (str): Model name for Hugging Face text-to-speech.
 
-        chunker_chunk_size (int): Maximum number of characters per chunk.
-        chunker_chunk_overlap (int): Overlapping characters between chunks.
+        chunker_chunk_size (int): Maximum size per chunk, in characters or,
+            with a tokenizer, in tokens.
+        chunker_chunk_overlap (int): Overlapping size between chunks.
         chunker_separators (List[str]): List of separators for chunking.
+        chunker_backend (str): Chunker implementation, "langchain" or "fast".
+        chunker_tokenizer (str): Tokenizer file or Hugging Face model name
+            used by the fast chunker to size chunks in tokens; empty sizes
+            chunks in characters.
+        chunker_max_workers (int): Worker processes the fast chunker uses to
+            split many documents at once.
+        chunker_structure_aware (bool): Split Markdown by heading and JSON
+            by record, packing whole sections into chunks.
+
+        loader_max_workers (int): Worker processes used to load files in
+            parallel; 1 loads files on the importing thread.
+        pdf_backend (str): PDF extraction backend, "pypdf" or "pymupdf".
+        pdf_max_workers (int): Worker processes the pymupdf backend uses to
+            extract pages of a single large PDF.
+        pdf_parallel_min_pages (int): Minimum page count for parallel
+            page extraction.
+        json_record_path (str): Path of the JSON records loaded as separate
+            documents (e.g. "$.*"); empty loads each JSON file whole.
+
+        import_embedding_batch_size (int): Chunks embedded and written per batch.
+        import_queue_size (int): Capacity of the queues between import stages.
+        import_dedup_enabled (bool): Store chunks that duplicate a stored
+            chunk only once.
+        import_dedup_threshold (float): Jaccard similarity of word shingles
+            from which chunks count as duplicates; 1.0 only deduplicates
+            identical chunks.
+
+        watch_debounce_ms (int): Quiet period after which a burst of file
+            changes is synced, in milliseconds.
+        watch_force_polling (bool): Poll watched directories instead of
+            using native file system notifications.
+        watch_poll_interval_ms (int): Interval between scans when polling.
+
+        chat_expand_to_parent (bool): Send the full parent text of each
+            relevant chunk to the LLM instead of the chunk alone.
+        query_batching_enabled (bool): Coalesce concurrent chat query
+            embeddings into shared embedding calls.
+        query_batch_window_ms (float): How long a query batch stays open
+            for further queries, in milliseconds.
+        query_batch_max_size (int): Maximum number of queries per batch.
+        query_cache_enabled (bool): Keep chat query embeddings in an
+            in-memory LRU cache keyed by normalized query text.
+        query_cache_ttl_seconds (float): Time after which a cached query
+            is embedded again; 0 disables expiry.
+        query_cache_max_entries (int): Maximum number of cached queries.
+        query_cache_max_mb (int): Maximum size of the cached query vectors.
+        query_cache_path (str): SQLite file shared by every worker process
+            that backs the in-memory cache; empty disables it.
+        rerank_gate_enabled (bool): Decide clear retrieval results from
+            their vector distances and only rerank ambiguous ones with the
+            LLM.
+        rerank_gate_accept_distance (float): Cosine distance up to which a
+            retrieved chunk is accepted without reranking.
+        rerank_gate_reject_distance (float): Cosine distance beyond which a
+            retrieved chunk is dropped without reranking.
+        rerank_gate_min_gap (float): Distance between the best hit and the
+            closest ambiguous hit from which ambiguous hits are dropped
+            without reranking.
+        reranker_backend (str): Reranker of ambiguous retrieval results:
+            "llm" (a rerank prompt to the chat model), "cross_encoder" (a
+            local ONNX cross-encoder) or "lexical" (query word overlap).
+        reranker_model_path (str): Directory holding ``model.onnx`` and
+            ``tokenizer.json`` of the cross-encoder.
+        reranker_score_threshold (float): Minimum reranker score, between
+            0 and 1, of a document to be kept.
+        reranker_batch_size (int): Query-document pairs per model call.
+        reranker_max_workers (int): Model calls running at the same time.
+        reranker_max_length (int): Maximum number of tokens per pair.
+        hybrid_rrf_k (int): Rank damping constant of the reciprocal-rank
+            fusion of vector and lexical hits.
+        answer_cache_enabled (bool): Answer single-turn questions close to
+            an earlier question from the semantic answer cache.
+        answer_cache_max_distance (float): Largest cosine distance between
+            two questions for them to share an answer.
+        answer_cache_max_entries (int): Maximum number of cached answers.
+        answer_cache_ttl_seconds (float): Time after which a cached answer
+            is generated again; 0 disables expiry.
     """
 
     # ----------------- OpenAI Configuration -----------------
@@ -40,15 +156,85 @@ class Settings(BaseSettings):
     openai_embedding_base_url: str
     openai_embedding_key: str
     openai_embedding_model: str = "text-embedding-3-small"
+    openai_embedding_dimensions: int = 0
+    openai_embedding_batch_tokens: int = 4096
+    openai_embedding_concurrency: int = 4
+    openai_embedding_requests_per_minute: int = 3000
+    openai_embedding_tokens_per_minute: int = 1_000_000
+    openai_embedding_max_retries: int = 5
+
+    # ----------------- Embedding Cache Configuration -----------------
+    embedding_cache_enabled: bool = True
+    embedding_cache_path: str = "./data/embedding_cache.sqlite3"
+    embedding_cache_max_mb: int = 512
 
     # ----------------- Vector Database Configuration -----------------
+    vector_store_backend: str = "chroma"
     chroma_db_path: str = "./data/chroma_db"
     chromadb_collection_name: str = "it_helpdesk_documents"
+    numpy_store_path: str = "./data/numpy_store"
+    numpy_store_dtype: str = "float32"
+    numpy_store_quantization: str = "none"
+    numpy_store_rescore_factor: int = 10
+    parent_store_path: str = "./data/parent_store.sqlite3"
+
+    # ----------------- Lexical Index Configuration -----------------
+    lexical_index_enabled: bool = False
+    lexical_index_path: str = "./data/lexical_index.sqlite3"
+    lexical_index_max_segments: int = 16
 
     # ----------------- Chunker Configuration -----------------
     chunker_chunk_size: int = 1000
     chunker_chunk_overlap: int = 200
     chunker_separators: List[str] = ["\n\n", "\n", ".", " ", ""]
+    chunker_backend: str = "langchain"
+    chunker_tokenizer: str = ""
+    chunker_max_workers: int = 1
+    chunker_structure_aware: bool = False
+
+    # ----------------- Document Loader Configuration -----------------
+    loader_max_workers: int = 1
+    pdf_backend: str = "pypdf"
+    pdf_max_workers: int = 1
+    pdf_parallel_min_pages: int = 64
+    json_record_path: str = ""
+
+    # ----------------- Import Configuration -----------------
+    import_embedding_batch_size: int = 64
+    import_queue_size: int = 4
+    import_dedup_enabled: bool = False
+    import_dedup_threshold: float = 0.9
+
+    # ----------------- Watch Configuration -----------------
+    watch_debounce_ms: int = 1600
+    watch_force_polling: bool = False
+    watch_poll_interval_ms: int = 1000
+
+    # ----------------- Chat Configuration -----------------
+    chat_expand_to_parent: bool = False
+    query_batching_enabled: bool = True
+    query_batch_window_ms: float = 5.0
+    query_batch_max_size: int = 32
+    query_cache_enabled: bool = True
+    query_cache_ttl_seconds: float = 3600.0
+    query_cache_max_entries: int = 10_000
+    query_cache_max_mb: int = 64
+    query_cache_path: str = ""
+    rerank_gate_enabled: bool = False
+    rerank_gate_accept_distance: float = 0.35
+    rerank_gate_reject_distance: float = 0.65
+    rerank_gate_min_gap: float = 0.1
+    reranker_backend: str = "llm"
+    reranker_model_path: str = ""
+    reranker_score_threshold: float = 0.5
+    reranker_batch_size: int = 16
+    reranker_max_workers: int = 2
+    reranker_max_length: int = 512
+    hybrid_rrf_k: int = 60
+    answer_cache_enabled: bool = False
+    answer_cache_max_distance: float = 0.05
+    answer_cache_max_entries: int = 1000
+    answer_cache_ttl_seconds: float = 86400.0
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,28 @@
+"""Dependency provider for the semantic answer cache.
+
+This module defines a factory function that initializes and returns
+a SemanticAnswerCache using application settings, or None when answer
+caching is disabled.
+"""
+
+from knowledge_chat.config.settings import Settings
+from knowledge_chat.domain.interfaces.answer_cache import AnswerCache
+from knowledge_chat.infrastructure.answer_cache.semantic_answer_cache import \
+    SemanticAnswerCache
+
+
+def get_answer_cache() -> AnswerCache | None:
+    """Create and return the configured answer cache.
+
+    Returns:
+        AnswerCache | None: An in-memory semantic answer cache, or None
+            when ``answer_cache_enabled`` is off.
+    """
+    settings = Settings()
+    if not settings.answer_cache_enabled:
+        return None
+    return SemanticAnswerCache(
+        max_distance=settings.answer_cache_max_distance,
+        max_entries=settings.answer_cache_max_entries,
+        ttl_seconds=settings.answer_cache_ttl_seconds,
+    )
@@ -1,29 +1,63 @@
 """Dependency provider for the document chunker.
 
 This module defines a factory function that initializes and returns
-an instance of RecursiveCharacterChunker using application settings.
+the document chunker selected in the application settings.
 """
 
 from knowledge_chat.config.settings import Settings
 from knowledge_chat.domain.interfaces.document_chunker import DocumentChunker
+from knowledge_chat.infrastructure.chunking.fast_recursive_chunker import \
+    FastRecursiveChunker
 from knowledge_chat.infrastructure.chunking.recursive_character_chunker import \
     RecursiveCharacterChunker
+from knowledge_chat.infrastructure.chunking.structure_aware_chunker import \
+    StructureAwareChunker
 
 
 def get_chunker() -> DocumentChunker:
-    """Create and return a configured RecursiveCharacterChunker instance.
+    """Create and return the configured document chunker.
 
     Loads chunking configuration from environment variables via the
-    Settings class to avoid hard-coded values.
+    Settings class to avoid hard-coded values. ``chunker_backend`` selects
+    the LangChain-based RecursiveCharacterChunker or the
+    FastRecursiveChunker, which can also size chunks in tokens. With
+    ``chunker_structure_aware`` the chunker is wrapped in a
+    StructureAwareChunker that splits Markdown and JSON by section.
 
     Returns:
         DocumentChunker: A configured chunker ready for use in the
             ingestion pipeline.
+
+    Raises:
+        ValueError: If the chunker backend is unknown.
     """
     settings = Settings()
 
-    return RecursiveCharacterChunker(
+    if settings.chunker_backend == "langchain":
+        chunker: DocumentChunker = RecursiveCharacterChunker(
+            chunk_size=settings.chunker_chunk_size,
+            chunk_overlap=settings.chunker_chunk_overlap,
+            separators=list(settings.chunker_separators),
+        )
+    elif settings.chunker_backend == "fast":
+        chunker = FastRecursiveChunker(
+            chunk_size=settings.chunker_chunk_size,
+            chunk_overlap=settings.chunker_chunk_overlap,
+            separators=list(settings.chunker_separators),
+            tokenizer=settings.chunker_tokenizer or None,
+            max_workers=settings.chunker_max_workers,
+        )
+    else:
+        raise ValueError(
+            f"Unsupported chunker backend: {settings.chunker_backend}. "
+            "Supported backends: langchain, fast"
+        )
+
+    if not settings.chunker_structure_aware:
+        return chunker
+
+    return StructureAwareChunker(
+        fallback=chunker,
         chunk_size=settings.chunker_chunk_size,
-        chunk_overlap=settings.chunker_chunk_overlap,
-        separators=list(settings.chunker_separators),
+        length_function=chunker.length if isinstance(chunker, FastRecursiveChunker) else len,
     )
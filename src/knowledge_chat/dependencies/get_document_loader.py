@@ -7,9 +7,10 @@ Returns a MultiFormatLoader that supports multiple file types:
 - Plain text (.txt)
 - PDF documents (.pdf)
 - Markdown files (.md, .markdown)
-- JSON files (.json)
+- JSON files (.json) and JSON Lines files (.jsonl)
 """
 
+from knowledge_chat.config.settings import Settings
 from knowledge_chat.domain.interfaces.document_loader import DocumentLoader
 from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
     MultiFormatLoader
@@ -19,10 +20,17 @@ def get_document_loader() -> DocumentLoader:
     """Create and return a configured DocumentLoader instance.
 
     Returns a MultiFormatLoader that automatically detects file types
-    and uses the appropriate loader for each format.
+    and uses the appropriate loader for each format. The PDF backend and
+    the process pool sizes are read from the Settings class.
 
     Returns:
         DocumentLoader: An initialized multi-format loader for reading documents.
     """
-
-    return MultiFormatLoader()
+    settings = Settings()
+    return MultiFormatLoader(
+        max_workers=settings.loader_max_workers,
+        pdf_backend=settings.pdf_backend,
+        pdf_max_workers=settings.pdf_max_workers,
+        pdf_parallel_min_pages=settings.pdf_parallel_min_pages,
+        json_record_path=settings.json_record_path,
+    )
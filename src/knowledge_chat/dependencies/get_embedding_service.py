@@ -1,23 +1,36 @@
 """Dependency provider for the embedding service.
 
 This module defines a factory function that initializes and returns
-an instance of OpenAIEmbeddingService using application settings.
+an instance of OpenAIEmbeddingService using application settings,
+wrapped in a persistent CachedEmbeddingService when caching is enabled.
 """
 
 from knowledge_chat.config.settings import Settings
-from knowledge_chat.infrastructure.embedding_service.openai_embedding_service import \
-    OpenAIEmbeddingService
+from knowledge_chat.domain.interfaces.embedding_service import EmbeddingService
+from knowledge_chat.infrastructure.embedding_service.cached_embedding_service import \
+    CachedEmbeddingService
+from knowledge_chat.infrastructure.embedding_service.openai_embedding_service import (
+    OpenAIEmbeddingService, embedding_model_name)
 
 
-def get_embedding_service() -> OpenAIEmbeddingService:
-    """Create and return a configured OpenAIEmbeddingService instance.
+def get_embedding_service() -> EmbeddingService:
+    """Create and return a configured embedding service instance.
 
     Loads API credentials and configuration from environment variables
     via the Settings class.
 
     Returns:
-        OpenAIEmbeddingService: An initialized embedding service ready
-            for use in the application.
+        EmbeddingService: An initialized embedding service ready for use
+            in the application, backed by the on-disk embedding cache
+            unless it is disabled.
     """
     settings = Settings()
-    return OpenAIEmbeddingService(settings=settings)
+    embedding_service = OpenAIEmbeddingService(settings=settings)
+    if not settings.embedding_cache_enabled:
+        return embedding_service
+    return CachedEmbeddingService(
+        embedding_service=embedding_service,
+        model=embedding_model_name(settings),
+        cache_path=settings.embedding_cache_path,
+        max_bytes=settings.embedding_cache_max_mb * 1024 * 1024,
+    )
@@ -0,0 +1,25 @@
+"""Dependency provider for the file watcher.
+
+This module defines a factory function that initializes and returns
+a FileWatcher implementation using application settings.
+"""
+
+from knowledge_chat.config.settings import Settings
+from knowledge_chat.domain.interfaces.file_watcher import FileWatcher
+from knowledge_chat.infrastructure.file_watcher.watchfiles_file_watcher import \
+    WatchfilesFileWatcher
+
+
+def get_file_watcher() -> FileWatcher:
+    """Create and return a configured FileWatcher instance.
+
+    Returns:
+        FileWatcher: A watcher using native notifications, or polling when
+            configured or when native notifications are unavailable.
+    """
+    settings = Settings()
+    return WatchfilesFileWatcher(
+        debounce_ms=settings.watch_debounce_ms,
+        force_polling=settings.watch_force_polling,
+        poll_interval_ms=settings.watch_poll_interval_ms,
+    )
@@ -0,0 +1,27 @@
+"""Dependency provider for the lexical index.
+
+This module defines a factory function that initializes and returns
+a SQLiteBM25Index using application settings, or None when the lexical
+index is disabled.
+"""
+
+from knowledge_chat.config.settings import Settings
+from knowledge_chat.domain.interfaces.lexical_index import LexicalIndex
+from knowledge_chat.infrastructure.lexical_index.sqlite_bm25_index import \
+    SQLiteBM25Index
+
+
+def get_lexical_index() -> LexicalIndex | None:
+    """Create and return the configured lexical index.
+
+    Returns:
+        LexicalIndex | None: A BM25 index backed by SQLite, or None when
+            ``lexical_index_enabled`` is off.
+    """
+    settings = Settings()
+    if not settings.lexical_index_enabled:
+        return None
+    return SQLiteBM25Index(
+        settings=settings,
+        max_segments=settings.lexical_index_max_segments,
+    )
@@ -0,0 +1,24 @@
+"""Dependency provider for the parent document store.
+
+This module defines a factory function that initializes and returns
+an instance of SQLiteParentDocumentStore using application settings.
+"""
+
+from knowledge_chat.config.settings import Settings
+from knowledge_chat.domain.interfaces.parent_document_store import \
+    ParentDocumentStore
+from knowledge_chat.infrastructure.document_store.sqlite_parent_document_store import \
+    SQLiteParentDocumentStore
+
+
+def get_parent_document_store() -> ParentDocumentStore:
+    """Create and return a configured parent document store instance.
+
+    Loads the storage path from environment variables using the
+    Settings class.
+
+    Returns:
+        ParentDocumentStore: An initialized parent store backed by SQLite.
+    """
+    settings = Settings()
+    return SQLiteParentDocumentStore(settings=settings)
@@ -0,0 +1,62 @@
+"""Dependency provider for the query embedding service.
+
+This module defines a factory function that wraps the embedding service
+used for chat queries in a MicroBatchingEmbeddingService, so concurrent
+queries share embedding calls, and in a MemoryCachedEmbeddingService, so
+repeated queries are not embedded again.
+"""
+
+from knowledge_chat.config.settings import Settings
+from knowledge_chat.domain.interfaces.embedding_service import EmbeddingService
+from knowledge_chat.infrastructure.embedding_service.cached_embedding_service import \
+    CachedEmbeddingService
+from knowledge_chat.infrastructure.embedding_service.memory_cached_embedding_service import \
+    MemoryCachedEmbeddingService
+from knowledge_chat.infrastructure.embedding_service.micro_batching_embedding_service import \
+    MicroBatchingEmbeddingService
+from knowledge_chat.infrastructure.embedding_service.openai_embedding_service import \
+    embedding_model_name
+
+
+def get_query_embedding_service(embedding_service: EmbeddingService) -> EmbeddingService:
+    """Create the embedding service used on the chat query path.
+
+    Loads the batching and caching configuration from environment
+    variables using the Settings class. Imports keep using
+    ``embedding_service`` directly, as they already send large batches.
+
+    Queries are looked up in the in-memory cache first, then in the shared
+    on-disk query cache if one is configured; only the remaining misses
+    are batched and embedded.
+
+    Args:
+        embedding_service (EmbeddingService): Service that embeds each batch.
+
+    Returns:
+        EmbeddingService: ``embedding_service`` wrapped in the enabled
+            batching and caching layers.
+    """
+    settings = Settings()
+    service = embedding_service
+    if settings.query_batching_enabled:
+        service = MicroBatchingEmbeddingService(
+            embedding_service=service,
+            window_ms=settings.query_batch_window_ms,
+            max_batch_size=settings.query_batch_max_size,
+        )
+    if not settings.query_cache_enabled:
+        return service
+    if settings.query_cache_path:
+        service = CachedEmbeddingService(
+            embedding_service=service,
+            model=embedding_model_name(settings),
+            cache_path=settings.query_cache_path,
+            max_bytes=settings.query_cache_max_mb * 1024 * 1024,
+        )
+    return MemoryCachedEmbeddingService(
+        embedding_service=service,
+        model=embedding_model_name(settings),
+        ttl_seconds=settings.query_cache_ttl_seconds,
+        max_entries=settings.query_cache_max_entries,
+        max_bytes=settings.query_cache_max_mb * 1024 * 1024,
+    )
@@ -0,0 +1,46 @@
+"""Dependency provider for the document reranker.
+
+This module defines a factory function that initializes and returns
+the local reranker selected in the application settings, or None when
+reranking is left to the LLM.
+"""
+
+from knowledge_chat.config.settings import Settings
+from knowledge_chat.domain.interfaces.reranker import Reranker
+from knowledge_chat.infrastructure.reranker.cross_encoder_reranker import \
+    CrossEncoderReranker
+from knowledge_chat.infrastructure.reranker.lexical_reranker import \
+    LexicalReranker
+
+
+def get_reranker() -> Reranker | None:
+    """Create and return the configured reranker.
+
+    Returns:
+        Reranker | None: A CrossEncoderReranker or LexicalReranker, or
+            None when ``reranker_backend`` is "llm".
+
+    Raises:
+        ValueError: If the reranker backend is unknown or the cross-encoder
+            has no model path.
+    """
+    settings = Settings()
+
+    if settings.reranker_backend == "llm":
+        return None
+    if settings.reranker_backend == "cross_encoder":
+        if not settings.reranker_model_path:
+            raise ValueError("reranker_model_path is required for the cross_encoder reranker.")
+        return CrossEncoderReranker(
+            model_path=settings.reranker_model_path,
+            score_threshold=settings.reranker_score_threshold,
+            batch_size=settings.reranker_batch_size,
+            max_workers=settings.reranker_max_workers,
+            max_length=settings.reranker_max_length,
+        )
+    if settings.reranker_backend == "lexical":
+        return LexicalReranker(score_threshold=settings.reranker_score_threshold)
+    raise ValueError(
+        f"Unsupported reranker backend: {settings.reranker_backend}. "
+        "Supported backends: llm, cross_encoder, lexical"
+    )
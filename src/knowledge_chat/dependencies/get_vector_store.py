@@ -1,23 +1,37 @@
 """Dependency provider for the vector store service.
 
 This module defines a factory function that initializes and returns
-an instance of ChromaVectorStore using application settings.
+the vector store selected in the application settings.
 """
 
 from knowledge_chat.config.settings import Settings
 from knowledge_chat.domain.interfaces.vector_store import VectorStore
 from knowledge_chat.infrastructure.vector_store.chroma_vector_store import \
     ChromaVectorStore
+from knowledge_chat.infrastructure.vector_store.numpy_vector_store import \
+    NumPyVectorStore
 
 
 def get_vector_store() -> VectorStore:
     """Create and return a configured vector store instance.
 
-    Loads the persistent storage path from environment variables using
-    the Settings class.
+    ``vector_store_backend`` selects the ChromaDB-backed store or the
+    NumPyVectorStore, which answers queries from a memory-mapped matrix
+    shared by every process on the host.
 
     Returns:
-        VectorStore: An initialized vector store backed by ChromaDB.
+        VectorStore: An initialized vector store.
+
+    Raises:
+        ValueError: If the vector store backend is unknown.
     """
     settings = Settings()
-    return ChromaVectorStore(settings=settings)
+
+    if settings.vector_store_backend == "chroma":
+        return ChromaVectorStore(settings=settings)
+    if settings.vector_store_backend == "numpy":
+        return NumPyVectorStore(settings=settings)
+    raise ValueError(
+        f"Unsupported vector store backend: {settings.vector_store_backend}. "
+        "Supported backends: chroma, numpy"
+    )
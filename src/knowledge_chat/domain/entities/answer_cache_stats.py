@@ -0,0 +1,35 @@
+"""Answer cache statistics entity.
+
+This module defines the AnswerCacheStats model, which summarizes how
+often chat answers are served from the semantic answer cache.
+"""
+
+from pydantic import BaseModel
+
+
+class AnswerCacheStats(BaseModel):
+    """Counters of an answer cache since it was created.
+
+    Attributes:
+        hits (int): Questions answered from the cache.
+        misses (int): Questions that had to be answered by the LLM.
+        invalidations (int): Entries dropped because the knowledge base
+            changed.
+        evictions (int): Entries removed to stay within the entry limit.
+        expirations (int): Entries dropped because they outlived the
+            cache's time to live.
+        entries (int): Number of answers currently cached.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of looked-up questions that were cache hits."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,34 @@
+"""Embedding cache statistics entity.
+
+This module defines the EmbeddingCacheStats model, which summarizes the
+effectiveness and size of the embedding caches.
+"""
+
+from pydantic import BaseModel
+
+
+class EmbeddingCacheStats(BaseModel):
+    """Counters of an embedding cache since it was opened.
+
+    Attributes:
+        hits (int): Texts whose embedding was served from the cache.
+        misses (int): Texts that had to be sent to the embedding service.
+        evictions (int): Entries removed to stay within the size limit.
+        expirations (int): Entries embedded again because they outlived
+            the cache's time to live.
+        entries (int): Number of embeddings currently stored.
+        size_bytes (int): Total size of the stored vectors in bytes.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of looked-up texts that were cache hits."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
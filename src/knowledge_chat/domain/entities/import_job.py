@@ -0,0 +1,47 @@
+"""Import job entity.
+
+This module defines the ImportJob model, a snapshot of an import that
+was submitted to ImportJobManager and runs in the background.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+from knowledge_chat.domain.entities.import_progress import ImportProgress
+from knowledge_chat.domain.entities.import_stats import ImportStats
+
+
+class ImportJob(BaseModel):
+    """State of one background import.
+
+    Attributes:
+        job_id (str): Unique identifier returned on submission.
+        status (str): "queued", "running", "succeeded" or "failed".
+        files (int): Number of files submitted.
+        incremental (bool): Whether only new or changed files are imported
+            into the live stores. Full jobs build into staging stores that
+            replace the live ones once the import succeeds.
+        submitted_at (float): Submission time as a Unix timestamp.
+        started_at (Optional[float]): Time the job started running.
+        finished_at (Optional[float]): Time the job succeeded or failed.
+        progress (Optional[ImportProgress]): Latest progress report.
+        stats (Optional[ImportStats]): Result of a finished import.
+        error (Optional[str]): Error message of a failed job.
+    """
+
+    job_id: str
+    status: str = "queued"
+    files: int = 0
+    incremental: bool = True
+    submitted_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    progress: Optional[ImportProgress] = None
+    stats: Optional[ImportStats] = None
+    error: Optional[str] = None
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job has succeeded or failed."""
+        return self.status in ("succeeded", "failed")
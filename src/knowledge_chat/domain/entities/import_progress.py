@@ -0,0 +1,59 @@
+"""Import progress entity.
+
+This module defines the ImportProgress model, a snapshot of a running
+import that ImportFilesUseCase reports to an optional progress callback.
+"""
+
+from pydantic import BaseModel
+
+
+class ImportProgress(BaseModel):
+    """Progress of an import run at one point in time.
+
+    Stage timings are the time each pipeline stage spent doing work.
+    Stages run concurrently, so they may add up to more than the
+    elapsed time.
+
+    Attributes:
+        stage (str): "planning" while comparing file hashes, "importing"
+            while the pipeline runs and "done" once every batch is written.
+        files_total (int): Files that will be loaded in this run.
+        files_loaded (int): Files loaded completely.
+        files_failed (int): Files that could not be loaded.
+        chunks_produced (int): Chunks produced by the chunker so far.
+        chunks_embedded (int): Chunks that were sent to the embedding service.
+        chunks_written (int): Chunks stored or confirmed as unchanged.
+        elapsed_seconds (float): Wall-clock time since the import started.
+        load_seconds (float): Time spent loading documents.
+        chunk_seconds (float): Time spent splitting documents into chunks.
+        embed_seconds (float): Time spent embedding chunks.
+        write_seconds (float): Time spent writing to the stores.
+    """
+
+    stage: str = "planning"
+    files_total: int = 0
+    files_loaded: int = 0
+    files_failed: int = 0
+    chunks_produced: int = 0
+    chunks_embedded: int = 0
+    chunks_written: int = 0
+    elapsed_seconds: float = 0.0
+    load_seconds: float = 0.0
+    chunk_seconds: float = 0.0
+    embed_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+    @property
+    def fraction(self) -> float:
+        """Estimated completion between 0 and 1.
+
+        Combines the share of files that have been loaded with the share
+        of produced chunks that have been written.
+        """
+        if self.stage == "done":
+            return 1.0
+        if not self.files_total:
+            return 0.0
+        files_done = (self.files_loaded + self.files_failed) / self.files_total
+        chunks_done = self.chunks_written / self.chunks_produced if self.chunks_produced else 0.0
+        return min(0.99, files_done * 0.5 + files_done * chunks_done * 0.5)
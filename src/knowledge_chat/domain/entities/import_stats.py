@@ -0,0 +1,46 @@
+"""Import statistics entity.
+
+This module defines the ImportStats model, which summarizes the work
+performed by a single run of the document import pipeline.
+"""
+
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+
+class ImportStats(BaseModel):
+    """Summary of a single import run.
+
+    Attributes:
+        files_added (int): Files that were not present in the store before.
+        files_updated (int): Files whose content hash changed and were re-imported.
+        files_unchanged (int): Files skipped because their content hash matched.
+        files_removed (int): Previously imported files whose chunks were deleted.
+        files_failed (int): Files that could not be loaded.
+        chunks_written (int): Number of chunk records embedded and written
+            to the vector store.
+        chunks_unchanged (int): Chunks that were already stored under the
+            same ID and were not re-embedded.
+        chunks_deduplicated (int): Chunks that duplicate a stored chunk and
+            were neither embedded nor stored; each saved one embedding and
+            one row.
+        chunks_near_duplicates (int): Part of ``chunks_deduplicated`` that
+            only nearly matched the stored chunk.
+        sources_invalidated (List[str]): Sources that lost a chunk they
+            shared with a deleted source and could not be re-imported right
+            away; the next incremental import of them restores it.
+        errors (Dict[str, str]): Error message per failed file path.
+    """
+
+    files_added: int = 0
+    files_updated: int = 0
+    files_unchanged: int = 0
+    files_removed: int = 0
+    files_failed: int = 0
+    chunks_written: int = 0
+    chunks_unchanged: int = 0
+    chunks_deduplicated: int = 0
+    chunks_near_duplicates: int = 0
+    sources_invalidated: List[str] = []
+    errors: Dict[str, str] = {}
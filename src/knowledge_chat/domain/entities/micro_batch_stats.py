@@ -0,0 +1,45 @@
+"""Micro-batching statistics entity.
+
+This module defines the MicroBatchStats model, which describes how well
+concurrent embedding requests are being coalesced into shared batches.
+"""
+
+from typing import Dict
+
+from pydantic import BaseModel
+
+
+class MicroBatchStats(BaseModel):
+    """Counters of a micro-batching embedding service since it started.
+
+    Attributes:
+        window_ms (float): Configured time a batch stays open for more requests.
+        max_batch_size (int): Configured maximum number of texts per batch.
+        requests (int): Caller requests received.
+        batches (int): Embedding calls made to the wrapped service.
+        texts (int): Texts embedded across all batches.
+        largest_batch (int): Most texts sent in a single call.
+        total_wait_ms (float): Summed time requests spent waiting for
+            their batch to be dispatched.
+        batch_sizes (Dict[int, int]): Number of batches per batch size
+            (in texts).
+    """
+
+    window_ms: float = 0.0
+    max_batch_size: int = 0
+    requests: int = 0
+    batches: int = 0
+    texts: int = 0
+    largest_batch: int = 0
+    total_wait_ms: float = 0.0
+    batch_sizes: Dict[int, int] = {}
+
+    @property
+    def avg_batch_size(self) -> float:
+        """Average number of texts per embedding call."""
+        return self.texts / self.batches if self.batches else 0.0
+
+    @property
+    def avg_wait_ms(self) -> float:
+        """Average time a request waited before its batch was sent."""
+        return self.total_wait_ms / self.requests if self.requests else 0.0
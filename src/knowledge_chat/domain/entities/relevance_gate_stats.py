@@ -0,0 +1,34 @@
+"""Relevance gate statistics entity.
+
+This module defines the RelevanceGateStats model, which summarizes how
+often retrieval results were decided from vector distances alone instead
+of by the LLM reranker.
+"""
+
+from pydantic import BaseModel
+
+
+class RelevanceGateStats(BaseModel):
+    """Counters of a relevance gate since it was created.
+
+    Attributes:
+        turns (int): Retrievals the gate decided on.
+        accepted (int): Turns whose close hits were accepted without
+            reranking.
+        rejected (int): Turns whose hits were all too distant, answered
+            without reranking.
+        reranked (int): Ambiguous turns passed to the LLM reranker.
+        dropped_documents (int): Retrieved documents discarded by the
+            distance thresholds, including those of reranked turns.
+    """
+
+    turns: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    reranked: int = 0
+    dropped_documents: int = 0
+
+    @property
+    def skip_rate(self) -> float:
+        """Fraction of turns that skipped the LLM rerank call."""
+        return (self.accepted + self.rejected) / self.turns if self.turns else 0.0
@@ -0,0 +1,61 @@
+"""Abstract interface for semantic answer caching.
+
+This module defines an abstract base class for caches that return a
+previously generated chat answer for a question whose embedding is close
+to the embedding of an earlier question.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from knowledge_chat.domain.entities.answer_cache_stats import AnswerCacheStats
+from knowledge_chat.domain.entities.message import Message
+
+
+class AnswerCache(ABC):
+    """Abstract interface for semantic answer caches."""
+
+    @abstractmethod
+    def lookup(self, embedding: List[float], version: str) -> Message | None:
+        """Return the cached answer to the closest similar question.
+
+        Args:
+            embedding (List[float]): Embedding of the new question.
+            version (str): Version of the knowledge base (and of any other
+                input the answer depends on). Answers cached under another
+                version are never returned.
+
+        Returns:
+            Message | None: The cached answer, or None on a miss.
+        """
+
+    @abstractmethod
+    def store(
+        self,
+        question: str,
+        embedding: List[float],
+        version: str,
+        answer: Message,
+    ) -> None:
+        """Cache the answer to a question.
+
+        Storing under a new version drops the answers of older versions.
+
+        Args:
+            question (str): The question text.
+            embedding (List[float]): Embedding of the question.
+            version (str): Version the answer was generated from.
+            answer (Message): The generated answer.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every cached answer."""
+
+    @abstractmethod
+    def stats(self) -> AnswerCacheStats:
+        """Return a snapshot of the cache counters.
+
+        Returns:
+            AnswerCacheStats: Hits, misses, invalidations and current size.
+        """
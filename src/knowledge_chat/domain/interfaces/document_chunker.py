@@ -5,7 +5,9 @@ text chunking operations, preparing documents for embedding or retrieval.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Sequence
+
+from langchain_core.documents import Document
 
 
 class DocumentChunker(ABC):
@@ -21,3 +23,41 @@ class DocumentChunker(ABC):
         Returns:
             List[str]: A list of text chunks.
         """
+
+    def chunk_document(self, document: Document) -> List[Document]:
+        """Split a document into chunk documents.
+
+        Implementations may use the document's structure and add metadata
+        such as ``heading_path``; the default splits the text with
+        ``chunk_text`` and copies the document metadata to every chunk.
+
+        Args:
+            document (Document): The document to be split.
+
+        Returns:
+            List[Document]: One document per chunk.
+        """
+        return [
+            Document(page_content=chunk, metadata=dict(document.metadata))
+            for chunk in self.chunk_text(document.page_content)
+        ]
+
+    def chunk_many(self, texts: Sequence[str]) -> List[List[str]]:
+        """Split several texts into chunks.
+
+        Implementations may split the texts in parallel; the default splits
+        them one after another.
+
+        Args:
+            texts (Sequence[str]): The input texts to be split.
+
+        Returns:
+            List[List[str]]: The chunks of each text, in input order.
+        """
+        return [self.chunk_text(text) for text in texts]
+
+    def close(self) -> None:
+        """Release resources such as worker pools held by the chunker.
+
+        The default implementation does nothing.
+        """
@@ -5,11 +5,32 @@ loading documents from various file formats into text representations.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List
 
 from langchain_core.documents import Document
 
 
+@dataclass
+class LoadResult:
+    """Outcome of loading a single file with ``DocumentLoader.load_many``.
+
+    Attributes:
+        file_path (str): The path that was loaded.
+        documents (Iterable[Document]): The loaded documents, empty on
+            failure. May be a lazy iterator that streams pages as they are
+            extracted, in which case it can still raise while iterated.
+        error (Exception | None): The error raised before any document
+            was produced, if any. A None error does not mean the file
+            loaded: errors of a lazy ``documents`` iterator surface while
+            it is iterated, so callers must handle both.
+    """
+
+    file_path: str
+    documents: Iterable[Document] = field(default_factory=list)
+    error: Exception | None = None
+
+
 class DocumentLoader(ABC):
     """Abstract interface for document loading services."""
 
@@ -24,3 +45,47 @@ class DocumentLoader(ABC):
             List[Document]: A list of LangChain Document objects
                 containing the loaded content and metadata.
         """
+
+    def lazy_load(self, file_path: str) -> Iterator[Document]:
+        """Load a document lazily, one page or record at a time.
+
+        The default implementation delegates to ``load``. Loaders that can
+        stream their input override it to keep memory use bounded.
+
+        Args:
+            file_path (str): Path to the document file.
+
+        Yields:
+            Document: The loaded documents, in order.
+        """
+        yield from self.load(file_path)
+
+    def load_many(self, file_paths: Iterable[str]) -> Iterator[LoadResult]:
+        """Load several files, reporting per-file errors instead of raising.
+
+        The default implementation streams files one by one on the calling
+        thread through ``lazy_load``; errors raised while the documents are
+        being iterated surface from the ``documents`` iterator.
+        Implementations may load files concurrently and yield results in
+        completion order.
+
+        Args:
+            file_paths (Iterable[str]): Paths of the files to load.
+
+        Yields:
+            LoadResult: One result per input path.
+        """
+        for file_path in file_paths:
+            try:
+                documents = self.lazy_load(file_path)
+            # pylint: disable=broad-exception-caught
+            except Exception as e:
+                yield LoadResult(file_path=file_path, error=e)
+                continue
+            yield LoadResult(file_path=file_path, documents=documents)
+
+    def close(self) -> None:
+        """Release resources such as worker pools held by the loader.
+
+        The default implementation does nothing.
+        """
@@ -0,0 +1,48 @@
+"""Abstract interface for file system watching.
+
+This module defines an abstract base class for services that report
+changes below a set of directories, grouped into batches.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from threading import Event
+from typing import Iterator, List, Sequence
+
+
+@dataclass
+class FileChange:
+    """A change to one path reported by ``FileWatcher.watch``.
+
+    Attributes:
+        path (str): Absolute path of the changed file or directory. Deleted
+            paths may be directories as well as files.
+        change (str): "added", "modified" or "deleted". A rename is reported
+            as a deletion of the old path and an addition of the new one.
+    """
+
+    path: str
+    change: str
+
+
+class FileWatcher(ABC):
+    """Abstract interface for file system watching services."""
+
+    @abstractmethod
+    def watch(
+        self,
+        directories: Sequence[str],
+        stop_event: Event | None = None,
+    ) -> Iterator[List[FileChange]]:
+        """Watch directories recursively and yield batches of changes.
+
+        Bursts of changes (e.g. a large copy) are debounced into a single
+        batch.
+
+        Args:
+            directories (Sequence[str]): Directories to watch.
+            stop_event (Event | None): Watching stops once this event is set.
+
+        Yields:
+            List[FileChange]: The changes of one debounced burst.
+        """
@@ -0,0 +1,75 @@
+"""Lexical index interface module.
+
+This module defines the abstract LexicalIndex interface. A lexical index
+holds the text of every chunk record stored in the vector store, under the
+same IDs, and finds records by exact term overlap with a query. It catches
+what embeddings match poorly, such as error codes, KB article numbers and
+product names.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+
+class LexicalIndex(ABC):
+    """Abstract interface for full-text indexes of chunk records."""
+
+    @abstractmethod
+    def add_documents(self, ids: List[str], texts: List[str]) -> None:
+        """Index texts, replacing the entries of already indexed IDs.
+
+        Args:
+            ids (List[str]): Identifiers of the records.
+            texts (List[str]): Text of each record.
+        """
+
+    @abstractmethod
+    def search(self, query: str, top_k: int = 5) -> List[Tuple[str, float]]:
+        """Find the records that best match a query.
+
+        Args:
+            query (str): The query text.
+            top_k (int, optional): Maximum number of results. Defaults to 5.
+
+        Returns:
+            List[Tuple[str, float]]: ``(id, score)`` pairs, best match first.
+        """
+
+    @abstractmethod
+    def delete_documents(self, ids: List[str]) -> None:
+        """Remove records from the index.
+
+        Args:
+            ids (List[str]): Identifiers of the records to remove. Unknown
+                IDs are ignored.
+        """
+
+    @abstractmethod
+    def create_staging(self) -> "LexicalIndex":
+        """Create an empty staging index that can later replace this one.
+
+        Returns:
+            LexicalIndex: The new, empty staging index.
+        """
+
+    @abstractmethod
+    def promote_staging(self, staging: "LexicalIndex") -> None:
+        """Atomically replace the contents of this index by a staging index.
+
+        The staging index must not be used afterwards.
+
+        Args:
+            staging (LexicalIndex): An index returned by ``create_staging``.
+        """
+
+    @abstractmethod
+    def discard_staging(self, staging: "LexicalIndex") -> None:
+        """Delete a staging index that will not be promoted.
+
+        Args:
+            staging (LexicalIndex): An index returned by ``create_staging``.
+        """
+
+    @abstractmethod
+    def delete_all(self) -> None:
+        """Remove every record from the index."""
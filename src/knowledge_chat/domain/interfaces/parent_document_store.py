@@ -0,0 +1,98 @@
+"""Parent document store interface module.
+
+This module defines the abstract ParentDocumentStore interface. Chunk
+records in the vector store only keep their own text and a ``parent_id``;
+the full parent text (a page or a whole file) is stored once here and can
+be fetched on demand.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+
+class ParentDocumentStore(ABC):
+    """Abstract interface for storing parent document texts."""
+
+    @abstractmethod
+    def add_parents(
+        self,
+        parent_ids: List[str],
+        sources: List[str],
+        texts: List[str],
+    ) -> None:
+        """Store parent texts, overwriting existing entries with the same ID.
+
+        Args:
+            parent_ids (List[str]): Unique identifiers of the parents.
+            sources (List[str]): Source file name of each parent.
+            texts (List[str]): Full text of each parent.
+        """
+
+    @abstractmethod
+    def get_parents(self, parent_ids: List[str]) -> Dict[str, str]:
+        """Fetch parent texts by ID.
+
+        Args:
+            parent_ids (List[str]): Identifiers of the parents to fetch.
+
+        Returns:
+            Dict[str, str]: Mapping of parent ID to text. Unknown IDs are
+                omitted.
+        """
+
+    @abstractmethod
+    def get_ids_by_source(self, source: str) -> List[str]:
+        """Return the IDs of every parent that originates from a source file.
+
+        Args:
+            source (str): The source file name.
+
+        Returns:
+            List[str]: The matching parent IDs.
+        """
+
+    @abstractmethod
+    def delete_parents(self, parent_ids: List[str]) -> None:
+        """Delete parents by ID.
+
+        Args:
+            parent_ids (List[str]): Identifiers of the parents to delete.
+        """
+
+    @abstractmethod
+    def delete_by_source(self, source: str) -> None:
+        """Delete every parent that originates from the given source file.
+
+        Args:
+            source (str): The source file name.
+        """
+
+    @abstractmethod
+    def create_staging(self) -> "ParentDocumentStore":
+        """Create an empty staging store that can later replace this one.
+
+        Returns:
+            ParentDocumentStore: The new, empty staging store.
+        """
+
+    @abstractmethod
+    def promote_staging(self, staging: "ParentDocumentStore") -> None:
+        """Atomically replace the contents of this store by a staging store.
+
+        The staging store must not be used afterwards.
+
+        Args:
+            staging (ParentDocumentStore): A store returned by ``create_staging``.
+        """
+
+    @abstractmethod
+    def discard_staging(self, staging: "ParentDocumentStore") -> None:
+        """Delete a staging store that will not be promoted.
+
+        Args:
+            staging (ParentDocumentStore): A store returned by ``create_staging``.
+        """
+
+    @abstractmethod
+    def delete_all(self) -> None:
+        """Delete all stored parents."""
@@ -0,0 +1,32 @@
+"""Abstract interface for reranking retrieved documents.
+
+This module defines an abstract base class for services that decide which
+retrieved documents are relevant to a query and in which order they
+should be used.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class Reranker(ABC):
+    """Abstract interface for rerankers of retrieved documents."""
+
+    @abstractmethod
+    def rerank(self, query: str, documents: List[str]) -> List[int]:
+        """Select and order the documents relevant to a query.
+
+        Args:
+            query (str): The user's question.
+            documents (List[str]): Texts of the retrieved documents.
+
+        Returns:
+            List[int]: Positions of the relevant documents in
+                ``documents``, most relevant first.
+        """
+
+    def close(self) -> None:
+        """Release resources such as worker pools held by the reranker.
+
+        The default implementation does nothing.
+        """
@@ -6,7 +6,7 @@ a vector database.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 
 class VectorStore(ABC):
@@ -30,6 +30,24 @@ class VectorStore(ABC):
                 describing each document.
         """
 
+    @abstractmethod
+    def upsert_documents(
+        self,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Insert new documents or overwrite existing ones with the same IDs.
+
+        Args:
+            ids (List[str]): Unique identifiers for each document.
+            embeddings (List[List[float]]): Vector embeddings of documents.
+            documents (List[str]): Original document texts to be stored.
+            metadatas (List[Dict[str, Any]]): Metadata dictionaries
+                describing each document.
+        """
+
     @abstractmethod
     def query_similar(
         self,
@@ -49,6 +67,242 @@ class VectorStore(ABC):
                 IDs, distances, and metadata.
         """
 
+    @abstractmethod
+    def query_similar_batch(
+        self,
+        embeddings: List[List[float]],
+        top_k: int = 5,
+    ) -> Dict[str, Any]:
+        """Query the vector store for several embeddings at once.
+
+        Args:
+            embeddings (List[List[float]]): The query embedding vectors.
+            top_k (int, optional): Number of top results per query.
+                Defaults to 5.
+
+        Returns:
+            Dict[str, Any]: A dictionary like the one of ``query_similar``,
+                with one list of results per query embedding.
+        """
+
+    @abstractmethod
+    def update_documents(
+        self,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Replace the stored text and metadata of existing documents.
+
+        Embeddings are left untouched.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to update.
+            documents (List[str]): New document texts.
+            metadatas (List[Dict[str, Any]]): New metadata dictionaries.
+        """
+
+    @abstractmethod
+    def update_metadatas(
+        self,
+        ids: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Replace the stored metadata of existing documents.
+
+        Texts and embeddings are left untouched.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to update.
+            metadatas (List[Dict[str, Any]]): New metadata dictionaries.
+        """
+
+    @abstractmethod
+    def iter_documents(self, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Iterate over every stored document in batches.
+
+        Args:
+            batch_size (int, optional): Number of records per batch.
+                Defaults to 500.
+
+        Yields:
+            Dict[str, Any]: A batch with ``ids``, ``documents`` and
+                ``metadatas`` lists.
+        """
+
+    @abstractmethod
+    def get_metadatas(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch the metadata of stored documents by ID.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to look up.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapping of ID to metadata. IDs that
+                are not stored are omitted.
+        """
+
+    @abstractmethod
+    def get_documents(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch stored documents with their embeddings by ID.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to look up.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapping of ID to a dictionary with
+                the ``document`` text, its ``metadata`` and its
+                ``embedding``. IDs that are not stored are omitted.
+        """
+
+    @abstractmethod
+    def find_by_metadata(self, values: Dict[str, List[Any]]) -> Dict[str, Dict[str, Any]]:
+        """Fetch the documents where any given field has any given value.
+
+        Args:
+            values (Dict[str, List[Any]]): Candidate values per metadata field.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapping of ID to a dictionary with
+                the ``document`` text and its ``metadata``.
+        """
+
+    @abstractmethod
+    def get_ids_by_duplicate_source(self, source: str) -> List[str]:
+        """Return the IDs of chunks that also stand for a chunk of a source.
+
+        These are chunks whose ``duplicate_sources`` metadata lists the
+        source because an identical or near-identical chunk of it was
+        deduplicated against them.
+
+        Args:
+            source (str): The source file name.
+
+        Returns:
+            List[str]: The matching document IDs.
+        """
+
+    @abstractmethod
+    def get_ids_by_source(self, source: str) -> List[str]:
+        """Return the IDs of every stored chunk of a source file.
+
+        Args:
+            source (str): The value of the ``source`` metadata field.
+
+        Returns:
+            List[str]: The matching document IDs.
+        """
+
+    @abstractmethod
+    def delete_documents(self, ids: List[str]) -> None:
+        """Delete stored documents by ID.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to delete.
+        """
+
+    @abstractmethod
+    def delete_by_source(self, source: str) -> None:
+        """Delete every stored chunk that originates from the given source file.
+
+        Args:
+            source (str): The value of the ``source`` metadata field.
+        """
+
+    @abstractmethod
+    def get_source_hashes(self) -> Dict[str, str]:
+        """Return the content hash recorded for each fully imported source file.
+
+        A file counts as fully imported once a record flagged with the
+        ``source_complete`` metadata field has been stored for it, or once
+        it was recorded with ``record_empty_sources``.
+
+        Returns:
+            Dict[str, str]: Mapping of ``source`` to its ``source_hash``
+                metadata value.
+        """
+
+    @abstractmethod
+    def invalidate_source_hashes(self, sources: List[str]) -> None:
+        """Clear the content hash recorded for sources.
+
+        The next incremental import treats them as changed and imports
+        them again.
+
+        Args:
+            sources (List[str]): The source file names.
+        """
+
+    @abstractmethod
+    def record_empty_sources(self, source_hashes: Dict[str, str]) -> None:
+        """Record source files that were imported without producing chunks.
+
+        They have no record to carry the ``source_complete`` flag, so their
+        hashes are kept apart. ``get_source_hashes`` reports them until they
+        are deleted with ``delete_by_source``, invalidated or the store is
+        emptied; a hash carried by a stored chunk takes precedence.
+
+        Args:
+            source_hashes (Dict[str, str]): Mapping of source file name to
+                content hash.
+        """
+
+    @abstractmethod
+    def version(self) -> str:
+        """Return a token that changes whenever the stored documents change.
+
+        The token also changes for writes made by other processes, e.g. a
+        CLI import, so callers can detect that results derived from the
+        store are stale.
+
+        Returns:
+            str: An opaque version token.
+        """
+
+    @abstractmethod
+    def embedding_dimension(self) -> int | None:
+        """Return the dimension of the stored embeddings.
+
+        A collection takes the dimension of its first embeddings. Writes
+        and queries with embeddings of another dimension raise ValueError
+        until the collection is emptied or replaced by a full import.
+
+        Returns:
+            int | None: The embedding dimension, or None while the store
+                is empty.
+        """
+
+    @abstractmethod
+    def create_staging(self) -> "VectorStore":
+        """Create an empty staging store that can later replace this one.
+
+        A full rebuild is written into the staging store while this store
+        keeps serving queries.
+
+        Returns:
+            VectorStore: The new, empty staging store.
+        """
+
+    @abstractmethod
+    def promote_staging(self, staging: "VectorStore") -> None:
+        """Replace the contents of this store by those of a staging store.
+
+        The switch is atomic for readers of this store: queries see either
+        the old or the new contents, never an empty or partial store. The
+        staging store must not be used afterwards.
+
+        Args:
+            staging (VectorStore): A store returned by ``create_staging``.
+        """
+
+    @abstractmethod
+    def discard_staging(self, staging: "VectorStore") -> None:
+        """Delete a staging store that will not be promoted.
+
+        Args:
+            staging (VectorStore): A store returned by ``create_staging``.
+        """
+
     @abstractmethod
     def delete_all(self) -> None:
         """Delete all stored movie embeddings from the vector store.
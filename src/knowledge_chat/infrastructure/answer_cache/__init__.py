@@ -0,0 +1,3 @@
+"""
+Initialize the package
+"""
@@ -0,0 +1,182 @@
+"""In-memory semantic answer cache implementation.
+
+This module provides an implementation of the AnswerCache interface that
+keeps recent chat answers in memory together with the normalized
+embedding of their question. A new question is answered from the cache
+when the cosine distance between its embedding and a cached question's
+embedding is within a threshold, so rephrasings such as "how do I reset my
+password" and "how to reset password" share one answer.
+
+Every answer is tagged with the knowledge base version it was generated
+from. As soon as the cache sees another version, which happens after any
+import, all older answers are dropped. Entries also expire after a time
+to live, and the least recently used entries are evicted beyond the entry
+limit.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from knowledge_chat.domain.entities.answer_cache_stats import AnswerCacheStats
+from knowledge_chat.domain.entities.message import Message
+from knowledge_chat.domain.interfaces.answer_cache import AnswerCache
+
+
+@dataclass
+class _Entry:
+    """A cached answer and the question it answers."""
+
+    question: str
+    vector: np.ndarray
+    answer: Message
+    expires_at: float
+
+
+class SemanticAnswerCache(AnswerCache):
+    """Thread-safe in-memory answer cache with cosine-distance lookup."""
+
+    def __init__(
+        self,
+        max_distance: float = 0.05,
+        max_entries: int = 1000,
+        ttl_seconds: float = 86400.0,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_distance (float): Largest cosine distance between two
+                questions for them to share an answer.
+            max_entries (int): Maximum number of cached answers.
+            ttl_seconds (float): Time after which an answer is generated
+                again; 0 or less keeps answers until they are evicted.
+        """
+        self._max_distance = max_distance
+        self._max_entries = max(1, max_entries)
+        self._ttl = ttl_seconds
+        self._stats = AnswerCacheStats()
+        self._lock = threading.Lock()
+        self._version: str | None = None
+        self._next_id = 0
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        # Stacked question vectors, rebuilt lazily after the entries change.
+        self._matrix: np.ndarray | None = None
+        self._matrix_ids: List[int] = []
+
+    def lookup(self, embedding: List[float], version: str) -> Message | None:
+        """Return the cached answer to the closest similar question.
+
+        Args:
+            embedding (List[float]): Embedding of the new question.
+            version (str): Version of the knowledge base. Answers cached
+                under another version are dropped.
+
+        Returns:
+            Message | None: The cached answer, or None on a miss.
+        """
+        vector = self._normalize(embedding)
+        with self._lock:
+            self._sync_version(version)
+            entry_id = self._nearest(vector)
+            if entry_id is not None and self._entries[entry_id].expires_at <= time.monotonic():
+                self._remove(entry_id)
+                self._stats.expirations += 1
+                entry_id = None
+            if entry_id is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(entry_id)
+            self._stats.hits += 1
+            return self._entries[entry_id].answer.model_copy()
+
+    def store(
+        self,
+        question: str,
+        embedding: List[float],
+        version: str,
+        answer: Message,
+    ) -> None:
+        """Cache the answer to a question.
+
+        Args:
+            question (str): The question text.
+            embedding (List[float]): Embedding of the question.
+            version (str): Version the answer was generated from.
+            answer (Message): The generated answer.
+        """
+        vector = self._normalize(embedding)
+        expires_at = time.monotonic() + self._ttl if self._ttl > 0 else float("inf")
+        with self._lock:
+            self._sync_version(version)
+            self._entries[self._next_id] = _Entry(
+                question=question,
+                vector=vector,
+                answer=answer.model_copy(),
+                expires_at=expires_at,
+            )
+            self._next_id += 1
+            self._stats.entries += 1
+            self._matrix = None
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+                self._stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached answer."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.entries = 0
+            self._matrix = None
+
+    def stats(self) -> AnswerCacheStats:
+        """Return a snapshot of the cache counters.
+
+        Returns:
+            AnswerCacheStats: Hits, misses, invalidations and current size.
+        """
+        with self._lock:
+            return self._stats.model_copy()
+
+    # -----------------------------------------------------
+    # Private helper methods
+    # -----------------------------------------------------
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        """Return the embedding as a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _sync_version(self, version: str) -> None:
+        """Drop every entry if the knowledge base version changed."""
+        if version == self._version:
+            return
+        self._stats.invalidations += len(self._entries)
+        self._entries.clear()
+        self._stats.entries = 0
+        self._matrix = None
+        self._version = version
+
+    def _nearest(self, vector: np.ndarray) -> int | None:
+        """Return the ID of the closest cached question within the threshold."""
+        if not self._entries:
+            return None
+        if self._matrix is None:
+            self._matrix_ids = list(self._entries)
+            self._matrix = np.stack([self._entries[i].vector for i in self._matrix_ids])
+        similarities = self._matrix @ vector
+        best = int(np.argmax(similarities))
+        if 1.0 - float(similarities[best]) > self._max_distance:
+            return None
+        return self._matrix_ids[best]
+
+    def _remove(self, entry_id: int) -> None:
+        """Delete one entry; the vector matrix is rebuilt on next lookup."""
+        del self._entries[entry_id]
+        self._stats.entries -= 1
+        self._matrix = None
@@ -0,0 +1,264 @@
+"""Structure-aware document chunking implementation.
+
+This module provides an implementation of the DocumentChunker interface
+that splits Markdown documents along their heading hierarchy and JSON
+documents along their record boundaries instead of at arbitrary
+characters. Whole sections are packed into chunks up to the size limit,
+so a heading stays together with the steps below it, and every chunk
+carries the path of headings (or JSON keys and record titles) it belongs
+to in its ``heading_path`` metadata field.
+
+Sections that are larger than the limit on their own are split by a
+fallback chunker, which also handles every other document type.
+"""
+
+import re
+import textwrap
+from dataclasses import dataclass, field
+from typing import Callable, List, Union
+
+from langchain_core.documents import Document
+
+from knowledge_chat.domain.interfaces.document_chunker import DocumentChunker
+
+HEADING_PATH_SEPARATOR = " > "
+
+_MARKDOWN_HEADING = re.compile(r"^ {0,3}(#{1,6})[ \t]+(.+?)[ \t#]*$")
+_MARKDOWN_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_JSON_ITEM = re.compile(r"^Item \d+$")
+_JSON_TITLE_KEYS = ("title", "name")
+
+
+@dataclass
+class _Section:
+    """A heading with the lines and subsections that follow it."""
+
+    label: str | None
+    level: int
+    parts: List[Union[str, "_Section"]] = field(default_factory=list)
+
+    def render(self) -> str:
+        """Return the section text, subsections included."""
+        return "\n".join(
+            part if isinstance(part, str) else part.render() for part in self.parts
+        )
+
+
+@dataclass
+class _Unit:
+    """A piece of text together with its heading path."""
+
+    text: str
+    path: List[str]
+
+
+def _record_title(section: _Section) -> str | None:
+    """Return the ``title`` or ``name`` value among a JSON section's lines."""
+    for line in section.parts:
+        if isinstance(line, str):
+            key, _, value = line.strip().partition(": ")
+            if key in _JSON_TITLE_KEYS and value:
+                return value
+    return None
+
+
+class StructureAwareChunker(DocumentChunker):
+    """Chunker that packs whole Markdown sections and JSON records."""
+
+    def __init__(
+        self,
+        fallback: DocumentChunker,
+        chunk_size: int = 1000,
+        length_function: Callable[[str], int] = len,
+    ) -> None:
+        """Initialize the chunker.
+
+        Args:
+            fallback (DocumentChunker): Chunker for unstructured documents
+                and for sections larger than ``chunk_size``.
+            chunk_size (int): Maximum size per chunk, measured with
+                ``length_function``.
+            length_function (Callable[[str], int]): Measures the size of a
+                text, e.g. in characters or tokens.
+        """
+        self._fallback = fallback
+        self._chunk_size = chunk_size
+        self._length = length_function
+
+    def chunk_text(self, text: str) -> List[str]:
+        """Split text of unknown structure with the fallback chunker.
+
+        Args:
+            text (str): The input document text to be split.
+
+        Returns:
+            List[str]: A list of text chunks.
+        """
+        return self._fallback.chunk_text(text)
+
+    def chunk_document(self, document: Document) -> List[Document]:
+        """Split a document along its structure.
+
+        Markdown and JSON documents are split by section; other documents
+        are passed to the fallback chunker.
+
+        Args:
+            document (Document): The document to be split.
+
+        Returns:
+            List[Document]: One document per chunk, with the metadata of
+                the input document plus ``heading_path``.
+        """
+        file_type = document.metadata.get("file_type")
+        if file_type == "markdown":
+            root = self._parse_markdown(document.page_content)
+        elif file_type == "json":
+            root = self._parse_json_text(document.page_content)
+        else:
+            return self._fallback.chunk_document(document)
+
+        return [
+            Document(
+                page_content=unit.text,
+                metadata={
+                    **document.metadata,
+                    "heading_path": HEADING_PATH_SEPARATOR.join(unit.path),
+                },
+            )
+            for unit in self._pack(root, [root.label] if root.label else [])
+        ]
+
+    def close(self) -> None:
+        """Release the resources of the fallback chunker."""
+        self._fallback.close()
+
+    # -----------------------------------------------------
+    # Private helper methods
+    # -----------------------------------------------------
+
+    @staticmethod
+    def _parse_markdown(text: str) -> _Section:
+        """Build the section tree of a Markdown text from its ATX headings.
+
+        Lines inside fenced code blocks are never treated as headings.
+        """
+        root = _Section(label=None, level=0)
+        stack = [root]
+        fence: str | None = None
+        for line in text.split("\n"):
+            fence_match = _MARKDOWN_FENCE.match(line)
+            if fence_match:
+                marker = fence_match.group(1)
+                if fence is None:
+                    fence = marker
+                elif marker[0] == fence[0] and len(marker) >= len(fence):
+                    fence = None
+            heading = None if fence is not None else _MARKDOWN_HEADING.match(line)
+            if heading is None:
+                stack[-1].parts.append(line)
+                continue
+            level = len(heading.group(1))
+            while stack[-1].level >= level:
+                stack.pop()
+            section = _Section(label=heading.group(2).strip(), level=level, parts=[line])
+            stack[-1].parts.append(section)
+            stack.append(section)
+        return root
+
+    @staticmethod
+    def _parse_json_text(text: str) -> _Section:
+        """Build the section tree of JSON rendered by JSONLoader.
+
+        JSONLoader writes one ``key: value`` line per scalar and a ``key:``
+        or ``Item N:`` line, followed by lines indented two more spaces,
+        per object or array element. Every such container is a section;
+        an ``Item N`` section is labelled with its ``title`` or ``name``.
+        """
+        lines = text.split("\n")
+        indents = [(len(line) - len(line.lstrip(" "))) // 2 for line in lines]
+        # Indentation of the next non-blank line, to recognize container keys.
+        following = [-1] * len(lines)
+        next_indent = -1
+        for i in range(len(lines) - 1, -1, -1):
+            following[i] = next_indent
+            if lines[i].strip():
+                next_indent = indents[i]
+
+        root = _Section(label=None, level=-1)
+        stack = [root]
+        for line, indent, following_indent in zip(lines, indents, following):
+            stripped = line.strip()
+            if not stripped:
+                stack[-1].parts.append(line)
+                continue
+            while stack[-1].level >= indent:
+                stack.pop()
+            if stripped.endswith(":") and following_indent > indent:
+                section = _Section(label=stripped[:-1], level=indent, parts=[line])
+                stack[-1].parts.append(section)
+                stack.append(section)
+            else:
+                stack[-1].parts.append(line)
+
+        def label_items(section: _Section) -> None:
+            for part in section.parts:
+                if isinstance(part, _Section):
+                    if part.label and _JSON_ITEM.match(part.label):
+                        part.label = _record_title(part) or part.label
+                    label_items(part)
+
+        label_items(root)
+        # A JSON record loaded on its own is labelled like an ``Item N``.
+        root.label = _record_title(root)
+        return root
+
+    def _pack(self, section: _Section, path: List[str]) -> List[_Unit]:
+        """Return the chunks of a section, keeping whole subsections together."""
+        text = section.render()
+        if not text.strip():
+            return []
+        if self._length(text) <= self._chunk_size:
+            return [_Unit(text=textwrap.dedent(text).strip("\n"), path=path)]
+
+        units: List[_Unit] = []
+        lines: List[str] = []
+        for part in section.parts:
+            if isinstance(part, str):
+                lines.append(part)
+                continue
+            units.extend(self._split_lines(lines, path))
+            lines = []
+            units.extend(self._pack(part, path + [part.label]))
+        units.extend(self._split_lines(lines, path))
+        return self._merge(units)
+
+    def _split_lines(self, lines: List[str], path: List[str]) -> List[_Unit]:
+        """Turn loose lines of a section into units, splitting oversized text."""
+        text = textwrap.dedent("\n".join(lines)).strip("\n")
+        if not text.strip():
+            return []
+        if self._length(text) <= self._chunk_size:
+            return [_Unit(text=text, path=path)]
+        return [_Unit(text=chunk, path=path) for chunk in self._fallback.chunk_text(text)]
+
+    def _merge(self, units: List[_Unit]) -> List[_Unit]:
+        """Greedily pack consecutive units into chunks up to the size limit.
+
+        A packed chunk keeps the heading path shared by all of its units.
+        """
+        merged: List[_Unit] = []
+        for unit in units:
+            if merged:
+                last = merged[-1]
+                text = f"{last.text}\n\n{unit.text}"
+                if self._length(text) <= self._chunk_size:
+                    common = 0
+                    while (
+                        common < min(len(last.path), len(unit.path))
+                        and last.path[common] == unit.path[common]
+                    ):
+                        common += 1
+                    merged[-1] = _Unit(text=text, path=last.path[:common])
+                    continue
+            merged.append(unit)
+        return merged
@@ -3,8 +3,9 @@
 This package contains various document loaders for different file formats:
 - TextFileLoader: Plain text files (.txt)
 - PDFLoader: PDF documents (.pdf)
+- PyMuPDFLoader: PDF documents (.pdf), faster streaming backend
 - MarkdownLoader: Markdown files (.md, .markdown)
-- JSONLoader: JSON files (.json)
+- JSONLoader: JSON files (.json) and JSON Lines files (.jsonl)
 - MultiFormatLoader: Unified loader that auto-detects file type
 """
 
@@ -14,12 +15,15 @@ from knowledge_chat.infrastructure.document_loader.markdown_loader import \
 from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
     MultiFormatLoader
 from knowledge_chat.infrastructure.document_loader.pdf_loader import PDFLoader
+from knowledge_chat.infrastructure.document_loader.pymupdf_loader import \
+    PyMuPDFLoader
 from knowledge_chat.infrastructure.document_loader.text_file_loader import \
     TextFileLoader
 
 __all__ = [
     "TextFileLoader",
     "PDFLoader",
+    "PyMuPDFLoader",
     "MarkdownLoader",
     "JSONLoader",
     "MultiFormatLoader",
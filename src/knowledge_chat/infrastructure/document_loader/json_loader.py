@@ -1,19 +1,183 @@
 """JSON document loader implementation.
 
 This module provides an implementation of the DocumentLoader interface
-for reading JSON files using LangChain's JSONLoader.
+for reading JSON and JSON Lines files.
+
+By default a JSON file becomes a single Document. When a record path is
+configured, the file is parsed incrementally and one Document is yielded
+per matching record, so large exports are processed in constant memory:
+only the record currently being converted is held in memory, and
+everything outside the record path is skipped without being decoded.
+JSON Lines files (.jsonl) always yield one Document per line.
 """
 
 import json
-from typing import List
+import re
+from pathlib import Path
+from typing import Any, Iterator, List, TextIO, Tuple
 
 from langchain_core.documents import Document
 
 from knowledge_chat.domain.interfaces.document_loader import DocumentLoader
 
+_BLOCK_SIZE = 64 * 1024
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r"[,\]}\s]")
+
+
+class _JSONStreamReader:
+    """Minimal pull parser over a text stream.
+
+    It decodes complete values with ``json.JSONDecoder.raw_decode`` and
+    walks containers token by token, reading the file in blocks.
+    """
+
+    def __init__(self, file: TextIO) -> None:
+        self._file = file
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, allowed: str) -> str:
+        """Consume the next character, which must be one of ``allowed``."""
+        char = self.peek()
+        if not char or char not in allowed:
+            raise ValueError(f"Invalid JSON: expected one of {allowed!r}, found {char!r}.")
+        self._pos += 1
+        return char
+
+    def read_value(self) -> Any:
+        """Decode the next complete JSON value."""
+        if self.peek() not in '{["':
+            # Numbers and literals have no closing delimiter: make sure the
+            # whole token is buffered so "-3." is not decoded as -3.
+            while _SCALAR_END.search(self._buffer, self._pos) is None and self._fill():
+                pass
+        read_size = _BLOCK_SIZE
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+                # A value ending exactly at the buffer end may be truncated.
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill(read_size)
+            read_size *= 2
+
+    def skip_value(self) -> None:
+        """Consume the next JSON value without decoding it."""
+        if self.peek() not in "{[":
+            self.read_value()
+            return
+
+        depth = 0
+        in_string = False
+        while True:
+            buffer = self._buffer
+            while True:
+                match = (_STRING_SPECIAL if in_string else _STRUCTURAL).search(buffer, self._pos)
+                if match is None:
+                    self._pos = len(buffer)
+                    break
+                char = match.group()
+                if in_string:
+                    if char == "\\":
+                        if match.end() >= len(buffer):
+                            # The escaped character is in the next block.
+                            self._pos = match.start()
+                            break
+                        self._pos = match.end() + 1
+                    else:
+                        in_string = False
+                        self._pos = match.end()
+                    continue
+
+                self._pos = match.end()
+                if char == '"':
+                    in_string = True
+                elif char in "[{":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        return
+            if not self._fill():
+                raise ValueError("Invalid JSON: unexpected end of file.")
+
+    def iter_object_keys(self) -> Iterator[str]:
+        """Yield the keys of the next object.
+
+        The caller must consume each member's value before resuming.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+    def iter_array_indices(self) -> Iterator[int]:
+        """Yield the indices of the next array.
+
+        The caller must consume each element before resuming.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self.expect(",]") == "]":
+                return
+
+    def _fill(self, size: int = _BLOCK_SIZE) -> bool:
+        """Append the next block of the file, dropping consumed text."""
+        if self._eof:
+            return False
+        block = self._file.read(size)
+        if not block:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + block
+        self._pos = 0
+        return True
+
 
 class JSONLoader(DocumentLoader):
-    """Document loader for JSON files."""
+    """Document loader for JSON and JSON Lines files."""
+
+    def __init__(self, record_path: str = "") -> None:
+        """Initialize the loader.
+
+        Args:
+            record_path (str): Path of the records to emit as separate
+                Documents, e.g. ``"$.*"`` for every top-level element or
+                ``"$.document.categories.*.issues.*"``. ``*`` matches every
+                array element or object member. An empty path loads each
+                JSON file as a single Document.
+        """
+        self._record_path = self._parse_path(record_path)
 
     def load(self, file_path: str) -> List[Document]:
         """Load a JSON file and return its content as LangChain Documents.
@@ -30,22 +194,87 @@ class JSONLoader(DocumentLoader):
             List[Document]: A list containing LangChain Document objects
                 with JSON content converted to text and metadata.
         """
+        return list(self.lazy_load(file_path))
+
+    def lazy_load(self, file_path: str) -> Iterator[Document]:
+        """Yield the Documents of a JSON or JSON Lines file one at a time.
+
+        Each Document produced from a record carries the record's location
+        (e.g. ``$.categories[2]``) in the ``record_path`` metadata field.
+
+        Args:
+            file_path (str): Path to the JSON or JSONL file.
+
+        Yields:
+            Document: One document per record, or one for the whole file.
+        """
+        source = file_path.split("\\")[-1].split("/")[-1]
+
         with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+            if Path(file_path).suffix.lower() == ".jsonl":
+                for line_number, line in enumerate(f):
+                    if line.strip():
+                        yield self._to_document(json.loads(line), source, f"$[{line_number}]")
+                return
+
+            if not self._record_path:
+                # Convert JSON to readable text format
+                yield self._to_document(json.load(f), source, None)
+                return
 
-        # Convert JSON to readable text format
-        text_content = self._json_to_text(data)
+            reader = _JSONStreamReader(f)
+            for record_path, record in self._iter_records(reader, self._record_path, "$"):
+                yield self._to_document(record, source, record_path)
 
-        # Create a single document with the JSON content
-        document = Document(
-            page_content=text_content,
-            metadata={
-                "source": file_path.split("\\")[-1].split("/")[-1],
-                "file_type": "json",
-            },
-        )
+    # -----------------------------------------------------
+    # Private helper methods
+    # -----------------------------------------------------
 
-        return [document]
+    @staticmethod
+    def _parse_path(record_path: str) -> List[str]:
+        """Split ``$.a.b[*]`` style paths into ``["a", "b", "*"]``."""
+        normalized = record_path.strip().replace("[", ".").replace("]", "")
+        parts = [part for part in normalized.split(".") if part]
+        if parts and parts[0] == "$":
+            parts = parts[1:]
+        if record_path.strip() and not parts:
+            raise ValueError(f"Invalid JSON record path: {record_path!r}")
+        return parts
+
+    def _iter_records(
+        self,
+        reader: _JSONStreamReader,
+        components: List[str],
+        prefix: str,
+    ) -> Iterator[Tuple[str, Any]]:
+        """Yield ``(record_path, value)`` for every value matching ``components``."""
+        if not components:
+            yield prefix, reader.read_value()
+            return
+
+        head, rest = components[0], components[1:]
+        char = reader.peek()
+        if char == "{":
+            for key in reader.iter_object_keys():
+                if head in ("*", key):
+                    yield from self._iter_records(reader, rest, f"{prefix}.{key}")
+                else:
+                    reader.skip_value()
+        elif char == "[":
+            for index in reader.iter_array_indices():
+                if head in ("*", str(index)):
+                    yield from self._iter_records(reader, rest, f"{prefix}[{index}]")
+                else:
+                    reader.skip_value()
+        else:
+            reader.skip_value()
+
+    def _to_document(self, data: Any, source: str, record_path: str | None) -> Document:
+        """Convert a decoded JSON value into a Document."""
+        metadata = {"source": source, "file_type": "json"}
+        if record_path is not None:
+            metadata["record_path"] = record_path
+        return Document(page_content=self._json_to_text(data), metadata=metadata)
 
     def _json_to_text(self, data, indent: int = 0) -> str:
         """Convert JSON data to readable text format.
@@ -57,26 +286,31 @@ class JSONLoader(DocumentLoader):
         Returns:
             str: Formatted text representation of the JSON data
         """
-        lines = []
+        return "\n".join(self._iter_text_lines(data, indent))
+
+    def _iter_text_lines(self, data, indent: int) -> Iterator[str]:
+        """Yield the lines of the text representation of JSON data.
+
+        Lines are produced by a single generator chain and joined once,
+        instead of building an intermediate string at every nesting level.
+        """
         prefix = "  " * indent
 
         if isinstance(data, dict):
             for key, value in data.items():
                 if isinstance(value, (dict, list)):
-                    lines.append(f"{prefix}{key}:")
-                    lines.append(self._json_to_text(value, indent + 1))
+                    yield f"{prefix}{key}:"
+                    yield from self._iter_text_lines(value, indent + 1)
                 else:
-                    lines.append(f"{prefix}{key}: {value}")
+                    yield f"{prefix}{key}: {value}"
 
         elif isinstance(data, list):
             for i, item in enumerate(data):
                 if isinstance(item, (dict, list)):
-                    lines.append(f"{prefix}Item {i + 1}:")
-                    lines.append(self._json_to_text(item, indent + 1))
+                    yield f"{prefix}Item {i + 1}:"
+                    yield from self._iter_text_lines(item, indent + 1)
                 else:
-                    lines.append(f"{prefix}- {item}")
+                    yield f"{prefix}- {item}"
 
         else:
-            lines.append(f"{prefix}{data}")
-
-        return "\n".join(lines)
+            yield f"{prefix}{data}"
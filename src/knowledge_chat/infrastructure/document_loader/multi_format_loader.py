@@ -2,38 +2,103 @@
 
 This module provides a unified document loader that automatically detects
 file types and uses the appropriate loader (Text, PDF, Markdown, JSON).
+Batches of files can be loaded in parallel on a process pool, which pays
+off for CPU-bound formats such as PDF.
 """
 
+import multiprocessing
+from collections import deque
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                wait)
 from pathlib import Path
-from typing import List
+from typing import Deque, Dict, Iterable, Iterator, List
 
 from langchain_core.documents import Document
 
-from knowledge_chat.domain.interfaces.document_loader import DocumentLoader
-from knowledge_chat.infrastructure.document_loader.json_loader import JSONLoader
+from knowledge_chat.domain.interfaces.document_loader import (DocumentLoader,
+                                                              LoadResult)
+from knowledge_chat.infrastructure.document_loader.json_loader import \
+    JSONLoader
 from knowledge_chat.infrastructure.document_loader.markdown_loader import \
     MarkdownLoader
 from knowledge_chat.infrastructure.document_loader.pdf_loader import PDFLoader
+from knowledge_chat.infrastructure.document_loader.pymupdf_loader import \
+    PyMuPDFLoader
 from knowledge_chat.infrastructure.document_loader.text_file_loader import \
     TextFileLoader
 
+# Loader used inside each worker process of the pool.
+_worker_loader: "MultiFormatLoader | None" = None
+
+
+def _init_worker(pdf_backend: str, json_record_path: str) -> None:
+    """Create the per-process loader when a pool worker starts."""
+    global _worker_loader  # pylint: disable=global-statement
+    _worker_loader = MultiFormatLoader(pdf_backend=pdf_backend, json_record_path=json_record_path)
+
+
+def _load_in_worker(file_path: str) -> LoadResult:
+    """Load one file inside a pool worker, capturing any error."""
+    try:
+        return LoadResult(file_path=file_path, documents=_worker_loader.load(file_path))
+    # pylint: disable=broad-exception-caught
+    except Exception as e:
+        return LoadResult(file_path=file_path, error=e)
+
 
 class MultiFormatLoader(DocumentLoader):
     """Document loader that supports multiple file formats.
 
     Automatically detects file type by extension and uses the appropriate loader:
     - .txt: TextFileLoader
-    - .pdf: PDFLoader
+    - .pdf: PDFLoader (pypdf backend) or PyMuPDFLoader (pymupdf backend)
     - .md, .markdown: MarkdownLoader
-    - .json: JSONLoader
+    - .json, .jsonl: JSONLoader
     """
 
-    def __init__(self) -> None:
-        """Initialize loaders for all supported formats."""
+    def __init__(
+        self,
+        max_workers: int = 1,
+        pdf_backend: str = "pypdf",
+        pdf_max_workers: int = 1,
+        pdf_parallel_min_pages: int = 64,
+        json_record_path: str = "",
+    ) -> None:
+        """Initialize loaders for all supported formats.
+
+        Args:
+            max_workers (int): Number of worker processes used by
+                ``load_many``. Values of 1 or less load files on the
+                calling thread.
+            pdf_backend (str): PDF extraction backend, "pypdf" or "pymupdf".
+            pdf_max_workers (int): Worker processes used by the pymupdf
+                backend to extract pages of a single large PDF.
+            pdf_parallel_min_pages (int): Minimum page count for a PDF to
+                be extracted in parallel by the pymupdf backend.
+            json_record_path (str): Path of the records emitted as separate
+                Documents by the JSON loader; empty loads whole files.
+
+        Raises:
+            ValueError: If the PDF backend is unknown.
+        """
         self._text_loader = TextFileLoader()
-        self._pdf_loader = PDFLoader()
         self._markdown_loader = MarkdownLoader()
-        self._json_loader = JSONLoader()
+        self._json_loader = JSONLoader(record_path=json_record_path)
+        if pdf_backend == "pypdf":
+            self._pdf_loader: DocumentLoader = PDFLoader()
+        elif pdf_backend == "pymupdf":
+            self._pdf_loader = PyMuPDFLoader(
+                max_workers=pdf_max_workers,
+                parallel_min_pages=pdf_parallel_min_pages,
+            )
+        else:
+            raise ValueError(
+                f"Unsupported PDF backend: {pdf_backend}. Supported backends: pypdf, pymupdf"
+            )
+        self._pdf_backend = pdf_backend
+        self._json_record_path = json_record_path
+        self._max_workers = max_workers
+        self._pool: ProcessPoolExecutor | None = None
 
     def load(self, file_path: str) -> List[Document]:
         """Load a document using the appropriate loader based on file extension.
@@ -45,30 +110,131 @@ class MultiFormatLoader(DocumentLoader):
             List[Document]: A list of LangChain Document objects
                 containing the loaded content and metadata.
 
+        Raises:
+            ValueError: If the file format is not supported.
+        """
+        return self._get_loader(file_path).load(file_path)
+
+    def lazy_load(self, file_path: str) -> Iterator[Document]:
+        """Stream a document using the appropriate loader based on file extension.
+
+        Args:
+            file_path (str): Path to the document file.
+
+        Yields:
+            Document: The loaded documents, in order.
+
+        Raises:
+            ValueError: If the file format is not supported.
+        """
+        return self._get_loader(file_path).lazy_load(file_path)
+
+    def load_many(self, file_paths: Iterable[str]) -> Iterator[LoadResult]:
+        """Load several files on a process pool, yielding results as they finish.
+
+        At most twice as many files as there are workers are in flight at
+        any time, so ``file_paths`` may be a lazy iterator over a very
+        large tree. A failing file yields a result with ``error`` set and
+        does not affect the other files. Files that are parsed record by
+        record (JSON Lines, and JSON when a record path is configured) are
+        streamed on the calling thread instead, so they never have to be
+        materialized in a worker.
+
+        Args:
+            file_paths (Iterable[str]): Paths of the files to load.
+
+        Yields:
+            LoadResult: One result per input path, in completion order.
+        """
+        if self._max_workers <= 1:
+            yield from super().load_many(file_paths)
+            return
+
+        pool = self._get_pool()
+        paths = iter(file_paths)
+        in_flight: Dict[Future, str] = {}
+        streamed: Deque[str] = deque()
+
+        def submit_next() -> bool:
+            for path in paths:
+                if self._is_streamed(path):
+                    streamed.append(path)
+                    continue
+                in_flight[pool.submit(_load_in_worker, path)] = path
+                return True
+            return False
+
+        while True:
+            while len(in_flight) < self._max_workers * 2 and submit_next():
+                pass
+            while streamed:
+                yield from super().load_many([streamed.popleft()])
+            if not in_flight:
+                return
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = in_flight.pop(future)
+                try:
+                    yield future.result()
+                # pylint: disable=broad-exception-caught
+                except Exception as e:
+                    # The worker itself died (e.g. a crash in a native parser).
+                    yield LoadResult(file_path=path, error=e)
+
+    def close(self) -> None:
+        """Shut down the worker pools, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        self._pdf_loader.close()
+
+    @staticmethod
+    def get_supported_extensions() -> List[str]:
+        """Get list of supported file extensions.
+
+        Returns:
+            List[str]: List of supported file extensions with dots.
+        """
+        return [".txt", ".pdf", ".md", ".markdown", ".json", ".jsonl"]
+
+    def _get_loader(self, file_path: str) -> DocumentLoader:
+        """Return the loader responsible for a file's extension.
+
         Raises:
             ValueError: If the file format is not supported.
         """
         file_extension = Path(file_path).suffix.lower()
 
         if file_extension == ".txt":
-            return self._text_loader.load(file_path)
+            return self._text_loader
         elif file_extension == ".pdf":
-            return self._pdf_loader.load(file_path)
+            return self._pdf_loader
         elif file_extension in [".md", ".markdown"]:
-            return self._markdown_loader.load(file_path)
-        elif file_extension == ".json":
-            return self._json_loader.load(file_path)
+            return self._markdown_loader
+        elif file_extension in [".json", ".jsonl"]:
+            return self._json_loader
         else:
             raise ValueError(
                 f"Unsupported file format: {file_extension}. "
-                f"Supported formats: .txt, .pdf, .md, .markdown, .json"
+                f"Supported formats: .txt, .pdf, .md, .markdown, .json, .jsonl"
             )
 
-    @staticmethod
-    def get_supported_extensions() -> List[str]:
-        """Get list of supported file extensions.
+    def _is_streamed(self, file_path: str) -> bool:
+        """Whether a file is parsed record by record rather than as a whole."""
+        file_extension = Path(file_path).suffix.lower()
+        return file_extension == ".jsonl" or (
+            file_extension == ".json" and bool(self._json_record_path)
+        )
 
-        Returns:
-            List[str]: List of supported file extensions with dots.
-        """
-        return [".txt", ".pdf", ".md", ".markdown", ".json"]
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use and reuse it afterwards."""
+        if self._pool is None:
+            # "spawn" avoids forking a process that has pipeline threads running.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._pdf_backend, self._json_record_path),
+            )
+        return self._pool
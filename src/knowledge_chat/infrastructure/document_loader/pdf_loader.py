@@ -4,7 +4,7 @@ This module provides an implementation of the DocumentLoader interface
 for reading PDF files using LangChain's PyPDFLoader.
 """
 
-from typing import List
+from typing import Iterator, List
 
 from langchain_community.document_loaders import PyPDFLoader
 from langchain_core.documents import Document
@@ -25,12 +25,21 @@ class PDFLoader(DocumentLoader):
             List[Document]: A list of LangChain Document objects,
                 one per page, each with text content and metadata.
         """
+        return list(self.lazy_load(file_path))
+
+    def lazy_load(self, file_path: str) -> Iterator[Document]:
+        """Yield the pages of a PDF file one at a time.
+
+        Args:
+            file_path (str): Path to the PDF file.
+
+        Yields:
+            Document: One document per page, with text content and metadata.
+        """
         loader = PyPDFLoader(file_path)
-        documents = loader.load()
 
         # Add filename to metadata for each page
-        for doc in documents:
+        for doc in loader.lazy_load():
             doc.metadata["source"] = file_path.split("\\")[-1].split("/")[-1]
             doc.metadata["file_type"] = "pdf"
-
-        return documents
+            yield doc
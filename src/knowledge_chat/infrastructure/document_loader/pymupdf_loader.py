@@ -0,0 +1,141 @@
+"""PyMuPDF-based PDF document loader implementation.
+
+This module provides a faster alternative to the PyPDF-based PDFLoader.
+Pages are extracted with PyMuPDF and streamed lazily, one Document per
+page. Large PDFs can additionally be split into page ranges that are
+extracted in parallel on a process pool, while pages are still yielded
+in order.
+"""
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Iterator, List, Tuple
+
+import pymupdf
+from langchain_core.documents import Document
+
+from knowledge_chat.domain.interfaces.document_loader import DocumentLoader
+
+_PAGES_PER_TASK = 16
+
+
+def _extract_pages(file_path: str, start: int, stop: int) -> List[Tuple[str, str]]:
+    """Extract ``(text, label)`` for pages ``start..stop-1`` in a pool worker."""
+    with pymupdf.open(file_path) as pdf:
+        return [
+            (pdf[number].get_text(), pdf[number].get_label() or str(number + 1))
+            for number in range(start, stop)
+        ]
+
+
+class PyMuPDFLoader(DocumentLoader):
+    """Streaming document loader for PDF files backed by PyMuPDF."""
+
+    def __init__(self, max_workers: int = 1, parallel_min_pages: int = 64) -> None:
+        """Initialize the loader.
+
+        Args:
+            max_workers (int): Worker processes used to extract pages of
+                large PDFs. Values of 1 or less extract on the calling thread.
+            parallel_min_pages (int): Minimum page count for a PDF to be
+                extracted in parallel.
+        """
+        self._max_workers = max_workers
+        self._parallel_min_pages = parallel_min_pages
+        self._pool: ProcessPoolExecutor | None = None
+
+    def load(self, file_path: str) -> List[Document]:
+        """Load a PDF file and return its content as LangChain Documents.
+
+        Args:
+            file_path (str): Path to the PDF file.
+
+        Returns:
+            List[Document]: A list of LangChain Document objects,
+                one per page, each with text content and metadata.
+        """
+        return list(self.lazy_load(file_path))
+
+    def lazy_load(self, file_path: str) -> Iterator[Document]:
+        """Yield the pages of a PDF file one at a time, in page order.
+
+        Metadata matches PDFLoader: ``source``, ``file_type``, ``page``
+        (0-based), ``page_label`` and ``total_pages``.
+
+        Args:
+            file_path (str): Path to the PDF file.
+
+        Yields:
+            Document: One document per page.
+        """
+        source = file_path.split("\\")[-1].split("/")[-1]
+
+        with pymupdf.open(file_path) as pdf:
+            total_pages = pdf.page_count
+            if self._max_workers <= 1 or total_pages < self._parallel_min_pages:
+                for number in range(total_pages):
+                    page = pdf[number]
+                    yield self._to_document(
+                        page.get_text(), page.get_label() or str(number + 1), source, number, total_pages
+                    )
+                return
+
+        number = 0
+        for pages in self._extract_in_parallel(file_path, total_pages):
+            for text, label in pages:
+                yield self._to_document(text, label, source, number, total_pages)
+                number += 1
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    # -----------------------------------------------------
+    # Private helper methods
+    # -----------------------------------------------------
+
+    def _extract_in_parallel(self, file_path: str, total_pages: int) -> Iterator[List[Tuple[str, str]]]:
+        """Extract page ranges on the pool, yielding ranges in page order.
+
+        Only a bounded number of ranges is in flight, so memory stays
+        proportional to the pool size rather than the page count.
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        ranges = iter(range(0, total_pages, _PAGES_PER_TASK))
+        in_flight: Deque[Future] = deque()
+
+        def submit_next() -> None:
+            start = next(ranges, None)
+            if start is not None:
+                stop = min(start + _PAGES_PER_TASK, total_pages)
+                in_flight.append(self._pool.submit(_extract_pages, file_path, start, stop))
+
+        for _ in range(self._max_workers * 2):
+            submit_next()
+
+        while in_flight:
+            pages = in_flight.popleft().result()
+            submit_next()
+            yield pages
+
+    @staticmethod
+    def _to_document(text: str, label: str, source: str, number: int, total_pages: int) -> Document:
+        """Build the Document for one page."""
+        return Document(
+            page_content=text,
+            metadata={
+                "source": source,
+                "file_type": "pdf",
+                "page": number,
+                "page_label": label,
+                "total_pages": total_pages,
+            },
+        )
@@ -0,0 +1,185 @@
+"""SQLite-based parent document store implementation.
+
+This module provides an implementation of the ParentDocumentStore
+interface that keeps parent texts in a single SQLite side table. Full
+rebuilds can be written into a staging table in the same file and swapped
+in atomically.
+"""
+
+import os
+import sqlite3
+import threading
+import uuid
+from typing import Dict, List
+
+from knowledge_chat.config.settings import Settings
+from knowledge_chat.domain.interfaces.parent_document_store import \
+    ParentDocumentStore
+
+# SQLite limits the number of bound parameters per statement.
+_MAX_PARAMS = 900
+
+
+class SQLiteParentDocumentStore(ParentDocumentStore):
+    """Parent document store backed by a local SQLite database."""
+
+    def __init__(self, settings: Settings, table: str = "parents") -> None:
+        """Open (and create if needed) the parent table.
+
+        Args:
+            settings (Settings): Application configuration instance
+                containing the parent store path.
+            table (str): Table holding the parents, e.g. a staging table.
+        """
+        directory = os.path.dirname(settings.parent_store_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._settings = settings
+        self._table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(settings.parent_store_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            " parent_id TEXT PRIMARY KEY,"
+            " source TEXT NOT NULL,"
+            " text TEXT NOT NULL"
+            ")"
+        )
+        # A promoted staging table keeps the index it was built with.
+        has_index = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table,),
+        ).fetchone()
+        if not has_index:
+            self._conn.execute(f"CREATE INDEX {table}_source ON {table}(source)")
+        self._conn.commit()
+
+    def add_parents(
+        self,
+        parent_ids: List[str],
+        sources: List[str],
+        texts: List[str],
+    ) -> None:
+        """Store parent texts, overwriting existing entries with the same ID.
+
+        Args:
+            parent_ids (List[str]): Unique identifiers of the parents.
+            sources (List[str]): Source file name of each parent.
+            texts (List[str]): Full text of each parent.
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self._table} (parent_id, source, text) VALUES (?, ?, ?)",
+                zip(parent_ids, sources, texts),
+            )
+
+    def get_parents(self, parent_ids: List[str]) -> Dict[str, str]:
+        """Fetch parent texts by ID.
+
+        Args:
+            parent_ids (List[str]): Identifiers of the parents to fetch.
+
+        Returns:
+            Dict[str, str]: Mapping of parent ID to text.
+        """
+        parents: Dict[str, str] = {}
+        unique_ids = list(dict.fromkeys(parent_ids))
+        with self._lock:
+            for start in range(0, len(unique_ids), _MAX_PARAMS):
+                batch = unique_ids[start:start + _MAX_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT parent_id, text FROM {self._table} WHERE parent_id IN ({placeholders})",
+                    batch,
+                )
+                parents.update(rows)
+        return parents
+
+    def get_ids_by_source(self, source: str) -> List[str]:
+        """Return the IDs of every parent that originates from a source file.
+
+        Args:
+            source (str): The source file name.
+
+        Returns:
+            List[str]: The matching parent IDs.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT parent_id FROM {self._table} WHERE source = ?", (source,)
+            ).fetchall()
+        return [parent_id for (parent_id,) in rows]
+
+    def delete_parents(self, parent_ids: List[str]) -> None:
+        """Delete parents by ID.
+
+        Args:
+            parent_ids (List[str]): Identifiers of the parents to delete.
+        """
+        with self._lock, self._conn:
+            for start in range(0, len(parent_ids), _MAX_PARAMS):
+                batch = parent_ids[start:start + _MAX_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                self._conn.execute(
+                    f"DELETE FROM {self._table} WHERE parent_id IN ({placeholders})", batch
+                )
+
+    def delete_by_source(self, source: str) -> None:
+        """Delete every parent that originates from the given source file.
+
+        Args:
+            source (str): The source file name.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self._table} WHERE source = ?", (source,))
+
+    def create_staging(self) -> "SQLiteParentDocumentStore":
+        """Create an empty staging table in the same database file.
+
+        Returns:
+            SQLiteParentDocumentStore: A store bound to the staging table.
+        """
+        return SQLiteParentDocumentStore(
+            settings=self._settings,
+            table=f"{self._table}_staging_{uuid.uuid4().hex[:8]}",
+        )
+
+    def promote_staging(self, staging: ParentDocumentStore) -> None:
+        """Swap a staging table in place of the live table in one transaction.
+
+        Args:
+            staging (ParentDocumentStore): A store returned by ``create_staging``.
+        """
+        if not isinstance(staging, SQLiteParentDocumentStore):
+            raise TypeError("Staging store must be a SQLiteParentDocumentStore.")
+        staging._conn.close()
+        with self._lock:
+            # DDL is only transactional with an explicit BEGIN.
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(f"DROP TABLE {self._table}")
+                self._conn.execute(f"ALTER TABLE {staging._table} RENAME TO {self._table}")
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+
+    def discard_staging(self, staging: ParentDocumentStore) -> None:
+        """Drop a staging table.
+
+        Args:
+            staging (ParentDocumentStore): A store returned by ``create_staging``.
+        """
+        if not isinstance(staging, SQLiteParentDocumentStore):
+            raise TypeError("Staging store must be a SQLiteParentDocumentStore.")
+        staging._conn.close()
+        with self._lock:
+            self._conn.execute(f"DROP TABLE IF EXISTS {staging._table}")
+            self._conn.commit()
+
+    def delete_all(self) -> None:
+        """Delete all stored parents."""
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self._table}")
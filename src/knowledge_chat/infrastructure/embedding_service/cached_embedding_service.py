@@ -0,0 +1,222 @@
+"""Persistent embedding cache implementation.
+
+This module provides an EmbeddingService decorator that keeps the
+embeddings produced by another EmbeddingService in a local SQLite file.
+Entries are keyed by (embedding model, SHA-256 of the text), so the same
+text is only ever embedded once per model: re-imports after a chunker
+change, re-imports of unchanged chunks and repeated chat questions are
+served from disk without calling the embedding API.
+
+Vectors are stored compactly as float32 blobs. The cache is bounded by
+size and evicts the least recently used entries first.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+from typing import Dict, List, Tuple
+
+from knowledge_chat.domain.entities.embedding_cache_stats import \
+    EmbeddingCacheStats
+from knowledge_chat.domain.interfaces.embedding_service import EmbeddingService
+
+# SQLite limits the number of bound parameters per statement.
+_MAX_PARAMS = 900
+# After an eviction the cache is trimmed to this fraction of its limit, so
+# the next inserts do not immediately trigger another eviction.
+_EVICTION_TARGET = 0.9
+
+
+class CachedEmbeddingService(EmbeddingService):
+    """Embedding service that caches another service's embeddings on disk."""
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        model: str,
+        cache_path: str,
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        """Open (and create if needed) the cache table.
+
+        Args:
+            embedding_service (EmbeddingService): Service used on cache misses.
+            model (str): Name of the embedding model, part of the cache key
+                so that vectors of different models are never mixed.
+            cache_path (str): Path to the SQLite file holding the cache.
+            max_bytes (int): Maximum total size of the stored vectors.
+        """
+        directory = os.path.dirname(cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._embedding_service = embedding_service
+        self._model = model
+        self._max_bytes = max_bytes
+        self._stats = EmbeddingCacheStats()
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " model TEXT NOT NULL,"
+            " text_hash TEXT NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " last_used INTEGER NOT NULL,"
+            " PRIMARY KEY (model, text_hash)"
+            ") WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings(last_used)"
+        )
+        self._conn.commit()
+
+        entries, size_bytes, last_used = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0), COALESCE(MAX(last_used), 0)"
+            " FROM embeddings"
+        ).fetchone()
+        self._stats.entries = entries
+        self._stats.size_bytes = size_bytes
+        # Logical clock for LRU ordering, persisted in ``last_used``.
+        self._clock = last_used
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Return embeddings for the texts, computing only the missing ones.
+
+        Duplicate texts within one call are embedded once.
+
+        Args:
+            texts (List[str]): A list of text strings to embed.
+
+        Returns:
+            List[List[float]]: One embedding per input text, in order.
+        """
+        if not texts:
+            return []
+
+        hashes = [self._hash(text) for text in texts]
+        with self._lock:
+            cached = self._lookup(hashes)
+
+        missing: Dict[str, str] = {}
+        for text, text_hash in zip(texts, hashes):
+            if text_hash not in cached:
+                missing.setdefault(text_hash, text)
+
+        if missing:
+            computed = self._embedding_service.embed_texts(list(missing.values()))
+            # Round to float32 so a miss returns exactly what a later hit will.
+            new_entries = {
+                text_hash: array("f", vector).tolist()
+                for text_hash, vector in zip(missing.keys(), computed)
+            }
+            with self._lock:
+                self._store(new_entries)
+            cached.update(new_entries)
+
+        with self._lock:
+            self._stats.hits += len(texts) - len(missing)
+            self._stats.misses += len(missing)
+        return [cached[text_hash] for text_hash in hashes]
+
+    def stats(self) -> EmbeddingCacheStats:
+        """Return a snapshot of the cache counters.
+
+        Returns:
+            EmbeddingCacheStats: Hits, misses, evictions and current size.
+        """
+        with self._lock:
+            return self._stats.model_copy()
+
+    def clear(self) -> None:
+        """Delete every cached embedding of every model."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM embeddings")
+            self._stats.entries = 0
+            self._stats.size_bytes = 0
+
+    # -----------------------------------------------------
+    # Private helper methods
+    # -----------------------------------------------------
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        """Return the cache key of a text (SHA-256 hex digest)."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _tick(self) -> int:
+        """Advance and return the LRU clock."""
+        self._clock += 1
+        return self._clock
+
+    def _lookup(self, hashes: List[str]) -> Dict[str, List[float]]:
+        """Fetch cached vectors by text hash and mark them as recently used."""
+        found: Dict[str, List[float]] = {}
+        unique_hashes = list(dict.fromkeys(hashes))
+        for start in range(0, len(unique_hashes), _MAX_PARAMS):
+            batch = unique_hashes[start:start + _MAX_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT text_hash, vector FROM embeddings"
+                f" WHERE model = ? AND text_hash IN ({placeholders})",
+                [self._model, *batch],
+            ).fetchall()
+            for text_hash, blob in rows:
+                found[text_hash] = array("f", blob).tolist()
+
+        if found:
+            now = self._tick()
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE model = ? AND text_hash = ?",
+                    ((now, self._model, text_hash) for text_hash in found),
+                )
+        return found
+
+    def _store(self, entries: Dict[str, List[float]]) -> None:
+        """Insert new vectors, then evict old entries if over the size limit."""
+        now = self._tick()
+        rows = [
+            (self._model, text_hash, array("f", vector).tobytes(), now)
+            for text_hash, vector in entries.items()
+        ]
+        with self._conn:
+            for model, text_hash, blob, last_used in rows:
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO embeddings (model, text_hash, vector, last_used)"
+                    " VALUES (?, ?, ?, ?)",
+                    (model, text_hash, blob, last_used),
+                )
+                # Another thread may have stored the same text meanwhile.
+                if cursor.rowcount:
+                    self._stats.entries += 1
+                    self._stats.size_bytes += len(blob)
+
+        if self._stats.size_bytes > self._max_bytes:
+            self._evict(int(self._max_bytes * _EVICTION_TARGET))
+
+    def _evict(self, target_bytes: int) -> None:
+        """Delete least recently used entries until the cache fits ``target_bytes``."""
+        victims: List[Tuple[str, str]] = []
+        freed = 0
+        excess = self._stats.size_bytes - target_bytes
+        rows = self._conn.execute(
+            "SELECT model, text_hash, LENGTH(vector) FROM embeddings ORDER BY last_used"
+        )
+        for model, text_hash, size in rows:
+            if freed >= excess:
+                break
+            victims.append((model, text_hash))
+            freed += size
+        rows.close()
+
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM embeddings WHERE model = ? AND text_hash = ?", victims
+            )
+        self._stats.entries -= len(victims)
+        self._stats.size_bytes -= freed
+        self._stats.evictions += len(victims)
@@ -0,0 +1,173 @@
+"""In-memory query embedding cache implementation.
+
+This module provides an EmbeddingService decorator for the chat query
+path. Helpdesk questions repeat a lot ("reset password", "VPN not
+connecting"), so embeddings are kept in a process-local LRU cache keyed by
+(embedding model, normalized text): case, Unicode composition and runs of
+whitespace do not matter. Entries expire after a time to live, and the
+cache is bounded by entry count and by vector bytes.
+
+Concurrent requests for a text that is already being embedded wait for
+that call instead of sending their own, so a burst of identical questions
+costs a single embedding. Wrap a CachedEmbeddingService to share misses
+between worker processes through its on-disk store.
+"""
+
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from knowledge_chat.domain.entities.embedding_cache_stats import \
+    EmbeddingCacheStats
+from knowledge_chat.domain.interfaces.embedding_service import EmbeddingService
+
+
+@dataclass
+class _Entry:
+    """A cached vector and the time after which it is stale."""
+
+    vector: array
+    expires_at: float
+
+
+class MemoryCachedEmbeddingService(EmbeddingService):
+    """Embedding service with a thread-safe in-memory LRU and TTL cache."""
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        model: str,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            embedding_service (EmbeddingService): Service used on cache misses.
+            model (str): Name of the embedding model, part of the cache key.
+            ttl_seconds (float): Time after which an entry is embedded again;
+                0 or less keeps entries until they are evicted.
+            max_entries (int): Maximum number of cached embeddings.
+            max_bytes (int): Maximum total size of the cached vectors.
+        """
+        self._embedding_service = embedding_service
+        self._model = model
+        self._ttl = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._max_bytes = max_bytes
+        self._stats = EmbeddingCacheStats()
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._in_flight: Dict[Tuple[str, str], Future] = {}
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Return embeddings for the texts, embedding only uncached ones.
+
+        Texts with the same normalized form share one embedding, which is
+        computed from the first of them.
+
+        Args:
+            texts (List[str]): A list of text strings to embed.
+
+        Returns:
+            List[List[float]]: One embedding per input text, in order.
+        """
+        if not texts:
+            return []
+
+        keys = [(self._model, self._normalize(text)) for text in texts]
+        found: Dict[Tuple[str, str], List[float]] = {}
+        waiting: Dict[Tuple[str, str], Future] = {}
+        missing: Dict[Tuple[str, str], str] = {}
+        with self._lock:
+            now = time.monotonic()
+            for key, text in zip(keys, texts):
+                if key in found or key in waiting or key in missing:
+                    continue
+                entry = self._entries.get(key)
+                if entry is not None and entry.expires_at > now:
+                    self._entries.move_to_end(key)
+                    found[key] = entry.vector.tolist()
+                elif key in self._in_flight:
+                    waiting[key] = self._in_flight[key]
+                else:
+                    if entry is not None:
+                        self._remove(key)
+                        self._stats.expirations += 1
+                    self._in_flight[key] = Future()
+                    missing[key] = text
+            self._stats.hits += len(texts) - len(missing)
+            self._stats.misses += len(missing)
+
+        if missing:
+            try:
+                computed = self._embedding_service.embed_texts(list(missing.values()))
+            except BaseException as e:
+                with self._lock:
+                    for key in missing:
+                        self._in_flight.pop(key).set_exception(e)
+                raise
+            with self._lock:
+                for key, vector in zip(missing, computed):
+                    # Round to float32 so a miss returns exactly what a later hit will.
+                    stored = array("f", vector)
+                    self._store(key, stored)
+                    found[key] = stored.tolist()
+                    self._in_flight.pop(key).set_result(found[key])
+
+        for key, future in waiting.items():
+            found[key] = list(future.result())
+        return [list(found[key]) for key in keys]
+
+    def stats(self) -> EmbeddingCacheStats:
+        """Return a snapshot of the cache counters.
+
+        Returns:
+            EmbeddingCacheStats: Hits, misses, evictions, expirations and
+                current size.
+        """
+        with self._lock:
+            return self._stats.model_copy()
+
+    def clear(self) -> None:
+        """Drop every cached embedding."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.entries = 0
+            self._stats.size_bytes = 0
+
+    # -----------------------------------------------------
+    # Private helper methods
+    # -----------------------------------------------------
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Return the cache key text: NFC, case-folded, whitespace collapsed."""
+        return " ".join(unicodedata.normalize("NFC", text).casefold().split())
+
+    def _store(self, key: Tuple[str, str], vector: array) -> None:
+        """Insert a vector, then evict least recently used entries over the limits."""
+        if key in self._entries:
+            self._remove(key)
+        expires_at = time.monotonic() + self._ttl if self._ttl > 0 else float("inf")
+        self._entries[key] = _Entry(vector=vector, expires_at=expires_at)
+        self._stats.entries += 1
+        self._stats.size_bytes += len(vector) * vector.itemsize
+
+        while len(self._entries) > 1 and (
+            len(self._entries) > self._max_entries or self._stats.size_bytes > self._max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        """Delete one entry and update the size counters."""
+        entry = self._entries.pop(key)
+        self._stats.entries -= 1
+        self._stats.size_bytes -= len(entry.vector) * entry.vector.itemsize
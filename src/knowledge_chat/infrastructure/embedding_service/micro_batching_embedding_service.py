@@ -0,0 +1,167 @@
+"""Micro-batching embedding service implementation.
+
+This module provides an EmbeddingService decorator for latency-sensitive
+callers that each embed a handful of texts, such as chat queries. Requests
+arriving within a short window are coalesced into a single call to the
+wrapped service and every caller receives its own slice of the result, so
+under load many concurrent queries share one API round trip.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List
+
+from knowledge_chat.domain.entities.micro_batch_stats import MicroBatchStats
+from knowledge_chat.domain.interfaces.embedding_service import EmbeddingService
+
+
+@dataclass
+class _Request:
+    """Texts of one caller waiting for their embeddings."""
+
+    texts: List[str]
+    future: Future = field(default_factory=Future)
+    enqueued: float = field(default_factory=time.monotonic)
+
+
+class MicroBatchingEmbeddingService(EmbeddingService):
+    """Embedding service that coalesces concurrent requests into batches."""
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        window_ms: float = 5.0,
+        max_batch_size: int = 32,
+        max_in_flight: int = 4,
+    ) -> None:
+        """Initialize the batcher; its dispatcher thread starts on first use.
+
+        Args:
+            embedding_service (EmbeddingService): Service that embeds each batch.
+            window_ms (float): How long the first request of a batch waits
+                for others to join it, in milliseconds.
+            max_batch_size (int): Maximum number of texts per batch. A batch
+                is sent as soon as it is full.
+            max_in_flight (int): Batches that may be embedding at the same
+                time, so a slow call does not hold back the next window.
+        """
+        self._embedding_service = embedding_service
+        self._window = max(0.0, window_ms) / 1000.0
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_in_flight = max(1, max_in_flight)
+        self._requests: "queue.Queue[_Request]" = queue.Queue()
+        self._stats = MicroBatchStats(window_ms=window_ms, max_batch_size=self._max_batch_size)
+        self._lock = threading.Lock()
+        self._dispatcher: threading.Thread | None = None
+        self._pool: ThreadPoolExecutor | None = None
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed the texts as part of the next batch.
+
+        Requests larger than the maximum batch size are sent on their own,
+        without waiting for the window.
+
+        Args:
+            texts (List[str]): A list of text strings to embed.
+
+        Returns:
+            List[List[float]]: One embedding per input text, in order.
+        """
+        if not texts:
+            return []
+        if len(texts) >= self._max_batch_size:
+            self._record([_Request(texts)], len(texts))
+            return self._embedding_service.embed_texts(texts)
+
+        self._start()
+        request = _Request(texts)
+        self._requests.put(request)
+        return request.future.result()
+
+    def stats(self) -> MicroBatchStats:
+        """Return a snapshot of the batching metrics.
+
+        Returns:
+            MicroBatchStats: Configured window and achieved batch sizes.
+        """
+        with self._lock:
+            return self._stats.model_copy(deep=True)
+
+    # -----------------------------------------------------
+    # Private helper methods
+    # -----------------------------------------------------
+
+    def _start(self) -> None:
+        """Start the dispatcher thread and batch pool once."""
+        with self._lock:
+            if self._dispatcher is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_in_flight,
+                    thread_name_prefix="embedding-batch",
+                )
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch, name="embedding-batcher", daemon=True
+                )
+                self._dispatcher.start()
+
+    def _dispatch(self) -> None:
+        """Collect requests into batches and hand each batch to the pool."""
+        carry: _Request | None = None
+        while True:
+            first = carry or self._requests.get()
+            carry = None
+            batch = [first]
+            size = len(first.texts)
+            deadline = first.enqueued + self._window
+
+            while size < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    request = (
+                        self._requests.get(timeout=remaining)
+                        if remaining > 0
+                        else self._requests.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if size + len(request.texts) > self._max_batch_size:
+                    carry = request
+                    break
+                batch.append(request)
+                size += len(request.texts)
+
+            self._pool.submit(self._flush, batch, size)
+
+    def _flush(self, batch: List[_Request], size: int) -> None:
+        """Embed one batch and resolve the futures of its requests."""
+        self._record(batch, size)
+        try:
+            embeddings = self._embedding_service.embed_texts(
+                [text for request in batch for text in request.texts]
+            )
+        # pylint: disable=broad-exception-caught
+        except BaseException as e:
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        start = 0
+        for request in batch:
+            stop = start + len(request.texts)
+            request.future.set_result(embeddings[start:stop])
+            start = stop
+
+    def _record(self, batch: List[_Request], size: int) -> None:
+        """Update the metrics for a batch that is about to be sent."""
+        now = time.monotonic()
+        with self._lock:
+            stats = self._stats
+            stats.requests += len(batch)
+            stats.batches += 1
+            stats.texts += size
+            stats.largest_batch = max(stats.largest_batch, size)
+            stats.total_wait_ms += sum(now - request.enqueued for request in batch) * 1000.0
+            stats.batch_sizes[size] = stats.batch_sizes.get(size, 0) + 1
@@ -2,14 +2,64 @@
 
 This module provides an implementation of the EmbeddingService
 interface using the OpenAI API for generating text embeddings.
+
+Inputs are split into batches bounded by an estimated token count and
+batches are sent concurrently on a thread pool. Every request passes a
+token-bucket limiter for the account's request and token limits, and
+rate-limit (429), server (5xx) and connection errors are retried with
+exponential backoff. Results are always returned in input order.
+
+Models that support it can return shortened embeddings
+(``openai_embedding_dimensions``); their size is checked, as
+OpenAI-compatible gateways may ignore the parameter.
 """
 
-from typing import List
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
 
+import openai
 from openai import OpenAI
+from openai.types import Embedding
 
 from knowledge_chat.config.settings import Settings
 from knowledge_chat.domain.interfaces.embedding_service import EmbeddingService
+from knowledge_chat.infrastructure.embedding_service.rate_limiter import \
+    TokenBucketRateLimiter
+
+# The embeddings endpoint accepts at most this many inputs per request.
+_MAX_INPUTS_PER_REQUEST = 2048
+_MAX_BACKOFF_SECONDS = 60.0
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text without a tokenizer.
+
+    OpenAI tokenizers average about four bytes of UTF-8 per token; counting
+    bytes rather than characters keeps the estimate conservative for
+    non-ASCII scripts such as Vietnamese.
+    """
+    return len(text.encode("utf-8")) // 4 + 1
+
+
+def embedding_model_name(settings: Settings) -> str:
+    """Return the name under which caches store the configured embeddings.
+
+    Shortened embeddings of a model differ from its full-size ones, so
+    the requested size is part of the name.
+
+    Args:
+        settings (Settings): The application settings.
+
+    Returns:
+        str: The embedding model name, suffixed with the dimensions when
+            shortened embeddings are requested.
+    """
+    if settings.openai_embedding_dimensions > 0:
+        return f"{settings.openai_embedding_model}@{settings.openai_embedding_dimensions}"
+    return settings.openai_embedding_model
 
 
 class OpenAIEmbeddingService(EmbeddingService):
@@ -20,13 +70,26 @@ class OpenAIEmbeddingService(EmbeddingService):
 
         Args:
             settings (Settings): The application settings containing
-                API key and model configuration.
+                API key, model, dimensions, batching and rate-limit
+                configuration.
         """
         self.client = OpenAI(
             base_url=settings.openai_embedding_base_url,
-            api_key=settings.openai_embedding_key
+            api_key=settings.openai_embedding_key,
+            # Retries are handled here, in step with the rate limiter.
+            max_retries=0,
         )
         self.model = settings.openai_embedding_model
+        self.dimensions = max(0, settings.openai_embedding_dimensions)
+        self._batch_tokens = max(1, settings.openai_embedding_batch_tokens)
+        self._concurrency = max(1, settings.openai_embedding_concurrency)
+        self._max_retries = max(0, settings.openai_embedding_max_retries)
+        self._rate_limiter = TokenBucketRateLimiter(
+            requests_per_minute=settings.openai_embedding_requests_per_minute,
+            tokens_per_minute=settings.openai_embedding_tokens_per_minute,
+        )
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
 
     def embed_texts(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for a list of input texts.
@@ -37,9 +100,103 @@ class OpenAIEmbeddingService(EmbeddingService):
         Returns:
             List[List[float]]: A list of vector embeddings, where each
                 embedding is represented as a list of floats.
+
+        Raises:
+            ValueError: If the API ignored the requested dimensions.
         """
-        response = self.client.embeddings.create(
-            model=self.model,
-            input=texts,
-        )
-        return [item.embedding for item in response.data]
+        batches = list(self._split_batches(texts))
+        if len(batches) <= 1 or self._concurrency <= 1:
+            results = [self._embed_batch(batch) for batch in batches]
+        else:
+            # ``map`` yields results in submission order.
+            results = list(self._get_pool().map(self._embed_batch, batches))
+        return [embedding for batch in results for embedding in batch]
+
+    def close(self) -> None:
+        """Shut down the request thread pool, if one was started."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    # -----------------------------------------------------
+    # Private helper methods
+    # -----------------------------------------------------
+
+    def _split_batches(self, texts: List[str]) -> Iterator[List[str]]:
+        """Group consecutive texts into batches of at most ``batch_tokens``.
+
+        A single text larger than the budget forms a batch of its own.
+        """
+        batch: List[str] = []
+        batch_tokens = 0
+        for text in texts:
+            tokens = estimate_tokens(text)
+            if batch and (
+                batch_tokens + tokens > self._batch_tokens
+                or len(batch) >= _MAX_INPUTS_PER_REQUEST
+            ):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            yield batch
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Send one embeddings request, retrying transient failures."""
+        tokens = sum(estimate_tokens(text) for text in texts)
+        attempt = 0
+        while True:
+            self._rate_limiter.acquire(tokens)
+            try:
+                response = self.client.embeddings.create(
+                    model=self.model,
+                    input=texts,
+                    **({"dimensions": self.dimensions} if self.dimensions else {}),
+                )
+                # The API documents ``index``; do not rely on response order.
+                data = sorted(response.data, key=lambda item: item.index)
+                self._check_dimensions(data)
+                return [item.embedding for item in data]
+            except (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError) as e:
+                if attempt >= self._max_retries:
+                    raise
+                time.sleep(self._retry_delay(e, attempt))
+                attempt += 1
+
+    def _check_dimensions(self, data: List[Embedding]) -> None:
+        """Reject full-size embeddings returned for a shortened request."""
+        for item in data:
+            if self.dimensions and len(item.embedding) != self.dimensions:
+                raise ValueError(
+                    f"The embedding API returned {len(item.embedding)}-dimensional embeddings "
+                    f"instead of the requested {self.dimensions}; {self.model} may not "
+                    "support shortened embeddings."
+                )
+
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """Return the wait before the next attempt.
+
+        The server's ``Retry-After`` header wins when present; otherwise
+        the delay grows exponentially with full jitter.
+        """
+        response = getattr(error, "response", None)
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            try:
+                return min(float(retry_after), _MAX_BACKOFF_SECONDS)
+            except (TypeError, ValueError):
+                pass
+        return random.uniform(0, min(_MAX_BACKOFF_SECONDS, 2.0 ** attempt))
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Start the request thread pool on first use and reuse it afterwards."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._concurrency,
+                    thread_name_prefix="openai-embedding",
+                )
+            return self._pool
@@ -0,0 +1,75 @@
+"""Token-bucket rate limiter for API clients.
+
+This module provides a thread-safe limiter that enforces a maximum number
+of requests and tokens per minute, as published by API providers. Each
+limit is a bucket that holds up to one minute of budget and refills
+continuously, so short bursts are allowed while the average rate stays
+within the limit.
+"""
+
+import threading
+import time
+
+
+class TokenBucketRateLimiter:
+    """Blocks callers until their request fits within the per-minute limits."""
+
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0) -> None:
+        """Initialize both buckets full.
+
+        Args:
+            requests_per_minute (int): Maximum requests per minute; 0 or
+                less disables the request limit.
+            tokens_per_minute (int): Maximum tokens per minute; 0 or less
+                disables the token limit.
+        """
+        self._request_capacity = float(max(0, requests_per_minute))
+        self._token_capacity = float(max(0, tokens_per_minute))
+        self._requests = self._request_capacity
+        self._tokens = self._token_capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Wait until one request of ``tokens`` tokens may be sent.
+
+        Requests larger than the per-minute token limit wait for a full
+        bucket instead of blocking forever.
+
+        Args:
+            tokens (int): Number of tokens the request will consume.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        waited = 0.0
+        tokens = min(float(tokens), self._token_capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                missing_requests = 1.0 - self._requests if self._request_capacity else 0.0
+                missing_tokens = tokens - self._tokens if self._token_capacity else 0.0
+                if missing_requests <= 0 and missing_tokens <= 0:
+                    if self._request_capacity:
+                        self._requests -= 1.0
+                    if self._token_capacity:
+                        self._tokens -= tokens
+                    return waited
+                delay = max(
+                    missing_requests * 60.0 / self._request_capacity if missing_requests > 0 else 0.0,
+                    missing_tokens * 60.0 / self._token_capacity if missing_tokens > 0 else 0.0,
+                )
+            time.sleep(delay)
+            waited += delay
+
+    def _refill(self) -> None:
+        """Add the budget accrued since the last update, up to capacity."""
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(
+            self._request_capacity, self._requests + elapsed * self._request_capacity / 60.0
+        )
+        self._tokens = min(
+            self._token_capacity, self._tokens + elapsed * self._token_capacity / 60.0
+        )
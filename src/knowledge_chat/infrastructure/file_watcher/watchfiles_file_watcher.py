@@ -0,0 +1,97 @@
+"""watchfiles-based file watcher implementation.
+
+This module provides an implementation of the FileWatcher interface on
+top of ``watchfiles``, which uses native file system notifications
+(inotify on Linux) and only reports the paths that changed. Where native
+notifications are not available, e.g. on network shares or when the
+inotify watch limit is exhausted, it falls back to polling.
+"""
+
+from threading import Event
+from typing import Iterator, List, Sequence
+
+from watchfiles import Change, DefaultFilter, watch
+
+from knowledge_chat.domain.interfaces.file_watcher import (FileChange,
+                                                           FileWatcher)
+
+_CHANGE_NAMES = {
+    Change.added: "added",
+    Change.modified: "modified",
+    Change.deleted: "deleted",
+}
+
+
+class WatchfilesFileWatcher(FileWatcher):
+    """File watcher using native notifications with a polling fallback."""
+
+    def __init__(
+        self,
+        debounce_ms: int = 1600,
+        force_polling: bool = False,
+        poll_interval_ms: int = 1000,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            debounce_ms (int): Changes are collected until no new change
+                arrived for this long, then reported as one batch.
+            force_polling (bool): Poll instead of using native notifications.
+            poll_interval_ms (int): Interval between scans when polling.
+        """
+        self._debounce_ms = debounce_ms
+        self._force_polling = force_polling
+        self._poll_interval_ms = poll_interval_ms
+        self.polling = force_polling
+
+    def watch(
+        self,
+        directories: Sequence[str],
+        stop_event: Event | None = None,
+    ) -> Iterator[List[FileChange]]:
+        """Watch directories recursively and yield batches of changes.
+
+        Args:
+            directories (Sequence[str]): Directories to watch.
+            stop_event (Event | None): Watching stops once this event is set.
+
+        Yields:
+            List[FileChange]: The changes of one debounced burst.
+        """
+        started = False
+        try:
+            for batch in self._watch(directories, stop_event, self._force_polling):
+                started = True
+                yield batch
+        except OSError:
+            # Native notifications fail at start-up, e.g. when the inotify
+            # watch limit is too low for the tree; later errors are real.
+            if started or self.polling:
+                raise
+            self.polling = True
+            yield from self._watch(directories, stop_event, True)
+
+    # -----------------------------------------------------
+    # Private helper methods
+    # -----------------------------------------------------
+
+    def _watch(
+        self,
+        directories: Sequence[str],
+        stop_event: Event | None,
+        force_polling: bool,
+    ) -> Iterator[List[FileChange]]:
+        """Translate watchfiles change sets into FileChange batches."""
+        for changes in watch(
+            *directories,
+            watch_filter=DefaultFilter(),
+            debounce=self._debounce_ms,
+            stop_event=stop_event,
+            force_polling=force_polling,
+            poll_delay_ms=self._poll_interval_ms,
+            raise_interrupt=False,
+        ):
+            yield [
+                FileChange(path=path, change=_CHANGE_NAMES[change])
+                for change, path in sorted(changes, key=lambda item: item[1])
+            ]
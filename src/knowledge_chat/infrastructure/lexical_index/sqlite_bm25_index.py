@@ -0,0 +1,701 @@
+"""SQLite-based BM25 lexical index implementation.
+
+This module provides an implementation of the LexicalIndex interface that
+keeps an inverted index in a SQLite file and ranks records with Okapi
+BM25.
+
+Every indexed record gets a dense integer document number. New records
+are first written to a pending table, one row per record holding its
+term frequencies, and their postings are kept in memory. Once
+``flush_docs`` records are pending they are written as an immutable
+*segment*: for every term, the document numbers and term frequencies of
+the segment's records are stored as packed little-endian
+``uint32``/``uint16`` arrays in one row, so looking up a term costs one
+B-tree seek per segment and decoding is a zero-copy ``numpy.frombuffer``.
+Whenever there are more than ``max_segments`` segments, the smallest ones
+are merged into one, which keeps the number of seeks per term bounded.
+
+Replaced and deleted records are only removed from the document table (a
+tombstone); their postings are skipped at query time and dropped when
+segments are merged. As in Lucene, document frequencies still count them
+until then. Document lengths are mirrored in memory, so scoring needs no
+further queries. Queries score rare terms first and skip the postings of
+common terms that can no longer change the top results (see
+``_top_documents``). Full rebuilds can be written into staging tables in
+the same file and swapped in atomically.
+
+Several processes may share the file, e.g. the web app and a CLI import.
+Every write stores a new random version in a meta table; before a search
+or a write, an index whose version is out of date reloads its in-memory
+state. Writes take the database write lock before that check, so they
+always apply to the current state.
+"""
+
+import contextlib
+import itertools
+import math
+import os
+import sqlite3
+import threading
+import uuid
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from knowledge_chat.config.settings import Settings
+from knowledge_chat.domain.interfaces.lexical_index import LexicalIndex
+from knowledge_chat.infrastructure.lexical_index.vietnamese_tokenizer import (
+    document_terms, query_terms)
+
+# SQLite limits the number of bound parameters per statement.
+_MAX_PARAMS = 900
+_MAX_FREQUENCY = np.iinfo(np.uint16).max
+# Posting rows written per statement.
+_INSERT_BATCH_SIZE = 1000
+
+
+class SQLiteBM25Index(LexicalIndex):
+    """Segmented BM25 inverted index backed by a local SQLite database."""
+
+    def __init__(
+        self,
+        settings: Settings,
+        prefix: str = "bm25",
+        max_segments: int = 16,
+        flush_docs: int = 4096,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        """Open (and create if needed) the index tables.
+
+        Args:
+            settings (Settings): Application configuration instance
+                containing the lexical index path.
+            prefix (str): Prefix of the index tables, e.g. of a staging index.
+            max_segments (int): Number of segments above which the smallest
+                segments are merged.
+            flush_docs (int): Number of pending records written as a new
+                segment.
+            k1 (float): BM25 term frequency saturation.
+            b (float): BM25 document length normalization.
+        """
+        directory = os.path.dirname(settings.lexical_index_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._settings = settings
+        self._prefix = prefix
+        self._docs = f"{prefix}_docs"
+        self._pending = f"{prefix}_pending"
+        self._segments = f"{prefix}_segments"
+        self._postings = f"{prefix}_postings"
+        self._meta = f"{prefix}_meta"
+        self._max_segments = max(2, max_segments)
+        self._flush_docs = max(1, flush_docs)
+        self._k1 = k1
+        self._b = b
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(settings.lexical_index_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._docs} ("
+            " doc_id INTEGER PRIMARY KEY,"
+            " record_id TEXT NOT NULL,"
+            " length INTEGER NOT NULL"
+            ")"
+        )
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._pending} ("
+            " doc_id INTEGER PRIMARY KEY,"
+            " terms TEXT NOT NULL"
+            ")"
+        )
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._segments} ("
+            " segment INTEGER PRIMARY KEY,"
+            " docs INTEGER NOT NULL,"
+            " max_doc_id INTEGER NOT NULL"
+            ")"
+        )
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._postings} ("
+            " term TEXT NOT NULL,"
+            " segment INTEGER NOT NULL,"
+            " doc_ids BLOB NOT NULL,"
+            " frequencies BLOB NOT NULL,"
+            " PRIMARY KEY (term, segment)"
+            ") WITHOUT ROWID"
+        )
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._meta} ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL"
+            ")"
+        )
+        # A promoted staging table keeps the index it was built with.
+        if not self._has_index(self._docs):
+            self._conn.execute(f"CREATE UNIQUE INDEX {self._docs}_record ON {self._docs}(record_id)")
+        if not self._has_index(self._postings):
+            self._conn.execute(f"CREATE INDEX {self._postings}_segment ON {self._postings}(segment)")
+        self._conn.commit()
+        self._load()
+
+    def add_documents(self, ids: List[str], texts: List[str]) -> None:
+        """Index texts, replacing the entries of already indexed IDs.
+
+        Args:
+            ids (List[str]): Identifiers of the records.
+            texts (List[str]): Text of each record.
+        """
+        latest = dict(zip(ids, texts))
+        if not latest:
+            return
+        analyzed = [
+            (record_id, length, terms)
+            for record_id, (length, terms) in zip(latest, map(document_terms, latest.values()))
+        ]
+
+        with self._lock, self._writing():
+            doc_id = self._first_free_doc_id()
+            rows: List[Tuple[int, str, int]] = []
+            pending: List[Tuple[int, str]] = []
+            indexed: List[Tuple[int, int, Dict[str, int]]] = []
+            for record_id, length, terms in analyzed:
+                if not length:
+                    continue
+                rows.append((doc_id, record_id, length))
+                indexed.append((doc_id, length, terms))
+                pending.append(
+                    (doc_id, " ".join(f"{term} {frequency}" for term, frequency in terms.items()))
+                )
+                doc_id += 1
+
+            replaced = self._delete_rows(list(latest))
+            self._conn.executemany(
+                f"INSERT INTO {self._docs} (doc_id, record_id, length) VALUES (?, ?, ?)", rows
+            )
+            self._conn.executemany(
+                f"INSERT INTO {self._pending} (doc_id, terms) VALUES (?, ?)", pending
+            )
+
+            self._forget(replaced)
+            self._reserve(doc_id)
+            for new_id, length, terms in indexed:
+                self._lengths[new_id] = length
+                self._total_length += length
+                self._buffer_postings(new_id, terms)
+            self._documents += len(rows)
+            self._buffered_docs += len(rows)
+            self._next_doc_id = doc_id
+            if self._buffered_docs >= self._flush_docs:
+                self._flush()
+
+    def search(self, query: str, top_k: int = 5) -> List[Tuple[str, float]]:
+        """Find the records with the highest BM25 score for a query.
+
+        Args:
+            query (str): The query text.
+            top_k (int, optional): Maximum number of results. Defaults to 5.
+
+        Returns:
+            List[Tuple[str, float]]: ``(id, score)`` pairs, best match first.
+        """
+        terms = query_terms(query)[:_MAX_PARAMS]
+        if not terms or top_k <= 0:
+            return []
+
+        with self._lock, self._reading():
+            if not self._documents:
+                return []
+            placeholders = ",".join("?" * len(terms))
+            rows = self._conn.execute(
+                f"SELECT term, doc_ids, frequencies FROM {self._postings}"
+                f" WHERE term IN ({placeholders})",
+                terms,
+            ).fetchall()
+            postings: Dict[str, List[Tuple[np.ndarray, np.ndarray]]] = {}
+            for term, doc_ids, frequencies in rows:
+                postings.setdefault(term, []).append(
+                    (np.frombuffer(doc_ids, dtype="<u4"), np.frombuffer(frequencies, dtype="<u2"))
+                )
+            for term in terms:
+                if term in self._buffer:
+                    doc_ids, frequencies = self._buffer[term]
+                    postings.setdefault(term, []).append(
+                        (np.array(doc_ids, dtype=np.uint32), np.array(frequencies, dtype=np.uint16))
+                    )
+
+            weighted = []
+            for parts in postings.values():
+                # Postings of tombstones count until a merge drops them.
+                frequency = min(sum(len(part[0]) for part in parts), self._documents)
+                idf = math.log(1.0 + (self._documents - frequency + 0.5) / (frequency + 0.5))
+                weighted.append((idf, parts))
+            if not weighted:
+                return []
+            doc_ids, scores = self._top_documents(weighted, top_k)
+            if not len(doc_ids):
+                return []
+            best = np.lexsort((doc_ids, -scores))
+            doc_ids, scores = doc_ids[best], scores[best]
+            best_ids = [int(doc_id) for doc_id in doc_ids]
+            placeholders = ",".join("?" * len(best_ids))
+            record_ids = dict(
+                self._conn.execute(
+                    f"SELECT doc_id, record_id FROM {self._docs} WHERE doc_id IN ({placeholders})",
+                    best_ids,
+                )
+            )
+        return [(record_ids[doc_id], float(score)) for doc_id, score in zip(best_ids, scores)]
+
+    def delete_documents(self, ids: List[str]) -> None:
+        """Tombstone records; their postings are dropped by later merges.
+
+        Args:
+            ids (List[str]): Identifiers of the records to remove.
+        """
+        with self._lock, self._writing():
+            self._forget(self._delete_rows(ids))
+
+    def create_staging(self) -> "SQLiteBM25Index":
+        """Create empty staging tables in the same database file.
+
+        Returns:
+            SQLiteBM25Index: An index bound to the staging tables.
+        """
+        return SQLiteBM25Index(
+            settings=self._settings,
+            prefix=f"{self._prefix}_staging_{uuid.uuid4().hex[:8]}",
+            max_segments=self._max_segments,
+            flush_docs=self._flush_docs,
+            k1=self._k1,
+            b=self._b,
+        )
+
+    def promote_staging(self, staging: LexicalIndex) -> None:
+        """Swap staging tables in place of the live tables in one transaction.
+
+        Args:
+            staging (LexicalIndex): An index returned by ``create_staging``.
+        """
+        if not isinstance(staging, SQLiteBM25Index):
+            raise TypeError("Staging index must be a SQLiteBM25Index.")
+        staging._conn.close()
+        with self._lock:
+            # DDL is only transactional with an explicit BEGIN.
+            self._conn.execute("BEGIN")
+            try:
+                for live, staged in zip(self._tables(), staging._tables()):
+                    self._conn.execute(f"DROP TABLE {live}")
+                    self._conn.execute(f"ALTER TABLE {staged} RENAME TO {live}")
+                # Other processes reload the promoted tables.
+                self._write_version()
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+            self._load()
+
+    def discard_staging(self, staging: LexicalIndex) -> None:
+        """Drop staging tables.
+
+        Args:
+            staging (LexicalIndex): An index returned by ``create_staging``.
+        """
+        if not isinstance(staging, SQLiteBM25Index):
+            raise TypeError("Staging index must be a SQLiteBM25Index.")
+        staging._conn.close()
+        with self._lock:
+            for table in staging._tables():
+                self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+            self._conn.commit()
+
+    def delete_all(self) -> None:
+        """Remove every record and segment."""
+        with self._lock, self._writing():
+            for table in self._tables():
+                self._conn.execute(f"DELETE FROM {table}")
+            self._load()
+
+    # -----------------------------------------------------
+    # Private helper methods
+    # -----------------------------------------------------
+
+    def _top_documents(
+        self,
+        terms: List[Tuple[float, List[Tuple[np.ndarray, np.ndarray]]]],
+        top_k: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the ``top_k`` best-scoring live documents for weighted terms.
+
+        Scoring is exact but skips most postings of common terms (MaxScore
+        pruning). A term adds at most ``idf * (k1 + 1)`` to a score, so terms
+        are scored rarest first into a dense accumulator. As soon as the
+        bounds of the remaining terms add up to no more than the
+        ``top_k``-th best partial score, no unseen document can reach the
+        top; the remaining terms are then only looked up, by binary search,
+        for the documents whose partial score plus those bounds still can.
+
+        Args:
+            terms (List[Tuple[float, List[Tuple[np.ndarray, np.ndarray]]]]):
+                The idf and the posting parts (sorted document numbers and
+                their frequencies) of every query term.
+            top_k (int): Number of documents to return.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The document numbers and scores of
+                the best documents, in no particular order.
+        """
+        terms = sorted(terms, key=lambda term: term[0], reverse=True)
+        bounds = [idf * (self._k1 + 1.0) for idf, _ in terms]
+        # remaining[i] bounds what terms i and later can still add.
+        remaining = list(itertools.accumulate(reversed(bounds)))[::-1] + [0.0]
+        scores = np.zeros(len(self._lengths), dtype=np.float64)
+
+        candidates = np.empty(0, dtype=np.uint32)
+        touched: List[np.ndarray] = []
+        for position, (idf, parts) in enumerate(terms):
+            # No partial score can exceed the bounds of the terms scored so
+            # far, so pruning cannot start before they outweigh the rest.
+            if remaining[0] - remaining[position] >= remaining[position]:
+                candidates = _scored_documents(scores, candidates, touched)
+                touched = []
+                threshold = _kth_largest(scores[candidates], top_k)
+                if threshold is not None and remaining[position] <= threshold:
+                    return self._rescore_candidates(
+                        terms[position:], remaining[position:], scores, candidates, threshold, top_k
+                    )
+            for doc_ids, frequencies in parts:
+                lengths = self._lengths[doc_ids]
+                live = lengths > 0
+                if not live.all():
+                    doc_ids, frequencies, lengths = doc_ids[live], frequencies[live], lengths[live]
+                scores[doc_ids] += self._term_scores(idf, frequencies, lengths)
+                touched.append(doc_ids)
+
+        candidates = _scored_documents(scores, candidates, touched)
+        return _select_best(candidates, scores[candidates], top_k)
+
+    def _rescore_candidates(
+        self,
+        terms: List[Tuple[float, List[Tuple[np.ndarray, np.ndarray]]]],
+        remaining: List[float],
+        scores: np.ndarray,
+        candidates: np.ndarray,
+        threshold: float,
+        top_k: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Add the remaining terms to the candidates that can still make the top."""
+        for position, (idf, parts) in enumerate(terms):
+            candidates = candidates[scores[candidates] + remaining[position] >= threshold]
+            for doc_ids, frequencies in parts:
+                if not len(doc_ids):
+                    continue
+                if len(candidates) * 4 > len(doc_ids):
+                    # Scoring the whole part is cheaper than searching it;
+                    # only the candidates' scores are read afterwards.
+                    lengths = self._lengths[doc_ids]
+                    live = lengths > 0
+                    scores[doc_ids[live]] += self._term_scores(idf, frequencies[live], lengths[live])
+                    continue
+                # Matching dtypes keep numpy from converting the postings.
+                found = np.searchsorted(doc_ids, candidates.astype(doc_ids.dtype))
+                found[found == len(doc_ids)] = 0
+                hits = doc_ids[found] == candidates
+                if hits.any():
+                    matched = candidates[hits]
+                    scores[matched] += self._term_scores(
+                        idf, frequencies[found[hits]], self._lengths[matched]
+                    )
+            threshold = max(threshold, _kth_largest(scores[candidates], top_k) or 0.0)
+        return _select_best(candidates, scores[candidates], top_k)
+
+    def _term_scores(self, idf: float, frequencies: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """Return the BM25 contribution of one term to the given documents."""
+        average_length = self._total_length / self._documents
+        norm = self._k1 * (1.0 - self._b + self._b * lengths / average_length)
+        frequencies = frequencies.astype(np.float64)
+        return idf * frequencies * (self._k1 + 1.0) / (frequencies + norm)
+
+    def _tables(self) -> Tuple[str, str, str, str, str]:
+        """Return the names of the index tables."""
+        return self._docs, self._pending, self._segments, self._postings, self._meta
+
+    @contextlib.contextmanager
+    def _reading(self) -> Iterator[None]:
+        """Read one consistent snapshot, reloading if another process wrote."""
+        self._conn.execute("BEGIN")
+        try:
+            self._sync()
+            yield
+        finally:
+            self._conn.commit()
+
+    @contextlib.contextmanager
+    def _writing(self) -> Iterator[None]:
+        """Run a write transaction on up-to-date in-memory state.
+
+        The write lock is taken before the version is checked, so no other
+        process can write in between. If the transaction fails, the
+        in-memory state is reloaded from the rolled-back tables.
+        """
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._sync()
+            yield
+            self._write_version()
+            self._conn.commit()
+        except BaseException:
+            self._conn.rollback()
+            self._load()
+            raise
+
+    def _sync(self) -> None:
+        """Reload the in-memory state if the tables changed since it was read."""
+        if self._read_version() != self._version:
+            self._load()
+
+    def _read_version(self) -> str:
+        """Return the version stored by the last write, or an empty string."""
+        row = self._conn.execute(f"SELECT value FROM {self._meta} WHERE key = 'version'").fetchone()
+        return row[0] if row else ""
+
+    def _write_version(self) -> None:
+        """Store a new random version within the current transaction."""
+        self._version = uuid.uuid4().hex
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO {self._meta} (key, value) VALUES ('version', ?)",
+            (self._version,),
+        )
+
+    def _first_free_doc_id(self) -> int:
+        """Return the first document number not used by a record or a segment.
+
+        Read within the write transaction, so concurrent writers never hand
+        out the same number.
+        """
+        (last,) = self._conn.execute(
+            f"SELECT MAX(last) FROM (SELECT MAX(doc_id) AS last FROM {self._docs}"
+            f" UNION ALL SELECT MAX(max_doc_id) FROM {self._segments})"
+        ).fetchone()
+        return max(self._next_doc_id, (last or 0) + 1)
+
+    def _has_index(self, table: str) -> bool:
+        """Return whether a table already has a secondary index."""
+        return self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table,),
+        ).fetchone() is not None
+
+    def _load(self) -> None:
+        """Read document lengths, segment sizes and pending postings into memory."""
+        self._version = self._read_version()
+        rows = self._conn.execute(f"SELECT doc_id, length FROM {self._docs}").fetchall()
+        segments = self._conn.execute(
+            f"SELECT segment, docs, max_doc_id FROM {self._segments}"
+        ).fetchall()
+        self._segment_sizes: Dict[int, int] = {segment: docs for segment, docs, _ in segments}
+        self._next_segment = max(self._segment_sizes, default=0) + 1
+        self._next_doc_id = max(
+            max((max_doc_id for _, _, max_doc_id in segments), default=0),
+            max((doc_id for doc_id, _ in rows), default=0),
+        ) + 1
+        self._lengths = np.zeros(self._next_doc_id, dtype=np.uint32)
+        if rows:
+            table = np.array(rows, dtype=np.int64)
+            self._lengths[table[:, 0]] = table[:, 1]
+        self._documents = len(rows)
+        self._total_length = int(self._lengths.sum(dtype=np.int64))
+
+        self._buffer: Dict[str, Tuple[List[int], List[int]]] = {}
+        self._buffered_docs = 0
+        for doc_id, terms in self._conn.execute(
+            f"SELECT doc_id, terms FROM {self._pending} ORDER BY doc_id"
+        ):
+            self._buffer_postings(doc_id, _parse_terms(terms))
+            self._buffered_docs += 1
+
+    def _reserve(self, next_doc_id: int) -> None:
+        """Grow the length array geometrically to hold ``next_doc_id`` entries."""
+        if next_doc_id > len(self._lengths):
+            grown = np.zeros(max(next_doc_id, 2 * len(self._lengths)), dtype=np.uint32)
+            grown[:len(self._lengths)] = self._lengths
+            self._lengths = grown
+
+    def _buffer_postings(self, doc_id: int, terms: Dict[str, int]) -> None:
+        """Add the postings of a pending document to the in-memory buffer."""
+        for term, frequency in terms.items():
+            doc_ids, frequencies = self._buffer.setdefault(term, ([], []))
+            doc_ids.append(doc_id)
+            frequencies.append(min(frequency, _MAX_FREQUENCY))
+
+    def _delete_rows(self, record_ids: List[str]) -> List[int]:
+        """Delete document rows by record ID and return their document numbers."""
+        doc_ids: List[int] = []
+        for start in range(0, len(record_ids), _MAX_PARAMS):
+            batch = record_ids[start:start + _MAX_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            found = [
+                doc_id
+                for (doc_id,) in self._conn.execute(
+                    f"SELECT doc_id FROM {self._docs} WHERE record_id IN ({placeholders})", batch
+                )
+            ]
+            if not found:
+                continue
+            doc_placeholders = ",".join("?" * len(found))
+            self._conn.execute(f"DELETE FROM {self._docs} WHERE doc_id IN ({doc_placeholders})", found)
+            self._conn.execute(f"DELETE FROM {self._pending} WHERE doc_id IN ({doc_placeholders})", found)
+            doc_ids.extend(found)
+        return doc_ids
+
+    def _forget(self, doc_ids: List[int]) -> None:
+        """Mark deleted documents as tombstones in memory."""
+        if not doc_ids:
+            return
+        indices = np.array(doc_ids, dtype=np.int64)
+        self._documents -= int(np.count_nonzero(self._lengths[indices]))
+        self._total_length -= int(self._lengths[indices].sum(dtype=np.int64))
+        self._lengths[indices] = 0
+
+    def _insert_postings(self, rows: Iterable[Tuple[str, int, bytes, bytes]]) -> None:
+        """Insert ``(term, segment, doc_ids, frequencies)`` rows in batches."""
+        rows = iter(rows)
+        while batch := list(itertools.islice(rows, _INSERT_BATCH_SIZE)):
+            self._conn.executemany(
+                f"INSERT INTO {self._postings} (term, segment, doc_ids, frequencies)"
+                " VALUES (?, ?, ?, ?)",
+                batch,
+            )
+
+    def _flush(self) -> None:
+        """Write the live pending postings as a new segment.
+
+        Runs within the caller's write transaction, as does ``_merge``.
+        """
+        segment = self._next_segment
+        present = np.zeros(len(self._lengths), dtype=bool)
+
+        def live_rows() -> Iterable[Tuple[str, int, bytes, bytes]]:
+            for term, (doc_ids, frequencies) in self._buffer.items():
+                ids = np.array(doc_ids, dtype="<u4")
+                counts = np.array(frequencies, dtype="<u2")
+                live = self._lengths[ids] > 0
+                if not live.all():
+                    ids, counts = ids[live], counts[live]
+                if len(ids):
+                    present[ids] = True
+                    yield term, segment, ids.tobytes(), counts.tobytes()
+
+        self._insert_postings(live_rows())
+        docs = int(np.count_nonzero(present))
+        if docs:
+            self._conn.execute(
+                f"INSERT INTO {self._segments} (segment, docs, max_doc_id) VALUES (?, ?, ?)",
+                (segment, docs, self._next_doc_id - 1),
+            )
+        self._conn.execute(f"DELETE FROM {self._pending}")
+
+        self._buffer = {}
+        self._buffered_docs = 0
+        self._next_segment = segment + 1
+        if docs:
+            self._segment_sizes[segment] = docs
+        if len(self._segment_sizes) > self._max_segments:
+            self._merge_smallest()
+
+    def _merge_smallest(self) -> None:
+        """Merge the smallest segments so that half the segment budget is free."""
+        by_size = sorted(self._segment_sizes, key=lambda segment: self._segment_sizes[segment])
+        self._merge(by_size[:len(by_size) - self._max_segments // 2])
+
+    def _merge(self, segments: List[int]) -> None:
+        """Rewrite segments as one, dropping the postings of tombstones."""
+        placeholders = ",".join("?" * len(segments))
+        merged = self._next_segment
+        present = np.zeros(len(self._lengths), dtype=bool)
+
+        def merged_rows(
+            rows: Iterable[Tuple[str, bytes, bytes]],
+        ) -> Iterable[Tuple[str, int, bytes, bytes]]:
+            for term, group in itertools.groupby(rows, key=lambda row: row[0]):
+                group = list(group)
+                doc_ids = np.concatenate([np.frombuffer(row[1], dtype="<u4") for row in group])
+                frequencies = np.concatenate([np.frombuffer(row[2], dtype="<u2") for row in group])
+                live = self._lengths[doc_ids] > 0
+                if not live.all():
+                    doc_ids, frequencies = doc_ids[live], frequencies[live]
+                if not len(doc_ids):
+                    continue
+                if len(group) > 1:
+                    order = np.argsort(doc_ids, kind="stable")
+                    doc_ids, frequencies = doc_ids[order], frequencies[order]
+                present[doc_ids] = True
+                yield term, merged, doc_ids.tobytes(), frequencies.tobytes()
+
+        (max_doc_id,) = self._conn.execute(
+            f"SELECT MAX(max_doc_id) FROM {self._segments} WHERE segment IN ({placeholders})",
+            segments,
+        ).fetchone()
+        # The merged segment is excluded by the filter, so inserting while
+        # reading is safe.
+        self._insert_postings(
+            merged_rows(
+                self._conn.execute(
+                    f"SELECT term, doc_ids, frequencies FROM {self._postings}"
+                    f" WHERE segment IN ({placeholders}) ORDER BY term",
+                    segments,
+                )
+            )
+        )
+        self._conn.execute(f"DELETE FROM {self._postings} WHERE segment IN ({placeholders})", segments)
+        self._conn.execute(f"DELETE FROM {self._segments} WHERE segment IN ({placeholders})", segments)
+        docs = int(np.count_nonzero(present))
+        if docs:
+            self._conn.execute(
+                f"INSERT INTO {self._segments} (segment, docs, max_doc_id) VALUES (?, ?, ?)",
+                (merged, docs, max_doc_id),
+            )
+
+        for segment in segments:
+            del self._segment_sizes[segment]
+        self._next_segment = merged + 1
+        if docs:
+            self._segment_sizes[merged] = docs
+
+
+def _parse_terms(terms: str) -> Dict[str, int]:
+    """Parse the ``"term frequency term frequency ..."`` text of a pending row."""
+    parts = terms.split(" ")
+    return {term: int(frequency) for term, frequency in zip(parts[::2], parts[1::2])}
+
+
+def _kth_largest(values: np.ndarray, k: int) -> float | None:
+    """Return the ``k``-th largest value, or None if there are fewer values."""
+    if len(values) < k:
+        return None
+    return float(np.partition(values, len(values) - k)[len(values) - k])
+
+
+def _scored_documents(
+    scores: np.ndarray, candidates: np.ndarray, touched: List[np.ndarray]
+) -> np.ndarray:
+    """Return the sorted numbers of the documents scored so far.
+
+    Merging the newly scored postings into the candidates is cheaper than
+    scanning the whole accumulator while few postings were scored.
+    """
+    if (len(candidates) + sum(len(doc_ids) for doc_ids in touched)) * 8 < len(scores):
+        return np.unique(np.concatenate([candidates, *touched]))
+    return np.flatnonzero(scores).astype(np.uint32)
+
+
+def _select_best(
+    doc_ids: np.ndarray, scores: np.ndarray, top_k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the ``top_k`` highest-scoring documents, in no particular order."""
+    if len(doc_ids) > top_k:
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        doc_ids, scores = doc_ids[best], scores[best]
+    return doc_ids, scores
@@ -0,0 +1,82 @@
+"""Tokenization of Vietnamese and English text for the lexical index.
+
+Vietnamese words are written as space-separated syllables ("kết nối"), and
+users often type them without diacritics ("ket noi"). Texts are therefore
+indexed under two kinds of terms:
+
+- every syllable or word as written, lower-cased ("kết", "0x80070005");
+- its diacritic-free form when that differs ("ket"), so unaccented
+  queries still match.
+
+Query words typed with diacritics only match the accented form, so a
+precise query stays precise; words typed without diacritics match both.
+Syllables are indexed one by one; BM25 already ranks chunks holding all
+syllables of a compound word above chunks holding only some of them.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Tuple
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Longer "words" are hashes, base64 blobs and the like.
+_MAX_WORD_LENGTH = 64
+
+
+def tokenize(text: str) -> List[str]:
+    """Split a text into lower-cased words.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        List[str]: The words in text order.
+    """
+    normalized = unicodedata.normalize("NFC", text).lower()
+    return [word for word in _WORD_PATTERN.findall(normalized) if len(word) <= _MAX_WORD_LENGTH]
+
+
+def fold_diacritics(word: str) -> str:
+    """Remove the diacritics of a word, mapping "đ" to "d".
+
+    Args:
+        word (str): A lower-cased word.
+
+    Returns:
+        str: The word without diacritics.
+    """
+    if word.isascii():
+        return word
+    decomposed = unicodedata.normalize("NFD", word.replace("đ", "d"))
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def document_terms(text: str) -> Tuple[int, Dict[str, int]]:
+    """Return the length of a text and the frequency of its index terms.
+
+    Args:
+        text (str): The text to index.
+
+    Returns:
+        Tuple[int, Dict[str, int]]: The number of words and the frequency
+            of every term.
+    """
+    words = tokenize(text)
+    folded = [fold_diacritics(word) for word in words]
+    terms: Counter = Counter(words)
+    terms.update(plain for word, plain in zip(words, folded) if plain != word)
+    return len(words), dict(terms)
+
+
+def query_terms(text: str) -> List[str]:
+    """Return the distinct index terms to look up for a query.
+
+    Args:
+        text (str): The query text.
+
+    Returns:
+        List[str]: The terms in query order.
+    """
+    return list(dict.fromkeys(tokenize(text)))
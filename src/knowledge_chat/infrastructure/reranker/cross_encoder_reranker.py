@@ -0,0 +1,161 @@
+"""Local cross-encoder reranker implementation.
+
+This module provides an implementation of the Reranker interface that
+scores (query, document) pairs with a cross-encoder model running on the
+CPU through ONNX Runtime, e.g. an ONNX export of
+``cross-encoder/ms-marco-MiniLM-L-6-v2`` or ``BAAI/bge-reranker-base``.
+
+The model directory must contain ``model.onnx`` and the Hugging Face
+``tokenizer.json`` of the model. Loaded models are cached per process, so
+every reranker instance using the same directory shares one set of
+weights. Pairs are scored in batches on a thread pool; ONNX Runtime
+releases the GIL while a batch runs.
+"""
+
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+import onnxruntime
+from tokenizers import Tokenizer
+
+from knowledge_chat.domain.interfaces.reranker import Reranker
+
+
+@lru_cache(maxsize=2)
+def load_cross_encoder(
+    model_path: str,
+    max_length: int,
+    threads: int,
+) -> Tuple[onnxruntime.InferenceSession, Tokenizer]:
+    """Load a cross-encoder model and its tokenizer once per process.
+
+    Args:
+        model_path (str): Directory holding ``model.onnx`` and
+            ``tokenizer.json``.
+        max_length (int): Maximum number of tokens per (query, document)
+            pair; longer pairs are truncated.
+        threads (int): Intra-op threads used by each inference call.
+
+    Returns:
+        Tuple[onnxruntime.InferenceSession, Tokenizer]: The model session
+            and a tokenizer configured for padded, truncated pairs.
+    """
+    options = onnxruntime.SessionOptions()
+    options.intra_op_num_threads = threads
+    session = onnxruntime.InferenceSession(
+        os.path.join(model_path, "model.onnx"),
+        sess_options=options,
+        providers=["CPUExecutionProvider"],
+    )
+    tokenizer = Tokenizer.from_file(os.path.join(model_path, "tokenizer.json"))
+    tokenizer.enable_truncation(max_length=max_length)
+    tokenizer.enable_padding()
+    return session, tokenizer
+
+
+class CrossEncoderReranker(Reranker):
+    """Reranker that scores query-document pairs with a local cross-encoder."""
+
+    def __init__(
+        self,
+        model_path: str,
+        score_threshold: float = 0.5,
+        batch_size: int = 16,
+        max_workers: int = 2,
+        max_length: int = 512,
+    ) -> None:
+        """Load (or reuse) the model.
+
+        Args:
+            model_path (str): Directory holding ``model.onnx`` and
+                ``tokenizer.json``.
+            score_threshold (float): Minimum relevance probability, between
+                0 and 1, of a document to be kept.
+            batch_size (int): Pairs scored per inference call.
+            max_workers (int): Batches scored at the same time.
+            max_length (int): Maximum number of tokens per pair.
+        """
+        self._score_threshold = score_threshold
+        self._batch_size = max(1, batch_size)
+        self._max_workers = max(1, max_workers)
+        threads = max(1, (os.cpu_count() or 1) // self._max_workers)
+        self._session, self._tokenizer = load_cross_encoder(model_path, max_length, threads)
+        self._input_names = {model_input.name for model_input in self._session.get_inputs()}
+        self._pool: ThreadPoolExecutor | None = None
+
+    def rerank(self, query: str, documents: List[str]) -> List[int]:
+        """Keep the documents scoring above the threshold, best first.
+
+        Args:
+            query (str): The user's question.
+            documents (List[str]): Texts of the retrieved documents.
+
+        Returns:
+            List[int]: Positions of the relevant documents, most relevant
+                first.
+        """
+        scores = self.score(query, documents)
+        ranked = sorted(range(len(documents)), key=lambda i: (-scores[i], i))
+        return [i for i in ranked if scores[i] >= self._score_threshold]
+
+    def score(self, query: str, documents: List[str]) -> List[float]:
+        """Return the relevance probability of every document.
+
+        Args:
+            query (str): The user's question.
+            documents (List[str]): Texts of the documents to score.
+
+        Returns:
+            List[float]: One probability between 0 and 1 per document.
+        """
+        if not documents:
+            return []
+        batches = [
+            documents[start:start + self._batch_size]
+            for start in range(0, len(documents), self._batch_size)
+        ]
+        if len(batches) == 1:
+            return self._score_batch(query, batches[0])
+        results = self._get_pool().map(lambda batch: self._score_batch(query, batch), batches)
+        return [score for batch_scores in results for score in batch_scores]
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    # -----------------------------------------------------
+    # Private helper methods
+    # -----------------------------------------------------
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Start the worker pool on first use and reuse it afterwards."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="reranker"
+            )
+        return self._pool
+
+    def _score_batch(self, query: str, documents: List[str]) -> List[float]:
+        """Run the model on one batch of pairs and convert logits to probabilities."""
+        encodings = self._tokenizer.encode_batch([(query, document) for document in documents])
+        inputs = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        logits = self._session.run(
+            None, {name: value for name, value in inputs.items() if name in self._input_names}
+        )[0]
+        logits = np.asarray(logits, dtype=np.float64).reshape(len(documents), -1)
+        if logits.shape[1] == 1:
+            # Single relevance logit, as in ms-marco and bge rerankers.
+            return [1.0 / (1.0 + math.exp(-value)) for value in logits[:, 0]]
+        # Two-class head: probability of the "relevant" class.
+        shifted = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return (shifted[:, 1] / shifted.sum(axis=1)).tolist()
@@ -0,0 +1,63 @@
+"""Deterministic lexical reranker implementation.
+
+This module provides an implementation of the Reranker interface that
+scores documents by the fraction of distinct query words they contain.
+It needs no model and no network, always gives the same result for the
+same input, and is meant as a stand-in for tests and benchmarks or as a
+cheap fallback when no cross-encoder model is available.
+"""
+
+import re
+from typing import List
+
+from knowledge_chat.domain.interfaces.reranker import Reranker
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class LexicalReranker(Reranker):
+    """Reranker that scores documents by query word overlap."""
+
+    def __init__(self, score_threshold: float = 0.5) -> None:
+        """Initialize the reranker.
+
+        Args:
+            score_threshold (float): Minimum fraction, between 0 and 1, of
+                the query's distinct words a document must contain.
+        """
+        self._score_threshold = score_threshold
+
+    def rerank(self, query: str, documents: List[str]) -> List[int]:
+        """Keep the documents scoring above the threshold, best first.
+
+        Ties keep their retrieval order.
+
+        Args:
+            query (str): The user's question.
+            documents (List[str]): Texts of the retrieved documents.
+
+        Returns:
+            List[int]: Positions of the relevant documents, most relevant
+                first.
+        """
+        scores = self.score(query, documents)
+        ranked = sorted(range(len(documents)), key=lambda i: (-scores[i], i))
+        return [i for i in ranked if scores[i] >= self._score_threshold]
+
+    def score(self, query: str, documents: List[str]) -> List[float]:
+        """Return the fraction of distinct query words found in each document.
+
+        Args:
+            query (str): The user's question.
+            documents (List[str]): Texts of the documents to score.
+
+        Returns:
+            List[float]: One score between 0 and 1 per document.
+        """
+        query_words = set(_WORD_PATTERN.findall(query.lower()))
+        if not query_words:
+            return [0.0] * len(documents)
+        return [
+            len(query_words & set(_WORD_PATTERN.findall(document.lower()))) / len(query_words)
+            for document in documents
+        ]
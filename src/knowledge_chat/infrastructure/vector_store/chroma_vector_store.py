@@ -2,32 +2,53 @@
 
 This module provides an implementation of the VectorStore interface
 using ChromaDB for storing and querying vector embeddings and documents.
+
+Every write replaces a small version file next to the database, so any
+process can tell whether the collection changed since it last looked.
+The embedding dimension of the collection is checked before every write
+and query, so embeddings of another size fail with a clear error.
+Hashes of source files that produced no chunks are kept as JSON in the
+collection metadata, so they follow the collection when it is replaced.
 """
 
-from typing import Any, Dict, List
+import json
+import os
+import uuid
+from typing import Any, Dict, Iterator, List, Tuple
 
 import chromadb
+from chromadb.api.models.Collection import Collection
 
 from knowledge_chat.config.settings import Settings
 from knowledge_chat.domain.interfaces.vector_store import VectorStore
 
+# Collection metadata key holding the hashes of sources without chunks.
+_EMPTY_SOURCES_KEY = "empty_sources"
+
 
 class ChromaVectorStore(VectorStore):
     """Vector store implementation using ChromaDB."""
 
-    def __init__(self, settings: Settings) -> None:
+    _PAGE_SIZE = 1000
+
+    def __init__(self, settings: Settings, collection_name: str | None = None) -> None:
         """Initialize the ChromaDB persistent client.
 
         Args:
             settings (Settings): Application configuration instance
                 containing database path and collection name.
+            collection_name (str | None): Collection to open instead of the
+                configured one, e.g. a staging collection.
         """
-        self._collection_name = settings.chromadb_collection_name
+        self._settings = settings
+        self._collection_name = collection_name or settings.chromadb_collection_name
         self._client = chromadb.PersistentClient(path=settings.chroma_db_path)
-        self._collection = self._client.get_or_create_collection(
-            self._collection_name,
-            configuration={"hnsw": {"space": "cosine"}},
+        self._collection = self._get_or_create_collection()
+        self._version_path = os.path.join(
+            settings.chroma_db_path, f"{self._collection_name}.version"
         )
+        # (version, dimension) of the last dimension lookup.
+        self._known_dimension: Tuple[str, int | None] | None = None
 
     # ------------------------------------------------------------------
     # Core Methods
@@ -49,12 +70,39 @@ class ChromaVectorStore(VectorStore):
             metadatas (List[Dict[str, Any]]): Metadata dictionaries
                 describing each document.
         """
+        self._check_dimension(embeddings, "Embedding")
         self._collection.add(
             ids=ids,
             embeddings=embeddings,
             documents=documents,
             metadatas=metadatas,
         )
+        self._bump_version()
+
+    def upsert_documents(
+        self,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Insert or overwrite documents in the ChromaDB collection by ID.
+
+        Args:
+            ids (List[str]): Unique identifiers for each document.
+            embeddings (List[List[float]]): Vector embeddings of documents.
+            documents (List[str]): Original document texts to be stored.
+            metadatas (List[Dict[str, Any]]): Metadata dictionaries
+                describing each document.
+        """
+        self._check_dimension(embeddings, "Embedding")
+        self._collection.upsert(
+            ids=ids,
+            embeddings=embeddings,
+            documents=documents,
+            metadatas=metadatas,
+        )
+        self._bump_version()
 
     def query_similar(
         self,
@@ -72,12 +120,362 @@ class ChromaVectorStore(VectorStore):
             Dict[str, Any]: Query results containing matched document IDs,
                 distances, metadata, and original document texts.
         """
+        self._check_dimension([embedding], "Query")
         return self._collection.query(
             query_embeddings=[embedding],
             n_results=top_k,
             include=["documents", "metadatas", "distances"],
         )
 
+    def query_similar_batch(
+        self,
+        embeddings: List[List[float]],
+        top_k: int = 5,
+    ) -> Dict[str, Any]:
+        """Query the most similar documents for several embeddings at once.
+
+        Args:
+            embeddings (List[List[float]]): The query embedding vectors.
+            top_k (int, optional): The number of top results per query.
+                Defaults to 5.
+
+        Returns:
+            Dict[str, Any]: Query results with one list of IDs, distances,
+                metadata and texts per query embedding.
+        """
+        self._check_dimension(embeddings, "Query")
+        return self._collection.query(
+            query_embeddings=embeddings,
+            n_results=top_k,
+            include=["documents", "metadatas", "distances"],
+        )
+
+    def update_documents(
+        self,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Replace the stored text and metadata of existing documents.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to update.
+            documents (List[str]): New document texts.
+            metadatas (List[Dict[str, Any]]): New metadata dictionaries.
+        """
+        # Chroma re-embeds documents updated without embeddings, so the
+        # stored vectors are passed back explicitly.
+        existing = self._collection.get(ids=ids, include=["embeddings"])
+        embeddings_by_id = dict(zip(existing["ids"], existing["embeddings"]))
+        self._collection.update(
+            ids=ids,
+            embeddings=[embeddings_by_id[record_id] for record_id in ids],
+            documents=documents,
+            metadatas=self._replacing(ids, metadatas),
+        )
+        self._bump_version()
+
+    def update_metadatas(
+        self,
+        ids: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Replace the stored metadata of existing documents.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to update.
+            metadatas (List[Dict[str, Any]]): New metadata dictionaries.
+        """
+        self._collection.update(ids=ids, metadatas=self._replacing(ids, metadatas))
+        self._bump_version()
+
+    def iter_documents(self, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Iterate over every stored document in batches.
+
+        Args:
+            batch_size (int, optional): Number of records per batch.
+                Defaults to 500.
+
+        Yields:
+            Dict[str, Any]: A batch with ``ids``, ``documents`` and
+                ``metadatas`` lists.
+        """
+        offset = 0
+        while True:
+            batch = self._collection.get(
+                include=["documents", "metadatas"],
+                limit=batch_size,
+                offset=offset,
+            )
+            if not batch["ids"]:
+                return
+            yield {
+                "ids": batch["ids"],
+                "documents": batch["documents"],
+                "metadatas": batch["metadatas"],
+            }
+            offset += len(batch["ids"])
+
+    def get_metadatas(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch the metadata of stored documents by ID.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to look up.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapping of ID to metadata for the
+                IDs that are stored.
+        """
+        metadatas: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(ids), self._PAGE_SIZE):
+            batch = self._collection.get(
+                ids=ids[start:start + self._PAGE_SIZE],
+                include=["metadatas"],
+            )
+            metadatas.update(zip(batch["ids"], batch["metadatas"]))
+        return metadatas
+
+    def get_documents(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch stored documents with their embeddings by ID.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to look up.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapping of ID to a dictionary with
+                the ``document`` text, its ``metadata`` and its
+                ``embedding``.
+        """
+        documents: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(ids), self._PAGE_SIZE):
+            batch = self._collection.get(
+                ids=ids[start:start + self._PAGE_SIZE],
+                include=["documents", "metadatas", "embeddings"],
+            )
+            for record_id, document, metadata, embedding in zip(
+                batch["ids"], batch["documents"], batch["metadatas"], batch["embeddings"]
+            ):
+                documents[record_id] = {
+                    "document": document,
+                    "metadata": metadata,
+                    "embedding": list(embedding),
+                }
+        return documents
+
+    def find_by_metadata(self, values: Dict[str, List[Any]]) -> Dict[str, Dict[str, Any]]:
+        """Fetch the documents where any given field has any given value.
+
+        Args:
+            values (Dict[str, List[Any]]): Candidate values per metadata field.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapping of ID to a dictionary with
+                the ``document`` text and its ``metadata``.
+        """
+        clauses = [
+            {field: {"$in": list(dict.fromkeys(field_values))}}
+            for field, field_values in values.items()
+            if field_values
+        ]
+        if not clauses:
+            return {}
+        batch = self._collection.get(
+            where=clauses[0] if len(clauses) == 1 else {"$or": clauses},
+            include=["documents", "metadatas"],
+        )
+        return {
+            record_id: {"document": document, "metadata": metadata}
+            for record_id, document, metadata in zip(
+                batch["ids"], batch["documents"], batch["metadatas"]
+            )
+        }
+
+    def get_ids_by_duplicate_source(self, source: str) -> List[str]:
+        """Return the IDs of chunks whose ``duplicate_sources`` list a source.
+
+        Args:
+            source (str): The source file name.
+
+        Returns:
+            List[str]: The matching document IDs.
+        """
+        batch = self._collection.get(
+            where={"duplicate_sources": {"$contains": source}},
+            include=[],
+        )
+        return batch["ids"]
+
+    def get_ids_by_source(self, source: str) -> List[str]:
+        """Return the IDs of every chunk whose ``source`` metadata matches.
+
+        Args:
+            source (str): The source file name.
+
+        Returns:
+            List[str]: The matching document IDs.
+        """
+        ids: List[str] = []
+        offset = 0
+        while True:
+            batch = self._collection.get(
+                where={"source": source},
+                include=[],
+                limit=self._PAGE_SIZE,
+                offset=offset,
+            )
+            ids.extend(batch["ids"])
+            if len(batch["ids"]) < self._PAGE_SIZE:
+                return ids
+            offset += self._PAGE_SIZE
+
+    def delete_documents(self, ids: List[str]) -> None:
+        """Delete documents from the ChromaDB collection by ID.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to delete.
+        """
+        for start in range(0, len(ids), self._PAGE_SIZE):
+            self._collection.delete(ids=ids[start:start + self._PAGE_SIZE])
+        self._bump_version()
+
+    def delete_by_source(self, source: str) -> None:
+        """Delete every chunk whose ``source`` metadata matches the given file.
+
+        Args:
+            source (str): The source file name to remove.
+        """
+        self._collection.delete(where={"source": source})
+        self._forget_empty_sources([source])
+        self._bump_version()
+
+    def get_source_hashes(self) -> Dict[str, str]:
+        """Return the content hash recorded for each imported source file.
+
+        Only the last chunk of every file carries ``source_complete``, so
+        the cost grows with the number of files rather than the number of
+        chunks, and files whose import was interrupted are not reported.
+
+        Returns:
+            Dict[str, str]: Mapping of source file name to content hash.
+        """
+        hashes = self._empty_sources()
+        offset = 0
+        while True:
+            batch = self._collection.get(
+                where={"source_complete": True},
+                include=["metadatas"],
+                limit=self._PAGE_SIZE,
+                offset=offset,
+            )
+            metadatas = batch.get("metadatas") or []
+            for meta in metadatas:
+                source = meta.get("source")
+                if source:
+                    hashes[source] = meta.get("source_hash", "")
+            if len(metadatas) < self._PAGE_SIZE:
+                return hashes
+            offset += self._PAGE_SIZE
+
+    def invalidate_source_hashes(self, sources: List[str]) -> None:
+        """Clear the content hash recorded for sources.
+
+        Args:
+            sources (List[str]): The source file names.
+        """
+        if not sources:
+            return
+        self._forget_empty_sources(sources)
+        batch = self._collection.get(
+            where={"$and": [{"source_complete": True}, {"source": {"$in": sources}}]},
+            include=[],
+        )
+        if batch["ids"]:
+            self._collection.update(
+                ids=batch["ids"],
+                metadatas=[{"source_hash": ""} for _ in batch["ids"]],
+            )
+
+    def record_empty_sources(self, source_hashes: Dict[str, str]) -> None:
+        """Record source files that were imported without producing chunks.
+
+        Args:
+            source_hashes (Dict[str, str]): Mapping of source file name to
+                content hash.
+        """
+        if source_hashes:
+            self._write_empty_sources({**self._empty_sources(), **source_hashes})
+
+    def version(self) -> str:
+        """Return a token that changes whenever the collection changes.
+
+        Returns:
+            str: The content of the collection's version file, or an empty
+                string if the collection was never written to.
+        """
+        try:
+            with open(self._version_path, "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return ""
+
+    def embedding_dimension(self) -> int | None:
+        """Return the dimension of the stored embeddings.
+
+        The dimension is read from a stored embedding and cached until the
+        collection version changes.
+
+        Returns:
+            int | None: The embedding dimension, or None while the
+                collection is empty.
+        """
+        version = self.version()
+        if self._known_dimension is None or self._known_dimension[0] != version:
+            stored = self._collection.get(limit=1, include=["embeddings"])["embeddings"]
+            self._known_dimension = (version, len(stored[0]) if len(stored) else None)
+        return self._known_dimension[1]
+
+    def create_staging(self) -> "ChromaVectorStore":
+        """Create an empty staging collection next to the live one.
+
+        Returns:
+            ChromaVectorStore: A store bound to the staging collection.
+        """
+        staging_name = f"{self._collection_name}__staging_{uuid.uuid4().hex[:8]}"
+        return ChromaVectorStore(settings=self._settings, collection_name=staging_name)
+
+    def promote_staging(self, staging: VectorStore) -> None:
+        """Make a staging collection the live collection.
+
+        The staging collection is renamed to the live name and the old
+        collection is dropped. Queries through this store switch to the new
+        collection with a single reference assignment, so they never see
+        an empty collection.
+
+        Args:
+            staging (VectorStore): A store returned by ``create_staging``.
+        """
+        if not isinstance(staging, ChromaVectorStore):
+            raise TypeError("Staging store must be a ChromaVectorStore.")
+        old_collection = self._collection
+        retired_name = f"{self._collection_name}__retired_{uuid.uuid4().hex[:8]}"
+        old_collection.modify(name=retired_name)
+        staging._collection.modify(name=self._collection_name)
+        self._collection = staging._collection
+        self._client.delete_collection(retired_name)
+        staging._remove_version()
+        self._bump_version()
+
+    def discard_staging(self, staging: VectorStore) -> None:
+        """Drop a staging collection.
+
+        Args:
+            staging (VectorStore): A store returned by ``create_staging``.
+        """
+        if not isinstance(staging, ChromaVectorStore):
+            raise TypeError("Staging store must be a ChromaVectorStore.")
+        self._client.delete_collection(staging._collection_name)
+        staging._remove_version()
+
     def delete_all(self) -> None:
         """Delete all stored embeddings and documents from the vector store.
 
@@ -85,4 +483,81 @@ class ChromaVectorStore(VectorStore):
         It's useful when reimporting a new dataset or resetting the app state.
         """
         self._client.delete_collection(self._collection_name)
-        self._collection = self._client.get_or_create_collection(self._collection_name)
+        self._collection = self._get_or_create_collection()
+        self._bump_version()
+
+    # ------------------------------------------------------------------
+    # Private helper methods
+    # ------------------------------------------------------------------
+
+    def _replacing(
+        self,
+        ids: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Turn new metadata into a Chroma update that replaces the old one.
+
+        Chroma merges updated metadata into the stored metadata, so keys
+        that are no longer present are removed explicitly.
+        """
+        stored = self.get_metadatas(ids)
+        return [
+            {**{key: None for key in stored.get(record_id, {}) if key not in metadata}, **metadata}
+            for record_id, metadata in zip(ids, metadatas)
+        ]
+
+    def _empty_sources(self) -> Dict[str, str]:
+        """Read the hashes of sources without chunks, as written by any process."""
+        metadata = self._client.get_collection(self._collection_name).metadata or {}
+        return json.loads(metadata.get(_EMPTY_SOURCES_KEY, "{}"))
+
+    def _forget_empty_sources(self, sources: List[str]) -> None:
+        """Drop sources from the hashes of sources without chunks."""
+        empty_sources = self._empty_sources()
+        if any(source in empty_sources for source in sources):
+            for source in sources:
+                empty_sources.pop(source, None)
+            self._write_empty_sources(empty_sources)
+
+    def _write_empty_sources(self, empty_sources: Dict[str, str]) -> None:
+        """Replace the hashes of sources without chunks in the collection metadata.
+
+        Chroma rejects empty metadata, so the key is kept with an empty
+        JSON object.
+        """
+        self._collection.modify(metadata={_EMPTY_SOURCES_KEY: json.dumps(empty_sources)})
+
+    def _check_dimension(self, embeddings: List[List[float]], kind: str) -> None:
+        """Reject embeddings whose dimension differs from the collection's."""
+        dimension = self.embedding_dimension()
+        if dimension is None:
+            return
+        for embedding in embeddings:
+            if len(embedding) != dimension:
+                raise ValueError(
+                    f"{kind} dimension {len(embedding)} does not match the dimension "
+                    f"{dimension} of collection {self._collection_name}; "
+                    "run a full import after changing the embedding dimensions."
+                )
+
+    def _bump_version(self) -> None:
+        """Write a new random version, atomically replacing the old one."""
+        temporary = f"{self._version_path}.{uuid.uuid4().hex[:8]}"
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.write(uuid.uuid4().hex)
+        os.replace(temporary, self._version_path)
+
+    def _remove_version(self) -> None:
+        """Delete the version file of a dropped collection."""
+        try:
+            os.remove(self._version_path)
+        except FileNotFoundError:
+            pass
+
+    def _get_or_create_collection(self) -> Collection:
+        """Open the configured collection, creating it with cosine distance."""
+        return self._client.get_or_create_collection(
+            self._collection_name,
+            configuration={"hnsw": {"space": "cosine"}},
+            embedding_function=None,
+        )
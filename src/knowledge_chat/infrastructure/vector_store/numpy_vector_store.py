@@ -0,0 +1,1202 @@
+"""Memory-mapped NumPy vector store implementation.
+
+This module provides an implementation of the VectorStore interface that
+answers similarity queries in process, without a database round trip:
+embeddings are L2-normalized on write and kept as one contiguous
+row-major float32 (or float16) matrix in a file, which every process
+memory-maps read-only. The operating system keeps a single copy of the
+matrix in its page cache, so several worker processes share it without
+copying. A query is a matrix product against the mapped rows followed by
+``argpartition``; many queries can be answered by one product.
+
+Texts and metadata live in a SQLite side file next to the matrix. Rows
+are looked up by their matrix row number, and metadata fields are also
+stored column-wise, one ``(key, value, row)`` entry per field value, so
+lookups by source, chunk hash or LSH band use an index instead of
+parsing every record. The hashes of source files that produced no chunks
+are kept in the same file.
+
+A store is a directory per *generation*::
+
+    <numpy_store_path>/<collection>.current    name of the live generation
+    <numpy_store_path>/<collection>.version    changes on every write
+    <numpy_store_path>/<generation>/vectors.bin
+    <numpy_store_path>/<generation>/live.bin   one byte per row, 0 = deleted
+    <numpy_store_path>/<generation>/records.sqlite3
+    <numpy_store_path>/<generation>/int8.codes     with int8 quantization
+    <numpy_store_path>/<generation>/int8.scales
+    <numpy_store_path>/<generation>/binary.codes   with binary quantization
+
+With quantization enabled, queries first scan compact codes of the rows
+instead of the matrix: one int8 per dimension and a float32 scale per
+row, or one sign bit per dimension compared by Hamming distance. The
+best ``top_k * numpy_store_rescore_factor`` candidates are then
+re-scored exactly against the full-precision rows, which stay on disk
+and are only read for those candidates. Codes are derived from the
+matrix, so they are built when a generation without them is opened and
+extended by the writer; rows they do not cover yet are scored exactly.
+
+Writes append rows; deleted and replaced rows are only marked dead in
+``live.bin`` until they outnumber the live rows, when the store is
+compacted into a new generation. Full rebuilds (staging stores) and
+compactions switch generations by atomically replacing the ``.current``
+file, and readers switch to it when they notice the new version. A
+store supports one writing process at a time and any number of readers.
+"""
+
+import contextlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import uuid
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from knowledge_chat.config.settings import Settings
+from knowledge_chat.domain.interfaces.vector_store import VectorStore
+
+# SQLite limits the number of bound parameters per statement.
+_MAX_PARAMS = 900
+# Size of the rows multiplied per query block, as float32. It bounds the
+# float32 copy of float16 rows and the temporary score matrix.
+_BLOCK_BYTES = 32 * 2**20
+# Size of the float32 copy of int8 codes multiplied at once; small
+# enough to stay in the CPU cache.
+_CAST_BYTES = 256 * 2**10
+# Dead rows tolerated before compaction, however few rows are live.
+_MIN_COMPACT_ROWS = 1024
+
+_CREATE_EMPTY_SOURCES = (
+    "CREATE TABLE {}empty_sources (source TEXT PRIMARY KEY, source_hash TEXT NOT NULL)"
+)
+
+_SUPPORTED_DTYPES = ("float32", "float16")
+_SUPPORTED_QUANTIZATIONS = ("none", "int8", "binary")
+
+# Set bits of every byte value, for numpy versions without bitwise_count.
+_POPCOUNT_TABLE = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+class NumPyVectorStore(VectorStore):
+    """Vector store answering queries from a memory-mapped embedding matrix."""
+
+    def __init__(self, settings: Settings, collection_name: str | None = None) -> None:
+        """Open (and create if needed) the store of a collection.
+
+        Args:
+            settings (Settings): Application configuration instance
+                containing the store path, collection name, dtype and
+                quantization.
+            collection_name (str | None): Collection to open instead of the
+                configured one, e.g. a staging collection.
+
+        Raises:
+            ValueError: If the configured dtype or quantization is not
+                supported.
+        """
+        if settings.numpy_store_dtype not in _SUPPORTED_DTYPES:
+            raise ValueError(
+                f"Unsupported NumPy store dtype: {settings.numpy_store_dtype}. "
+                f"Supported dtypes: {', '.join(_SUPPORTED_DTYPES)}"
+            )
+        if settings.numpy_store_quantization not in _SUPPORTED_QUANTIZATIONS:
+            raise ValueError(
+                f"Unsupported NumPy store quantization: {settings.numpy_store_quantization}. "
+                f"Supported quantizations: {', '.join(_SUPPORTED_QUANTIZATIONS)}"
+            )
+        os.makedirs(settings.numpy_store_path, exist_ok=True)
+
+        self._settings = settings
+        self._root = settings.numpy_store_path
+        self._collection_name = collection_name or settings.chromadb_collection_name
+        self._pointer_path = os.path.join(self._root, f"{self._collection_name}.current")
+        self._version_path = os.path.join(self._root, f"{self._collection_name}.version")
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._generation = ""
+        self._dimension = 0
+        self._dtype = np.dtype(settings.numpy_store_dtype)
+        self._vectors = np.empty((0, 0), dtype=self._dtype)
+        self._live = np.empty(0, dtype=np.uint8)
+        self._quantization = settings.numpy_store_quantization
+        self._rescore_factor = max(1, settings.numpy_store_rescore_factor)
+        self._codes = np.empty((0, 0), dtype=np.int8)
+        self._scales = np.empty(0, dtype=np.float32)
+        self._live_rows = 0
+        self._seen_version = self.version()
+
+        generation = self._read_pointer()
+        if generation is None or not os.path.isdir(os.path.join(self._root, generation)):
+            generation = self._create_generation()
+            self._write_pointer(generation)
+        self._open(generation)
+
+    # ------------------------------------------------------------------
+    # Core Methods
+    # ------------------------------------------------------------------
+
+    def add_documents(
+        self,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Add documents; IDs that are already stored are left unchanged.
+
+        Args:
+            ids (List[str]): Unique identifiers for each document.
+            embeddings (List[List[float]]): Vector embeddings of documents.
+            documents (List[str]): Original document texts to be stored.
+            metadatas (List[Dict[str, Any]]): Metadata dictionaries
+                describing each document.
+        """
+        self._write(ids, embeddings, documents, metadatas, replace=False)
+
+    def upsert_documents(
+        self,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Insert documents or overwrite stored ones with the same IDs.
+
+        Args:
+            ids (List[str]): Unique identifiers for each document.
+            embeddings (List[List[float]]): Vector embeddings of documents.
+            documents (List[str]): Original document texts to be stored.
+            metadatas (List[Dict[str, Any]]): Metadata dictionaries
+                describing each document.
+        """
+        self._write(ids, embeddings, documents, metadatas, replace=True)
+
+    def query_similar(
+        self,
+        embedding: List[float],
+        top_k: int = 5,
+    ) -> Dict[str, Any]:
+        """Query the most similar documents for a given embedding.
+
+        Args:
+            embedding (List[float]): The query embedding vector.
+            top_k (int, optional): The number of top results to return.
+                Defaults to 5.
+
+        Returns:
+            Dict[str, Any]: Query results containing matched document IDs,
+                cosine distances, metadata, and original document texts.
+        """
+        return self.query_similar_batch([embedding], top_k=top_k)
+
+    def query_similar_batch(
+        self,
+        embeddings: List[List[float]],
+        top_k: int = 5,
+    ) -> Dict[str, Any]:
+        """Query the most similar documents for several embeddings at once.
+
+        All queries are scored by a single matrix product per block of
+        stored rows, or of their codes when the store is quantized.
+
+        Args:
+            embeddings (List[List[float]]): The query embedding vectors.
+            top_k (int, optional): The number of top results per query.
+                Defaults to 5.
+
+        Returns:
+            Dict[str, Any]: Query results with one list of IDs, distances,
+                metadata and texts per query embedding.
+        """
+        results: Dict[str, Any] = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        if not embeddings:
+            return results
+        queries = _normalized(np.asarray(embeddings, dtype=np.float32).reshape(len(embeddings), -1))
+        while True:
+            with self._lock:
+                self._refresh()
+                generation, vectors, live = self._generation, self._vectors, self._live
+                codes, scales = self._codes, self._scales
+                if len(vectors) and queries.shape[1] != self._dimension:
+                    raise ValueError(
+                        f"Query dimension {queries.shape[1]} does not match the dimension "
+                        f"{self._dimension} of collection {self._collection_name}; "
+                        "run a full import after changing the embedding dimensions."
+                    )
+
+            # Scoring runs outside the lock; numpy releases the GIL meanwhile.
+            if self._quantization == "none":
+                rows, scores = _top_rows(queries, vectors, live, top_k)
+            else:
+                rows, scores = _quantized_top_rows(
+                    queries, vectors, live, codes, scales, top_k, top_k * self._rescore_factor
+                )
+
+            with self._lock:
+                if generation != self._generation:
+                    continue  # Compacted or rebuilt meanwhile; row numbers changed.
+                records = self._records_by_row(sorted({int(row) for row in rows.ravel()}))
+            break
+
+        for query_rows, query_scores in zip(rows, scores):
+            # Rows deleted by another process since they were mapped are skipped.
+            hits = [
+                (records[int(row)], float(score))
+                for row, score in zip(query_rows, query_scores)
+                if int(row) in records
+            ]
+            results["ids"].append([record[0] for record, _ in hits])
+            results["documents"].append([record[1] for record, _ in hits])
+            results["metadatas"].append([record[2] for record, _ in hits])
+            results["distances"].append([1.0 - score for _, score in hits])
+        return results
+
+    def update_documents(
+        self,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Replace the stored text and metadata of existing documents.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to update.
+            documents (List[str]): New document texts.
+            metadatas (List[Dict[str, Any]]): New metadata dictionaries.
+        """
+        with self._lock:
+            self._refresh()
+            rows = self._rows_by_id(ids)
+            updates = [
+                (rows[record_id], document, metadata)
+                for record_id, document, metadata in zip(ids, documents, metadatas)
+                if record_id in rows
+            ]
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE records SET document = ?, metadata = ? WHERE row = ?",
+                    [(document, json.dumps(metadata), row) for row, document, metadata in updates],
+                )
+                self._replace_fields([(row, metadata) for row, _, metadata in updates])
+            self._bump_version()
+
+    def update_metadatas(
+        self,
+        ids: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Replace the stored metadata of existing documents.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to update.
+            metadatas (List[Dict[str, Any]]): New metadata dictionaries.
+        """
+        with self._lock:
+            self._refresh()
+            rows = self._rows_by_id(ids)
+            updates = [
+                (rows[record_id], metadata)
+                for record_id, metadata in zip(ids, metadatas)
+                if record_id in rows
+            ]
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE records SET metadata = ? WHERE row = ?",
+                    [(json.dumps(metadata), row) for row, metadata in updates],
+                )
+                self._replace_fields(updates)
+            self._bump_version()
+
+    def iter_documents(self, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Iterate over every stored document in batches.
+
+        Args:
+            batch_size (int, optional): Number of records per batch.
+                Defaults to 500.
+
+        Yields:
+            Dict[str, Any]: A batch with ``ids``, ``documents`` and
+                ``metadatas`` lists.
+        """
+        last_row = -1
+        while True:
+            with self._lock:
+                self._refresh()
+                rows = self._conn.execute(
+                    "SELECT row, id, document, metadata FROM records"
+                    " WHERE row > ? ORDER BY row LIMIT ?",
+                    (last_row, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            yield {
+                "ids": [record_id for _, record_id, _, _ in rows],
+                "documents": [document for _, _, document, _ in rows],
+                "metadatas": [json.loads(metadata) for _, _, _, metadata in rows],
+            }
+            last_row = rows[-1][0]
+
+    def get_metadatas(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch the metadata of stored documents by ID.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to look up.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapping of ID to metadata for the
+                IDs that are stored.
+        """
+        with self._lock:
+            self._refresh()
+            return {
+                record_id: json.loads(metadata)
+                for record_id, metadata in self._select_by_ids("id, metadata", ids)
+            }
+
+    def get_documents(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch stored documents with their embeddings by ID.
+
+        Embeddings are returned L2-normalized, as they are stored.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to look up.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapping of ID to a dictionary with
+                the ``document`` text, its ``metadata`` and its
+                ``embedding``.
+        """
+        with self._lock:
+            self._refresh()
+            return {
+                record_id: {
+                    "document": document,
+                    "metadata": json.loads(metadata),
+                    "embedding": self._vectors[row].astype(np.float32).tolist(),
+                }
+                for record_id, row, document, metadata in self._select_by_ids(
+                    "id, row, document, metadata", ids
+                )
+                if row < len(self._vectors)
+            }
+
+    def find_by_metadata(self, values: Dict[str, List[Any]]) -> Dict[str, Dict[str, Any]]:
+        """Fetch the documents where any given field has any given value.
+
+        Args:
+            values (Dict[str, List[Any]]): Candidate values per metadata field.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapping of ID to a dictionary with
+                the ``document`` text and its ``metadata``.
+        """
+        with self._lock:
+            self._refresh()
+            rows = set()
+            for key, field_values in values.items():
+                rows.update(self._rows_by_field(key, list(dict.fromkeys(field_values))))
+            return {
+                record_id: {"document": document, "metadata": metadata}
+                for record_id, document, metadata in self._records_by_row(sorted(rows)).values()
+            }
+
+    def get_ids_by_duplicate_source(self, source: str) -> List[str]:
+        """Return the IDs of chunks whose ``duplicate_sources`` list a source.
+
+        Args:
+            source (str): The source file name.
+
+        Returns:
+            List[str]: The matching document IDs.
+        """
+        return self._ids_by_field("duplicate_sources", source)
+
+    def get_ids_by_source(self, source: str) -> List[str]:
+        """Return the IDs of every chunk whose ``source`` metadata matches.
+
+        Args:
+            source (str): The source file name.
+
+        Returns:
+            List[str]: The matching document IDs.
+        """
+        return self._ids_by_field("source", source)
+
+    def delete_documents(self, ids: List[str]) -> None:
+        """Delete documents by ID.
+
+        Args:
+            ids (List[str]): Identifiers of the documents to delete.
+        """
+        with self._lock:
+            self._refresh()
+            self._delete_rows(list(self._rows_by_id(ids).values()))
+            self._bump_version()
+            self._compact_if_needed()
+
+    def delete_by_source(self, source: str) -> None:
+        """Delete every chunk whose ``source`` metadata matches the given file.
+
+        Args:
+            source (str): The source file name to remove.
+        """
+        with self._lock:
+            self._refresh()
+            with self._conn:
+                self._conn.execute("DELETE FROM empty_sources WHERE source = ?", (source,))
+        self.delete_documents(self.get_ids_by_source(source))
+
+    def get_source_hashes(self) -> Dict[str, str]:
+        """Return the content hash recorded for each imported source file.
+
+        Only the last chunk of every file carries ``source_complete``, so
+        the cost grows with the number of files rather than the number of
+        chunks, and files whose import was interrupted are not reported.
+
+        Returns:
+            Dict[str, str]: Mapping of source file name to content hash.
+        """
+        with self._lock:
+            self._refresh()
+            rows = self._rows_by_field("source_complete", [True])
+            hashes: Dict[str, str] = dict(
+                self._conn.execute("SELECT source, source_hash FROM empty_sources")
+            )
+            for _, _, metadata in self._records_by_row(rows).values():
+                source = metadata.get("source")
+                if source:
+                    hashes[source] = metadata.get("source_hash", "")
+            return hashes
+
+    def invalidate_source_hashes(self, sources: List[str]) -> None:
+        """Clear the content hash recorded for sources.
+
+        Args:
+            sources (List[str]): The source file names.
+        """
+        if not sources:
+            return
+        with self._lock:
+            self._refresh()
+            complete = set(self._rows_by_field("source_complete", [True]))
+            rows = [row for row in self._rows_by_field("source", sources) if row in complete]
+            updates = [
+                (row, {**metadata, "source_hash": ""})
+                for row, (_, _, metadata) in self._records_by_row(rows).items()
+            ]
+            with self._conn:
+                self._conn.executemany(
+                    "DELETE FROM empty_sources WHERE source = ?", [(source,) for source in sources]
+                )
+                self._conn.executemany(
+                    "UPDATE records SET metadata = ? WHERE row = ?",
+                    [(json.dumps(metadata), row) for row, metadata in updates],
+                )
+                self._replace_fields(updates)
+
+    def record_empty_sources(self, source_hashes: Dict[str, str]) -> None:
+        """Record source files that were imported without producing chunks.
+
+        Args:
+            source_hashes (Dict[str, str]): Mapping of source file name to
+                content hash.
+        """
+        if not source_hashes:
+            return
+        with self._lock:
+            self._refresh()
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO empty_sources (source, source_hash) VALUES (?, ?)",
+                    list(source_hashes.items()),
+                )
+
+    def version(self) -> str:
+        """Return a token that changes whenever the collection changes.
+
+        Returns:
+            str: The content of the collection's version file, or an empty
+                string if the collection was never written to.
+        """
+        try:
+            with open(self._version_path, "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return ""
+
+    def embedding_dimension(self) -> int | None:
+        """Return the dimension of the stored embeddings.
+
+        Returns:
+            int | None: The dimension recorded by the first write, or None
+                while the store is empty.
+        """
+        with self._lock:
+            self._refresh()
+            return self._dimension if len(self._vectors) else None
+
+    def create_staging(self) -> "NumPyVectorStore":
+        """Create an empty staging collection next to the live one.
+
+        Returns:
+            NumPyVectorStore: A store bound to the staging collection.
+        """
+        staging_name = f"{self._collection_name}__staging_{uuid.uuid4().hex[:8]}"
+        return NumPyVectorStore(settings=self._settings, collection_name=staging_name)
+
+    def promote_staging(self, staging: VectorStore) -> None:
+        """Make the generation of a staging collection the live one.
+
+        The switch is a single atomic replacement of the ``.current`` file;
+        other processes follow once they notice the new version.
+
+        Args:
+            staging (VectorStore): A store returned by ``create_staging``.
+        """
+        if not isinstance(staging, NumPyVectorStore):
+            raise TypeError("Staging store must be a NumPyVectorStore.")
+        with staging._lock:
+            generation = staging._generation
+            staging._close()
+            staging._remove_pointer()
+        with self._lock:
+            self._switch(generation)
+
+    def discard_staging(self, staging: VectorStore) -> None:
+        """Delete a staging collection.
+
+        Args:
+            staging (VectorStore): A store returned by ``create_staging``.
+        """
+        if not isinstance(staging, NumPyVectorStore):
+            raise TypeError("Staging store must be a NumPyVectorStore.")
+        with staging._lock:
+            staging._close()
+            staging._remove_pointer()
+            shutil.rmtree(os.path.join(self._root, staging._generation), ignore_errors=True)
+
+    def delete_all(self) -> None:
+        """Delete all stored embeddings and documents from the vector store.
+
+        The emptied store keeps no dimension, so it accepts embeddings of
+        any size again.
+        """
+        with self._lock:
+            self._switch(self._create_generation())
+
+    # ------------------------------------------------------------------
+    # Private helper methods
+    # ------------------------------------------------------------------
+
+    def _write(
+        self,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        replace: bool,
+    ) -> None:
+        """Append records, marking the rows of replaced records dead."""
+        if not ids:
+            return
+        matrix = np.asarray(embeddings, dtype=np.float32).reshape(len(ids), -1)
+        # The last occurrence of an ID within a batch wins.
+        latest = {record_id: position for position, record_id in enumerate(ids)}
+
+        with self._lock:
+            self._refresh()
+            if self._dimension and matrix.shape[1] != self._dimension:
+                raise ValueError(
+                    f"Embedding dimension {matrix.shape[1]} does not match the dimension "
+                    f"{self._dimension} of collection {self._collection_name}; "
+                    "run a full import after changing the embedding dimensions."
+                )
+            existing = self._rows_by_id(list(latest))
+            if not replace:
+                latest = {
+                    record_id: position
+                    for record_id, position in latest.items()
+                    if record_id not in existing
+                }
+                existing = {}
+            if not latest:
+                return
+            if not self._dimension:
+                self._set_dimension(matrix.shape[1])
+
+            positions = list(latest.values())
+            start = self._append_rows(_normalized(matrix[positions]))
+            records = [
+                (start + offset, record_id, documents[position], json.dumps(metadatas[position]))
+                for offset, (record_id, position) in enumerate(latest.items())
+            ]
+            with self._conn:
+                self._delete_records(list(existing.values()))
+                self._conn.executemany(
+                    "INSERT INTO records (row, id, document, metadata) VALUES (?, ?, ?, ?)",
+                    records,
+                )
+                self._insert_fields(
+                    [(row, metadatas[position]) for (row, *_), position in zip(records, positions)]
+                )
+            self._mark_dead(list(existing.values()))
+            self._live_rows += len(records) - len(existing)
+            self._map()
+            self._extend_codes()
+            self._bump_version()
+            self._compact_if_needed()
+
+    def _append_rows(self, matrix: np.ndarray) -> int:
+        """Append normalized rows to the matrix files and return the first row."""
+        row_bytes = self._dimension * self._dtype.itemsize
+        vectors_path, live_path = self._paths()[:2]
+        with open(vectors_path, "r+b") as f:
+            # A write interrupted by a crash may have left a partial row.
+            start = os.fstat(f.fileno()).st_size // row_bytes
+            f.truncate(start * row_bytes)
+            f.seek(start * row_bytes)
+            f.write(np.ascontiguousarray(matrix, dtype=self._dtype).tobytes())
+        with open(live_path, "r+b") as f:
+            f.truncate(start)
+            f.seek(start)
+            f.write(b"\x01" * len(matrix))
+        return start
+
+    def _mark_dead(self, rows: List[int]) -> None:
+        """Flag rows dead in the live file, in place for every process."""
+        if not rows:
+            return
+        with open(self._paths()[1], "r+b") as f:
+            for row in sorted(rows):
+                f.seek(row)
+                f.write(b"\x00")
+
+    def _delete_rows(self, rows: List[int]) -> None:
+        """Delete the records of rows and mark the rows dead."""
+        if not rows:
+            return
+        with self._conn:
+            self._delete_records(rows)
+        self._mark_dead(rows)
+        self._live_rows -= len(rows)
+
+    def _delete_records(self, rows: List[int]) -> None:
+        """Delete the records and metadata fields of rows (inside a transaction)."""
+        for start in range(0, len(rows), _MAX_PARAMS):
+            batch = rows[start:start + _MAX_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            self._conn.execute(f"DELETE FROM fields WHERE row IN ({placeholders})", batch)
+            self._conn.execute(f"DELETE FROM records WHERE row IN ({placeholders})", batch)
+
+    def _insert_fields(self, entries: List[Tuple[int, Dict[str, Any]]]) -> None:
+        """Index the metadata values of rows, one entry per list element."""
+        self._conn.executemany(
+            "INSERT INTO fields (key, value, row) VALUES (?, ?, ?)",
+            [
+                (key, item, row)
+                for row, metadata in entries
+                for key, value in metadata.items()
+                for item in (value if isinstance(value, list) else [value])
+                if item is not None
+            ],
+        )
+
+    def _replace_fields(self, entries: List[Tuple[int, Dict[str, Any]]]) -> None:
+        """Re-index the metadata values of rows (inside a transaction)."""
+        rows = [row for row, _ in entries]
+        for start in range(0, len(rows), _MAX_PARAMS):
+            batch = rows[start:start + _MAX_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            self._conn.execute(f"DELETE FROM fields WHERE row IN ({placeholders})", batch)
+        self._insert_fields(entries)
+
+    def _rows_by_id(self, ids: List[str]) -> Dict[str, int]:
+        """Return the row of every stored ID."""
+        return dict(self._select_by_ids("id, row", ids))
+
+    def _select_by_ids(self, columns: str, ids: List[str]) -> List[Tuple[Any, ...]]:
+        """Select columns of the records with the given IDs."""
+        unique_ids = list(dict.fromkeys(ids))
+        rows: List[Tuple[Any, ...]] = []
+        for start in range(0, len(unique_ids), _MAX_PARAMS):
+            batch = unique_ids[start:start + _MAX_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            rows.extend(
+                self._conn.execute(
+                    f"SELECT {columns} FROM records WHERE id IN ({placeholders})", batch
+                )
+            )
+        return rows
+
+    def _rows_by_field(self, key: str, values: List[Any]) -> List[int]:
+        """Return the rows whose metadata field ``key`` has any of the values."""
+        rows: List[int] = []
+        for start in range(0, len(values), _MAX_PARAMS):
+            batch = values[start:start + _MAX_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            rows.extend(
+                row
+                for (row,) in self._conn.execute(
+                    f"SELECT DISTINCT row FROM fields WHERE key = ? AND value IN ({placeholders})",
+                    [key, *batch],
+                )
+            )
+        return rows
+
+    def _ids_by_field(self, key: str, value: Any) -> List[str]:
+        """Return the IDs of the records whose metadata field has a value."""
+        with self._lock:
+            self._refresh()
+            return [
+                record_id
+                for (record_id,) in self._conn.execute(
+                    "SELECT records.id FROM fields JOIN records ON records.row = fields.row"
+                    " WHERE fields.key = ? AND fields.value = ? ORDER BY records.row",
+                    (key, value),
+                )
+            ]
+
+    def _records_by_row(self, rows: List[int]) -> Dict[int, Tuple[str, str, Dict[str, Any]]]:
+        """Return the ID, text and metadata of the records in the given rows."""
+        records: Dict[int, Tuple[str, str, Dict[str, Any]]] = {}
+        for start in range(0, len(rows), _MAX_PARAMS):
+            batch = rows[start:start + _MAX_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            for row, record_id, document, metadata in self._conn.execute(
+                f"SELECT row, id, document, metadata FROM records WHERE row IN ({placeholders})",
+                batch,
+            ):
+                records[row] = (record_id, document, json.loads(metadata))
+        return records
+
+    def _compact_if_needed(self) -> None:
+        """Rewrite the live rows into a new generation once most rows are dead."""
+        dead = len(self._live) - self._live_rows
+        if dead <= max(_MIN_COMPACT_ROWS, self._live_rows):
+            return
+        generation = self._create_generation(self._dimension, self._dtype.name)
+        vectors_path, live_path, records_path = self._paths(generation)
+        old_rows = np.fromiter(
+            (row for (row,) in self._conn.execute("SELECT row FROM records ORDER BY row")),
+            dtype=np.int64,
+        )
+        block_rows = max(1, _BLOCK_BYTES // (4 * self._dimension))
+        with open(vectors_path, "wb") as f:
+            for start in range(0, len(old_rows), block_rows):
+                f.write(np.ascontiguousarray(self._vectors[old_rows[start:start + block_rows]]).tobytes())
+        with open(live_path, "wb") as f:
+            f.write(b"\x01" * len(old_rows))
+
+        conn = sqlite3.connect(records_path)
+        try:
+            conn.execute("ATTACH DATABASE ? AS old", (self._paths()[2],))
+            with conn:
+                conn.execute(
+                    "CREATE TEMP TABLE renumbered AS SELECT row AS old_row,"
+                    " ROW_NUMBER() OVER (ORDER BY row) - 1 AS new_row FROM old.records"
+                )
+                conn.execute(
+                    "INSERT INTO records (row, id, document, metadata)"
+                    " SELECT new_row, id, document, metadata FROM old.records"
+                    " JOIN renumbered ON old_row = row"
+                )
+                conn.execute(
+                    "INSERT INTO fields (key, value, row)"
+                    " SELECT key, value, new_row FROM old.fields"
+                    " JOIN renumbered ON old_row = row"
+                )
+                conn.execute("INSERT INTO empty_sources SELECT * FROM old.empty_sources")
+            conn.execute("DETACH DATABASE old")
+        finally:
+            conn.close()
+        self._switch(generation)
+
+    def _create_generation(self, dimension: int = 0, dtype: str | None = None) -> str:
+        """Create an empty generation directory and return its name.
+
+        New stores use the configured dtype; compaction keeps the dtype of
+        the rows it copies.
+        """
+        generation = f"{self._collection_name}-{uuid.uuid4().hex[:8]}"
+        os.makedirs(os.path.join(self._root, generation))
+        vectors_path, live_path, records_path = self._paths(generation)
+        for path in (vectors_path, live_path):
+            open(path, "wb").close()
+        conn = sqlite3.connect(records_path)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE records ("
+                " row INTEGER PRIMARY KEY,"
+                " id TEXT NOT NULL UNIQUE,"
+                " document TEXT NOT NULL,"
+                " metadata TEXT NOT NULL"
+                ")"
+            )
+            conn.execute("CREATE TABLE fields (key TEXT NOT NULL, value NOT NULL, row INTEGER NOT NULL)")
+            conn.execute("CREATE INDEX fields_lookup ON fields(key, value)")
+            conn.execute("CREATE INDEX fields_row ON fields(row)")
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.execute(_CREATE_EMPTY_SOURCES.format(""))
+            conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [("dimension", str(dimension)), ("dtype", dtype or self._settings.numpy_store_dtype)],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return generation
+
+    def _switch(self, generation: str) -> None:
+        """Make a generation the live one and delete the previous one."""
+        previous = self._generation
+        self._write_pointer(generation)
+        self._open(generation)
+        self._bump_version()
+        if previous and previous != generation:
+            # Readers that still map the old files keep them until they
+            # switch; on POSIX the data stays valid after unlinking.
+            shutil.rmtree(os.path.join(self._root, previous), ignore_errors=True)
+
+    def _open(self, generation: str) -> None:
+        """Open the side file of a generation and map its matrix."""
+        self._close()
+        self._generation = generation
+        self._conn = sqlite3.connect(self._paths()[2], check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # Generations written before the table existed lack it.
+        with self._conn:
+            self._conn.execute(_CREATE_EMPTY_SOURCES.format("IF NOT EXISTS "))
+        meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+        self._dimension = int(meta["dimension"])
+        self._dtype = np.dtype(meta["dtype"])
+        self._live_rows = self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+        self._map()
+        self._build_codes()
+
+    def _close(self) -> None:
+        """Close the side file and release the mapped matrix."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._vectors = np.empty((0, self._dimension), dtype=self._dtype)
+        self._live = np.empty(0, dtype=np.uint8)
+        self._codes = np.empty((0, 0), dtype=np.int8)
+        self._scales = np.empty(0, dtype=np.float32)
+
+    def _map(self) -> None:
+        """Map the rows that are currently written to the matrix files."""
+        vectors_path, live_path = self._paths()[:2]
+        rows = 0
+        if self._dimension:
+            rows = min(
+                os.path.getsize(vectors_path) // (self._dimension * self._dtype.itemsize),
+                os.path.getsize(live_path),
+            )
+        if not rows:
+            self._vectors = np.empty((0, self._dimension), dtype=self._dtype)
+            self._live = np.empty(0, dtype=np.uint8)
+        else:
+            self._vectors = np.memmap(vectors_path, dtype=self._dtype, mode="r", shape=(rows, self._dimension))
+            self._live = np.memmap(live_path, dtype=np.uint8, mode="r", shape=(rows,))
+        self._map_codes()
+
+    def _map_codes(self) -> None:
+        """Map the codes of the matrix rows they cover."""
+        rows = min(self._coded_rows(), len(self._vectors))
+        self._codes = np.empty((0, 0), dtype=np.int8)
+        self._scales = np.empty(0, dtype=np.float32)
+        if not rows:
+            return
+        codes_path, scales_path = self._codes_paths()
+        width = _code_bytes(self._quantization, self._dimension)
+        if self._quantization == "int8":
+            self._codes = np.memmap(codes_path, dtype=np.int8, mode="r", shape=(rows, width))
+            self._scales = np.memmap(scales_path, dtype=np.float32, mode="r", shape=(rows,))
+        else:
+            self._codes = np.memmap(codes_path, dtype=np.uint64, mode="r", shape=(rows, width // 8))
+
+    def _coded_rows(self) -> int:
+        """Return the number of rows the codes files cover."""
+        if self._quantization == "none" or not self._dimension:
+            return 0
+        codes_path, scales_path = self._codes_paths()
+        try:
+            rows = os.path.getsize(codes_path) // _code_bytes(self._quantization, self._dimension)
+            if self._quantization == "int8":
+                rows = min(rows, os.path.getsize(scales_path) // 4)
+        except FileNotFoundError:
+            return 0
+        return rows
+
+    def _build_codes(self) -> None:
+        """Encode every row of a generation opened without codes.
+
+        Readers may build them as well, so the files are written aside
+        and moved into place.
+        """
+        codes_path, scales_path = self._codes_paths()
+        if self._quantization == "none" or not len(self._vectors) or os.path.exists(codes_path):
+            return
+        suffix = f".{uuid.uuid4().hex[:8]}"
+        self._encode_rows(codes_path + suffix, scales_path + suffix, 0)
+        if self._quantization == "int8":
+            os.replace(scales_path + suffix, scales_path)
+        os.replace(codes_path + suffix, codes_path)
+        self._map_codes()
+
+    def _extend_codes(self) -> None:
+        """Encode the rows appended since the codes were last extended."""
+        if self._quantization == "none":
+            return
+        covered = self._coded_rows()
+        if covered < len(self._vectors):
+            self._encode_rows(*self._codes_paths(), covered)
+            self._map_codes()
+
+    def _encode_rows(self, codes_path: str, scales_path: str, start: int) -> None:
+        """Append the codes of the mapped rows from start on to the given files."""
+        width = _code_bytes(self._quantization, self._dimension)
+        block_rows = max(1, _BLOCK_BYTES // (4 * self._dimension))
+        with contextlib.ExitStack() as stack:
+            codes_file = stack.enter_context(open(codes_path, "ab"))
+            # A write interrupted by a crash may have left partial codes.
+            codes_file.truncate(start * width)
+            scales_file = None
+            if self._quantization == "int8":
+                scales_file = stack.enter_context(open(scales_path, "ab"))
+                scales_file.truncate(start * 4)
+            for offset in range(start, len(self._vectors), block_rows):
+                block = np.asarray(self._vectors[offset:offset + block_rows], dtype=np.float32)
+                codes, scales = _encode(block, self._quantization)
+                codes_file.write(codes.tobytes())
+                if scales_file is not None:
+                    scales_file.write(scales.tobytes())
+
+    def _refresh(self) -> None:
+        """Follow writes of other processes since the last call."""
+        version = self.version()
+        if version == self._seen_version:
+            return
+        self._seen_version = version
+        generation = self._read_pointer()
+        if generation and generation != self._generation:
+            self._open(generation)
+        else:
+            self._live_rows = self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+            self._map()
+
+    def _set_dimension(self, dimension: int) -> None:
+        """Record the embedding dimension of a store's first write."""
+        with self._conn:
+            self._conn.execute("UPDATE meta SET value = ? WHERE key = 'dimension'", (str(dimension),))
+        self._dimension = dimension
+
+    def _paths(self, generation: str | None = None) -> Tuple[str, str, str]:
+        """Return the matrix, live flag and side file paths of a generation."""
+        directory = os.path.join(self._root, generation or self._generation)
+        return (
+            os.path.join(directory, "vectors.bin"),
+            os.path.join(directory, "live.bin"),
+            os.path.join(directory, "records.sqlite3"),
+        )
+
+    def _codes_paths(self, generation: str | None = None) -> Tuple[str, str]:
+        """Return the codes and scales paths of a generation."""
+        directory = os.path.join(self._root, generation or self._generation)
+        return (
+            os.path.join(directory, f"{self._quantization}.codes"),
+            os.path.join(directory, f"{self._quantization}.scales"),
+        )
+
+    def _read_pointer(self) -> str | None:
+        """Return the name of the live generation, if the store exists."""
+        try:
+            with open(self._pointer_path, "r", encoding="utf-8") as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def _write_pointer(self, generation: str) -> None:
+        """Atomically point the collection at a generation."""
+        temporary = f"{self._pointer_path}.{uuid.uuid4().hex[:8]}"
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.write(generation)
+        os.replace(temporary, self._pointer_path)
+
+    def _remove_pointer(self) -> None:
+        """Delete the pointer and version files of a dropped collection."""
+        for path in (self._pointer_path, self._version_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _bump_version(self) -> None:
+        """Write a new random version, atomically replacing the old one."""
+        temporary = f"{self._version_path}.{uuid.uuid4().hex[:8]}"
+        version = uuid.uuid4().hex
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.write(version)
+        os.replace(temporary, self._version_path)
+        self._seen_version = version
+
+
+def _normalized(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length; zero rows stay zero."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
+def _top_rows(
+    queries: np.ndarray, vectors: np.ndarray, live: np.ndarray, top_k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the best live rows and their cosine similarities per query.
+
+    Rows are scored block by block, so the temporary score matrix (and
+    the float32 copy of float16 rows) stays bounded whatever the store
+    size. Results are sorted best first; queries with fewer live rows
+    than ``top_k`` are padded with row -1.
+    """
+    block_rows = max(1, _BLOCK_BYTES // (4 * max(1, vectors.shape[1])))
+
+    def score_block(start: int, stop: int) -> np.ndarray:
+        return queries @ np.asarray(vectors[start:stop], dtype=np.float32).T
+
+    return _scan(score_block, len(vectors), block_rows, live, len(queries), top_k)
+
+
+def _quantized_top_rows(
+    queries: np.ndarray,
+    vectors: np.ndarray,
+    live: np.ndarray,
+    codes: np.ndarray,
+    scales: np.ndarray,
+    top_k: int,
+    candidates: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the best live rows per query, found through their codes.
+
+    The codes select ``candidates`` rows per query; those rows, and the
+    rows the codes do not cover yet, are re-scored exactly against the
+    full-precision matrix. Results are shaped like those of ``_top_rows``.
+    """
+    top_k = max(0, top_k)
+    if codes.dtype == np.int8:
+        block_rows = max(1, _BLOCK_BYTES // (4 * max(1, codes.shape[1])))
+        # BLAS has no int8 product: codes are copied to float32 a few rows
+        # at a time, into a buffer that stays in the CPU cache.
+        cast_rows = max(1, _CAST_BYTES // (4 * max(1, codes.shape[1])))
+        buffer = np.empty((cast_rows, codes.shape[1]), dtype=np.float32)
+
+        def score_block(start: int, stop: int) -> np.ndarray:
+            scores = np.empty((len(queries), stop - start), dtype=np.float32)
+            for offset in range(start, stop, cast_rows):
+                rows = min(cast_rows, stop - offset)
+                np.copyto(buffer[:rows], codes[offset:offset + rows])
+                scores[:, offset - start:offset - start + rows] = queries @ buffer[:rows].T
+            return scores * scales[start:stop]
+
+    else:
+        query_codes = _encode(queries, "binary")[0].view(np.uint64)
+        block_rows = max(1, _BLOCK_BYTES // (8 * max(1, codes.shape[1])))
+
+        def score_block(start: int, stop: int) -> np.ndarray:
+            block = codes[start:stop]
+            return -np.stack([_hamming(block, query) for query in query_codes]).astype(np.float32)
+
+    candidate_rows, _ = _scan(score_block, len(codes), block_rows, live, len(queries), candidates)
+    uncovered = np.arange(len(codes), len(vectors))
+    uncovered = uncovered[live[len(codes):len(vectors)] != 0]
+
+    best_rows = np.full((len(queries), top_k), -1, dtype=np.int64)
+    best_scores = np.full((len(queries), top_k), -np.inf, dtype=np.float32)
+    for position, query in enumerate(queries):
+        rows = candidate_rows[position]
+        # Sorted rows read the mapped matrix front to back.
+        rows = np.sort(np.concatenate([rows[rows >= 0], uncovered]))
+        if not len(rows):
+            continue
+        scores = np.asarray(vectors[rows], dtype=np.float32) @ query
+        order = np.argsort(-scores, kind="stable")[:top_k]
+        best_rows[position, :len(order)] = rows[order]
+        best_scores[position, :len(order)] = scores[order]
+    return best_rows, best_scores
+
+
+def _scan(
+    score_block: Callable[[int, int], np.ndarray],
+    n_rows: int,
+    block_rows: int,
+    live: np.ndarray,
+    n_queries: int,
+    top_k: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Keep the best live rows per query while scoring the rows block by block.
+
+    ``score_block(start, stop)`` returns the scores of rows ``start`` to
+    ``stop`` for every query. Results are sorted best first and padded
+    with row -1.
+    """
+    top_k = max(0, top_k)
+    best_rows = np.full((n_queries, 0), -1, dtype=np.int64)
+    best_scores = np.full((n_queries, 0), -np.inf, dtype=np.float32)
+    for start in range(0, n_rows, block_rows):
+        stop = min(start + block_rows, n_rows)
+        scores = score_block(start, stop)
+        dead = live[start:stop] == 0
+        if dead.any():
+            scores[:, dead] = -np.inf
+        if scores.shape[1] > top_k > 0:
+            picked = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+            scores = np.take_along_axis(scores, picked, axis=1)
+        else:
+            picked = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+        best_rows = np.concatenate([best_rows, picked + start], axis=1)
+        best_scores = np.concatenate([best_scores, scores], axis=1)
+        if best_scores.shape[1] > top_k > 0:
+            kept = np.argpartition(-best_scores, top_k - 1, axis=1)[:, :top_k]
+            best_rows = np.take_along_axis(best_rows, kept, axis=1)
+            best_scores = np.take_along_axis(best_scores, kept, axis=1)
+
+    order = np.argsort(-best_scores, axis=1, kind="stable")
+    best_rows = np.take_along_axis(best_rows, order, axis=1)
+    best_scores = np.take_along_axis(best_scores, order, axis=1)
+    best_rows[np.isneginf(best_scores)] = -1
+    return best_rows, best_scores
+
+
+def _code_bytes(quantization: str, dimension: int) -> int:
+    """Return the size of the codes of one row."""
+    if quantization == "int8":
+        return dimension
+    # Sign bits are padded to whole 64-bit words for the Hamming distance.
+    return -(-dimension // 64) * 8
+
+
+def _encode(matrix: np.ndarray, quantization: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the codes of float32 rows and, for int8, their scales.
+
+    int8 codes map every row's largest absolute component to 127;
+    binary codes keep the sign bit of every component.
+    """
+    if quantization == "int8":
+        scales = (np.abs(matrix).max(axis=1) / 127).astype(np.float32)
+        codes = np.rint(matrix / np.where(scales > 0, scales, 1)[:, None]).astype(np.int8)
+        return codes, scales
+    codes = np.zeros((len(matrix), _code_bytes(quantization, matrix.shape[1])), dtype=np.uint8)
+    bits = np.packbits(matrix > 0, axis=1)
+    codes[:, :bits.shape[1]] = bits
+    return codes, np.empty(0, dtype=np.float32)
+
+
+def _hamming(codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Return the Hamming distance between every row of codes and a query."""
+    differing = np.bitwise_xor(codes, query)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(differing).sum(axis=1, dtype=np.int32)
+    return _POPCOUNT_TABLE[differing.view(np.uint8)].sum(axis=1, dtype=np.int32)
@@ -0,0 +1,491 @@
+"""Command-line interface for headless operation.
+
+This module provides the ``knowledge_chat`` command. Its ``ingest``
+subcommand imports a directory tree, file or glob pattern through the same
+ImportFilesUseCase as the web UI, without a browser or web request:
+
+    knowledge_chat ingest ./docs "./exports/**/*.jsonl"
+
+Files are discovered lazily and imported in batches. Every imported file
+is appended to a checkpoint file, so an interrupted run (crash, Ctrl-C)
+resumes where it stopped when the same command is run again. Files whose
+size or modification time changed since they were checkpointed are
+imported again. Throughput is printed after every batch.
+
+The ``watch`` subcommand keeps directories in sync continuously:
+
+    knowledge_chat watch ./runbooks
+
+It first catches up on changes made since the last run, using the same
+checkpoint as ``ingest``, then waits for file system notifications and
+imports only the files that were added or modified, and deletes the
+chunks of files that were deleted or renamed away. Bursts of changes are
+debounced into one batch, and the tree is never rescanned after start-up.
+
+Sources are named by their path relative to ``--source-root`` rather than
+by file name as in the web UI, because large trees routinely contain
+equally named files.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+from knowledge_chat.application.import_files_use_case import ImportFilesUseCase
+from knowledge_chat.config.settings import Settings
+from knowledge_chat.dependencies.get_chunker import get_chunker
+from knowledge_chat.dependencies.get_document_loader import get_document_loader
+from knowledge_chat.dependencies.get_embedding_service import \
+    get_embedding_service
+from knowledge_chat.dependencies.get_file_watcher import get_file_watcher
+from knowledge_chat.dependencies.get_lexical_index import get_lexical_index
+from knowledge_chat.dependencies.get_parent_document_store import \
+    get_parent_document_store
+from knowledge_chat.dependencies.get_vector_store import get_vector_store
+from knowledge_chat.domain.entities.import_stats import ImportStats
+from knowledge_chat.domain.interfaces.document_loader import DocumentLoader
+from knowledge_chat.domain.interfaces.file_watcher import FileChange
+from knowledge_chat.infrastructure.document_loader.multi_format_loader import \
+    MultiFormatLoader
+
+_DEFAULT_CHECKPOINT = "./data/ingest_checkpoint.jsonl"
+
+
+class _Checkpoint:
+    """Append-only record of the files a bulk ingest has imported.
+
+    Each line holds the path, size and modification time of one imported
+    file, or marks a file as removed. A file is only skipped while all
+    three still match. The file is compacted on open once superseded lines
+    outnumber the live entries.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._entries: Dict[str, List[int]] = {}
+        lines = 0
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        entry = json.loads(line)
+                        if entry.get("removed"):
+                            self._entries.pop(entry["path"], None)
+                        else:
+                            self._entries[entry["path"]] = [entry["size"], entry["mtime_ns"]]
+                    except (ValueError, KeyError):
+                        # A torn last line from a crash; the file is re-imported.
+                        continue
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if lines > 2 * len(self._entries) + 1000:
+            self._compact()
+        self._file = open(path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, file_path: str) -> bool:
+        return file_path in self._entries
+
+    def is_done(self, file_path: str) -> bool:
+        """Whether the file was imported and has not changed since."""
+        return self._entries.get(file_path) == self._signature(file_path)
+
+    def paths_under(self, directory: str) -> List[str]:
+        """Return the recorded files below a directory."""
+        prefix = os.path.join(directory, "")
+        return [path for path in self._entries if path.startswith(prefix)]
+
+    def mark_done(self, file_paths: Iterable[str]) -> None:
+        """Record imported files and flush them to disk."""
+        for file_path in file_paths:
+            signature = self._signature(file_path)
+            self._entries[file_path] = signature
+            self._file.write(
+                json.dumps({"path": file_path, "size": signature[0], "mtime_ns": signature[1]})
+                + "\n"
+            )
+        self._sync()
+
+    def mark_removed(self, file_paths: Iterable[str]) -> None:
+        """Forget removed files and flush the removal to disk."""
+        for file_path in file_paths:
+            self._entries.pop(file_path, None)
+            self._file.write(json.dumps({"path": file_path, "removed": True}) + "\n")
+        self._sync()
+
+    def close(self) -> None:
+        """Close the checkpoint file."""
+        self._file.close()
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _compact(self) -> None:
+        """Rewrite the checkpoint with one line per live entry."""
+        temp_path = self._path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for file_path, (size, mtime_ns) in self._entries.items():
+                f.write(json.dumps({"path": file_path, "size": size, "mtime_ns": mtime_ns}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self._path)
+
+    @staticmethod
+    def _signature(file_path: str) -> List[int]:
+        stat = os.stat(file_path)
+        return [stat.st_size, stat.st_mtime_ns]
+
+
+def iter_files(targets: Sequence[str], extensions: Sequence[str]) -> Iterator[str]:
+    """Lazily yield the supported files under the given targets.
+
+    Args:
+        targets (Sequence[str]): Directories (walked recursively), files or
+            glob patterns (``**`` matches nested directories).
+        extensions (Sequence[str]): Supported file extensions with dots.
+
+    Yields:
+        str: Absolute file paths, in a stable order within each target.
+    """
+    extensions = tuple(extension.lower() for extension in extensions)
+    for target in targets:
+        if os.path.isdir(target):
+            for root, dirs, files in os.walk(target):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(extensions):
+                        yield os.path.abspath(os.path.join(root, name))
+        elif os.path.isfile(target):
+            yield os.path.abspath(target)
+        else:
+            for path in glob.iglob(target, recursive=True):
+                if os.path.isfile(path) and path.lower().endswith(extensions):
+                    yield os.path.abspath(path)
+
+
+def _batched(paths: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Group paths into lists of at most ``size``."""
+    batch: List[str] = []
+    for path in paths:
+        batch.append(path)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:.1f}/s" if seconds > 0 else "-"
+
+
+def _build_import_use_case(
+    args: argparse.Namespace,
+    document_loader: DocumentLoader,
+) -> ImportFilesUseCase:
+    """Create the import use case shared by the subcommands."""
+    settings = Settings()
+    return ImportFilesUseCase(
+        document_loader=document_loader,
+        chunker=get_chunker(),
+        embedding_service=get_embedding_service(),
+        vector_store=get_vector_store(),
+        parent_store=get_parent_document_store(),
+        lexical_index=get_lexical_index(),
+        embedding_batch_size=settings.import_embedding_batch_size,
+        queue_size=settings.import_queue_size,
+        source_root=os.path.abspath(args.source_root),
+        dedup_threshold=(
+            settings.import_dedup_threshold if settings.import_dedup_enabled else None
+        ),
+    )
+
+
+def _import_batches(
+    import_use_case: ImportFilesUseCase,
+    checkpoint: _Checkpoint,
+    paths: Iterable[str],
+    batch_files: int,
+    total: ImportStats,
+) -> int:
+    """Import files in checkpointed batches and print throughput.
+
+    Returns:
+        int: The number of files that were imported.
+    """
+    files = chunks = embedded = 0
+    started = time.perf_counter()
+    for batch in _batched(paths, batch_files):
+        stats = import_use_case.invoke(batch, incremental=True, prune_missing=False)
+        checkpoint.mark_done(path for path in batch if path not in stats.errors)
+
+        files += len(batch)
+        chunks += stats.chunks_written + stats.chunks_unchanged
+        embedded += stats.chunks_written
+        total.files_failed += stats.files_failed
+        total.files_unchanged += stats.files_unchanged
+        total.chunks_written += stats.chunks_written
+        total.chunks_unchanged += stats.chunks_unchanged
+        total.chunks_deduplicated += stats.chunks_deduplicated
+        total.errors.update(stats.errors)
+        for path, error in stats.errors.items():
+            print(f"  failed: {path}: {error}", file=sys.stderr)
+
+        elapsed = time.perf_counter() - started
+        print(
+            f"files {files} ({_rate(files, elapsed)}) | "
+            f"chunks {chunks} ({_rate(chunks, elapsed)}) | "
+            f"embeddings {embedded} ({_rate(embedded, elapsed)}) | "
+            f"failed {total.files_failed}",
+            flush=True,
+        )
+    return files
+
+
+def _pending(
+    paths: Iterable[str],
+    checkpoint: _Checkpoint,
+    seen: Set[str] | None = None,
+) -> Iterator[str]:
+    """Yield the paths that are not checkpointed with their current size and mtime."""
+    for path in paths:
+        if seen is not None:
+            seen.add(path)
+        if not checkpoint.is_done(path):
+            yield path
+
+
+def ingest(args: argparse.Namespace) -> int:
+    """Run the ``ingest`` subcommand.
+
+    Returns:
+        int: The process exit code.
+    """
+    document_loader = get_document_loader()
+    import_use_case = _build_import_use_case(args, document_loader)
+    checkpoint = _Checkpoint(args.checkpoint)
+    if len(checkpoint):
+        print(f"Resuming from {args.checkpoint} ({len(checkpoint)} files already imported)")
+
+    total = ImportStats()
+    seen: Set[str] = set()
+    files = 0
+    paths = iter_files(args.paths, MultiFormatLoader.get_supported_extensions())
+    started = time.perf_counter()
+    try:
+        files = _import_batches(
+            import_use_case,
+            checkpoint,
+            _pending(paths, checkpoint, seen),
+            args.batch_files,
+            total,
+        )
+    except KeyboardInterrupt:
+        print(
+            "\nInterrupted. Run the same command again to resume.",
+            file=sys.stderr,
+        )
+        return 130
+    finally:
+        checkpoint.close()
+        document_loader.close()
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"Done in {elapsed:.1f}s: {files} files imported "
+        f"({total.files_unchanged} unchanged in store, {total.files_failed} failed), "
+        f"{len(seen) - files} skipped by checkpoint, {total.chunks_written} chunks embedded, "
+        f"{total.chunks_deduplicated} duplicate chunks stored once."
+    )
+    return 1 if total.files_failed else 0
+
+
+def _plan_changes(
+    changes: List[FileChange],
+    checkpoint: _Checkpoint,
+    extensions: Sequence[str],
+) -> Tuple[List[str], List[str]]:
+    """Turn a batch of file system changes into files to import and remove.
+
+    Added directories (e.g. moved into the tree) are walked, and deleted
+    directories remove every recorded file below them. A path that was
+    deleted and re-created within the batch, as editors do on save, is
+    imported rather than removed.
+
+    Returns:
+        Tuple[List[str], List[str]]: Files to import and files to remove.
+    """
+    extensions = tuple(extension.lower() for extension in extensions)
+    to_import: Dict[str, None] = {}
+    to_remove: Dict[str, None] = {}
+    for change in changes:
+        path = os.path.abspath(change.path)
+        if os.path.isdir(path):
+            for file_path in iter_files([path], extensions):
+                to_import[file_path] = None
+        elif os.path.isfile(path):
+            if path.lower().endswith(extensions):
+                to_import[path] = None
+        elif path in checkpoint:
+            to_remove[path] = None
+        elif change.change == "deleted":
+            for file_path in checkpoint.paths_under(path):
+                if not os.path.exists(file_path):
+                    to_remove[file_path] = None
+
+    return (
+        [path for path in to_import if not checkpoint.is_done(path)],
+        [path for path in to_remove if path not in to_import],
+    )
+
+
+def watch(args: argparse.Namespace) -> int:
+    """Run the ``watch`` subcommand.
+
+    Returns:
+        int: The process exit code.
+    """
+    directories = [os.path.abspath(directory) for directory in args.directories]
+    for directory in directories:
+        if not os.path.isdir(directory):
+            print(f"Not a directory: {directory}", file=sys.stderr)
+            return 2
+
+    extensions = MultiFormatLoader.get_supported_extensions()
+    document_loader = get_document_loader()
+    import_use_case = _build_import_use_case(args, document_loader)
+    file_watcher = get_file_watcher()
+    checkpoint = _Checkpoint(args.checkpoint)
+    total = ImportStats()
+    stop_event = threading.Event()
+    try:
+        # Catch up on changes made while nothing was watching.
+        seen: Set[str] = set()
+        files = _import_batches(
+            import_use_case,
+            checkpoint,
+            _pending(iter_files(directories, extensions), checkpoint, seen),
+            args.batch_files,
+            total,
+        )
+        removed = [
+            path
+            for directory in directories
+            for path in checkpoint.paths_under(directory)
+            if path not in seen
+        ]
+        if removed:
+            import_use_case.remove_files(removed)
+            checkpoint.mark_removed(removed)
+        print(
+            f"Synced {len(seen)} files ({files} imported, {len(removed)} removed). "
+            f"Watching {', '.join(directories)}...",
+            flush=True,
+        )
+
+        for changes in file_watcher.watch(directories, stop_event):
+            to_import, to_remove = _plan_changes(changes, checkpoint, extensions)
+            if to_remove:
+                import_use_case.remove_files(to_remove)
+                checkpoint.mark_removed(to_remove)
+                for path in to_remove:
+                    print(f"  removed: {path}")
+            if to_import:
+                _import_batches(import_use_case, checkpoint, to_import, args.batch_files, total)
+            if to_import or to_remove:
+                print(
+                    f"{time.strftime('%H:%M:%S')} synced {len(to_import)} changed and "
+                    f"{len(to_remove)} removed file(s)",
+                    flush=True,
+                )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_event.set()
+        checkpoint.close()
+        document_loader.close()
+
+    print("Stopped watching.", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the ``knowledge_chat`` command."""
+    parser = argparse.ArgumentParser(
+        prog="knowledge_chat",
+        description="Headless tools for the knowledge chatbot.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = subparsers.add_parser(
+        "ingest",
+        help="Import a directory tree, files or glob patterns into the knowledge base.",
+    )
+    ingest_parser.add_argument(
+        "paths",
+        nargs="+",
+        help="Directories (walked recursively), files or glob patterns.",
+    )
+    _add_import_arguments(ingest_parser)
+    ingest_parser.set_defaults(handler=ingest)
+
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Keep the knowledge base in sync with directories as files change.",
+    )
+    watch_parser.add_argument(
+        "directories",
+        nargs="+",
+        help="Directories to watch recursively.",
+    )
+    _add_import_arguments(watch_parser)
+    watch_parser.set_defaults(handler=watch)
+    return parser
+
+
+def _add_import_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options shared by ``ingest`` and ``watch``."""
+    parser.add_argument(
+        "--checkpoint",
+        default=_DEFAULT_CHECKPOINT,
+        help=f"Checkpoint file used to resume interrupted runs (default: {_DEFAULT_CHECKPOINT}).",
+    )
+    parser.add_argument(
+        "--source-root",
+        default=".",
+        help=(
+            "Sources are named by their path relative to this directory, so "
+            "equally named files in different folders stay distinct; files "
+            "outside it keep their file name (default: current directory)."
+        ),
+    )
+    parser.add_argument(
+        "--batch-files",
+        type=int,
+        default=50,
+        help="Files imported between checkpoints (default: 50).",
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point of the ``knowledge_chat`` command.
+
+    Args:
+        argv (Sequence[str] | None): Command-line arguments; defaults to
+            ``sys.argv[1:]``.
+
+    Returns:
+        int: The process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
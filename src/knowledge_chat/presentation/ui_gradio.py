@@ -8,7 +8,8 @@ This UI allows users to:
 
 Enhanced features:
 - Streaming responses (typewriter effect)
-- Progress bar for document import
+- Background document import with live progress
+- Share of chat turns answered without the rerank call
 - Multi-language support (English/Vietnamese)
 """
 
@@ -18,7 +19,8 @@ from typing import Generator, List
 import gradio as gr
 
 from knowledge_chat.application.chat_use_case import ChatUseCase
-from knowledge_chat.application.import_files_use_case import ImportFilesUseCase
+from knowledge_chat.application.import_job_manager import ImportJobManager
+from knowledge_chat.domain.entities.import_job import ImportJob
 from knowledge_chat.domain.entities.message import Message, MessageType
 
 
@@ -27,11 +29,11 @@ class KnowledgeChatUI:
 
     def __init__(
         self,
-        import_use_case: ImportFilesUseCase,
+        import_job_manager: ImportJobManager,
         chat_use_case: ChatUseCase,
     ) -> None:
-        """Initialize the UI with application use cases."""
-        self._import_use_case = import_use_case
+        """Initialize the UI with the import job queue and chat use case."""
+        self._import_job_manager = import_job_manager
         self._chat_use_case = chat_use_case
         self._messages: List[Message] = []
         self._uploaded_files: List[str] = []
@@ -98,14 +100,18 @@ class KnowledgeChatUI:
                 # =============================================================
                 with gr.TabItem("📁 Import Documents"):
                     gr.Markdown("### Step 1: Upload documents to build the knowledge base.")
-                    gr.Markdown("_Supported formats: TXT, PDF, Markdown (.md), JSON_")
+                    gr.Markdown("_Supported formats: TXT, PDF, Markdown (.md), JSON, JSON Lines (.jsonl)_")
                     gr.Markdown("_Supported languages: English, Vietnamese_")
 
                     file_input = gr.File(
-                        file_types=[".txt", ".pdf", ".md", ".markdown", ".json"],
+                        file_types=[".txt", ".pdf", ".md", ".markdown", ".json", ".jsonl"],
                         file_count="multiple",
                         label="Upload files (TXT, PDF, MD, JSON)",
                     )
+                    rebuild_input = gr.Checkbox(
+                        value=False,
+                        label="Rebuild from scratch (chat keeps using the current knowledge base until the rebuild finishes)",
+                    )
                     import_status = gr.Markdown("ℹ️ _Waiting for files..._")
                     import_progress = gr.Progress()
                     file_table = gr.DataFrame(
@@ -113,48 +119,41 @@ class KnowledgeChatUI:
                         label="Imported Documents",
                         interactive=False,
                     )
+                    job_state = gr.State(None)
+                    job_timer = gr.Timer(value=1.0, active=False)
 
-                    def import_files(files, progress=gr.Progress()):
-                        """Handle file upload and document import with progress bar."""
+                    def import_files(files, rebuild):
+                        """Queue the uploaded files as a background import job."""
                         if not files:
-                            return "⚠️ Please upload at least one file.", None
-                        
+                            return "⚠️ Please upload at least one file.", None, None, gr.Timer(active=False)
+
                         try:
                             paths = [f.name for f in files]
                             self._uploaded_files = [f.name.split("/")[-1].split("\\")[-1] for f in files]
-                            
-                            # Show progress for import process
-                            progress(0, desc="Starting import...")
-                            time.sleep(0.5)
-                            
-                            progress(0.2, desc="Loading documents...")
-                            time.sleep(0.3)
-                            
-                            progress(0.4, desc="Chunking text...")
-                            time.sleep(0.3)
-                            
-                            progress(0.6, desc="Generating embeddings...")
-                            self._import_use_case.invoke(paths)
-                            
-                            progress(0.9, desc="Storing in database...")
-                            time.sleep(0.3)
-                            
-                            progress(1.0, desc="Import completed!")
-                            
+                            job_id = self._import_job_manager.submit(paths, incremental=not rebuild)
                             table_data = [[name] for name in self._uploaded_files]
-                            return (
-                                f"✅ Successfully imported {len(paths)} file(s) into the vector store. | "
-                                f"Đã nhập thành công {len(paths)} file vào cơ sở kiến thức.",
-                                table_data,
-                            )
+                            status = self._format_job_status(self._import_job_manager.get(job_id))
+                            return status, table_data, job_id, gr.Timer(active=True)
                         # pylint: disable=broad-exception-caught
                         except Exception as e:
-                            return f"❌ Error while importing files: {str(e)}", None
+                            return f"❌ Error while importing files: {str(e)}", None, None, gr.Timer(active=False)
+
+                    def poll_job(job_id):
+                        """Show the status of the running import job."""
+                        job = self._import_job_manager.get(job_id) if job_id else None
+                        if job is None:
+                            return gr.update(), gr.Timer(active=False)
+                        return self._format_job_status(job), gr.Timer(active=not job.is_finished)
 
                     file_input.change(  # pylint: disable=no-member
                         fn=import_files,
-                        inputs=file_input,
-                        outputs=[import_status, file_table],
+                        inputs=[file_input, rebuild_input],
+                        outputs=[import_status, file_table, job_state, job_timer],
+                    )
+                    job_timer.tick(  # pylint: disable=no-member
+                        fn=poll_job,
+                        inputs=job_state,
+                        outputs=[import_status, job_timer],
                     )
 
                 # =============================================================
@@ -179,6 +178,7 @@ class KnowledgeChatUI:
                         )
                     send_button = gr.Button("🚀 Send", variant="primary")
                     clear_button = gr.Button("🧹 Clear Chat", variant="secondary")
+                    gate_status = gr.Markdown(self._format_gate_stats())
 
                     # ------------------ Chat Logic with Streaming ------------------
                     def chat_stream(user_message: str, history: List[List[str]]) -> Generator:
@@ -230,6 +230,10 @@ class KnowledgeChatUI:
                         fn=lambda: "",  # Clear input after sending
                         inputs=None,
                         outputs=user_input,
+                    ).then(
+                        fn=self._format_gate_stats,
+                        inputs=None,
+                        outputs=gate_status,
                     ).then(
                         fn=None,
                         inputs=None,
@@ -245,6 +249,10 @@ class KnowledgeChatUI:
                         fn=lambda: "",  # Clear input after sending
                         inputs=None,
                         outputs=user_input,
+                    ).then(
+                        fn=self._format_gate_stats,
+                        inputs=None,
+                        outputs=gate_status,
                     ).then(
                         fn=None,
                         inputs=None,
@@ -259,3 +267,69 @@ class KnowledgeChatUI:
                     )
 
         return demo
+
+    # -----------------------------------------------------
+    # Private helper methods
+    # -----------------------------------------------------
+
+    def _format_job_status(self, job: ImportJob) -> str:
+        """Render the status of an import job as Markdown."""
+        if job.status == "queued":
+            return "⏳ Import queued, waiting for the previous import to finish..."
+
+        event = job.progress
+        if job.status == "running":
+            if event is None or event.stage == "planning":
+                return "🔄 Checking for changed files..."
+            return (
+                f"🔄 Importing ({event.fraction:.0%}): loaded {event.files_loaded}/"
+                f"{event.files_total} file(s), embedded {event.chunks_embedded} and stored "
+                f"{event.chunks_written}/{event.chunks_produced} chunk(s). "
+                "Chat keeps answering from the current knowledge base."
+            )
+
+        if job.status == "failed":
+            return f"❌ Error while importing files: {job.error}"
+
+        stats = job.stats
+        imported = job.files - stats.files_failed
+        status = (
+            f"✅ Successfully imported {imported} file(s) into the vector store "
+            f"({stats.files_added} added, {stats.files_updated} updated, "
+            f"{stats.files_unchanged} unchanged, {stats.files_removed} removed). | "
+            f"Đã nhập thành công {imported} file vào cơ sở kiến thức."
+        )
+        if event is not None:
+            status += (
+                f"\n\n⏱️ {event.elapsed_seconds:.1f}s — "
+                f"{event.chunks_embedded} chunk(s) embedded, "
+                f"{event.chunks_written - event.chunks_embedded} reused "
+                f"(load {event.load_seconds:.1f}s, chunk {event.chunk_seconds:.1f}s, "
+                f"embed {event.embed_seconds:.1f}s, write {event.write_seconds:.1f}s)"
+            )
+        if stats.chunks_deduplicated:
+            status += (
+                f"\n\n♻️ {stats.chunks_deduplicated} duplicate chunk(s) "
+                f"({stats.chunks_near_duplicates} near-identical) were stored only once, "
+                f"saving as many embeddings and rows."
+            )
+        if stats.sources_invalidated:
+            status += (
+                f"\n\n⚠️ {len(stats.sources_invalidated)} file(s) shared text with removed files; "
+                "upload them again to restore it: " + ", ".join(stats.sources_invalidated)
+            )
+        if stats.files_failed:
+            failed = ", ".join(path.split("/")[-1].split("\\")[-1] for path in stats.errors)
+            status += f"\n\n⚠️ {stats.files_failed} file(s) could not be loaded: {failed}"
+        return status
+
+    def _format_gate_stats(self) -> str:
+        """Render how often the relevance gate skipped the rerank call as Markdown."""
+        stats = self._chat_use_case.relevance_gate_stats()
+        if stats is None or not stats.turns:
+            return ""
+        return (
+            f"_⚡ Rerank skipped on {stats.skip_rate:.0%} of {stats.turns} turn(s) "
+            f"({stats.accepted} accepted, {stats.rejected} rejected, "
+            f"{stats.reranked} reranked)._"
+        )